@@ -8,8 +8,12 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import collections
+import dataclasses
+import functools
 import logging
 import logging.handlers
+import queue
 import re
 import sys
 import time
@@ -18,9 +22,21 @@ from pathlib import Path
 import aiohttp
 import discord
 
+try:
+    # Optional: google-re2 scans in linear time (no backtracking) and is a
+    # drop-in replacement for the subset of ``re`` used by the log filter.
+    import re2 as _redact_re
+except ImportError:
+    _redact_re = re
+
 from src.audio_source import SpeakerAudio
-from src.config import Config, GoogleDriveConfig, GuildConfig, load
-from src.detector import DetectedRecording, RECORDING_URL_PATTERN, parse_recording_ended
+from src.config import Config, GuildConfig, load
+from src.detector import (
+    DetectedRecording,
+    RECORDING_URL_PATTERN,
+    parse_recording_ended,
+    recording_from_match,
+)
 from src.drive_watcher import DriveWatcher
 from src.errors import MinutesBotError
 from src.generator import MinutesGenerator
@@ -38,42 +54,71 @@ logger = logging.getLogger("minutes_bot")
 # ---------------------------------------------------------------------------
 
 # Patterns for sensitive data that must be masked in log output.
-_SENSITIVE_PATTERNS = re.compile(
-    r"(sk-ant-[a-zA-Z0-9_-]{20,})"         # Anthropic API keys
-    r"|((?:Bot\s+)?[A-Za-z0-9_-]{24,}\.[A-Za-z0-9_-]{6,7}\.[A-Za-z0-9_-]{27,})"  # Discord bot tokens
-    r"|(\?key=[a-zA-Z0-9]{6,})"             # Craig access keys in URLs
+# Kept as separate patterns (rather than one alternation) so that each is
+# only scanned when its cheap substring gate in _redact() passes.
+# Compiled with google-re2 when installed, falling back to ``re``.
+_ANTHROPIC_KEY_PATTERN = _redact_re.compile(r"sk-ant-[a-zA-Z0-9_-]{20,}")
+_CRAIG_KEY_PATTERN = _redact_re.compile(r"\?key=[a-zA-Z0-9]{6,}")
+_DISCORD_TOKEN_PATTERN = _redact_re.compile(
+    r"(?:Bot\s+)?[A-Za-z0-9_-]{24,}\.[A-Za-z0-9_-]{6,7}\.[A-Za-z0-9_-]{27,}"
 )
 
+# Shortest possible Discord token: 24 + "." + 6 + "." + 27 characters.
+_DISCORD_TOKEN_MIN_LEN = 59
+
 
 class _SensitiveMaskFilter(logging.Filter):
     """Logging filter that redacts sensitive tokens from log messages."""
 
     def filter(self, record: logging.LogRecord) -> bool:
+        # The same filter is attached to every handler, so a record reaches
+        # it once per handler.  Redaction mutates the record in place, which
+        # makes repeat passes pure overhead.
+        if getattr(record, "_sensitive_masked", False):
+            return True
+        record._sensitive_masked = True
         if isinstance(record.msg, str):
-            record.msg = _SENSITIVE_PATTERNS.sub(self._mask, record.msg)
+            record.msg = self._redact(record.msg)
         if record.args:
             if isinstance(record.args, dict):
                 record.args = {
-                    k: _SENSITIVE_PATTERNS.sub(self._mask, v) if isinstance(v, str) else v
+                    k: self._redact(v) if isinstance(v, str) else v
                     for k, v in record.args.items()
                 }
             elif isinstance(record.args, tuple):
                 record.args = tuple(
-                    _SENSITIVE_PATTERNS.sub(self._mask, a) if isinstance(a, str) else a
+                    self._redact(a) if isinstance(a, str) else a
                     for a in record.args
                 )
         return True
 
+    @classmethod
+    def _redact(cls, text: str) -> str:
+        """Mask sensitive tokens in *text*, skipping patterns that cannot match."""
+        if "sk-ant-" in text:
+            text = _ANTHROPIC_KEY_PATTERN.sub(cls._mask, text)
+        if "?key=" in text:
+            text = _CRAIG_KEY_PATTERN.sub("?key=***", text)
+        # Discord tokens have the form xxx.yyy.zzz with long segments.
+        if len(text) >= _DISCORD_TOKEN_MIN_LEN and text.count(".") >= 2:
+            text = _DISCORD_TOKEN_PATTERN.sub(cls._mask, text)
+        return text
+
     @staticmethod
     def _mask(match: re.Match) -> str:
-        val = match.group(0)
-        if val.startswith("?key="):
-            return "?key=***"
-        return val[:8] + "***"
+        """Keep the first 8 characters of a token; Craig keys are fully masked by _redact."""
+        return match.group(0)[:8] + "***"
+
 
+def setup_logging(
+    cfg: Config, level_override: str | None = None,
+) -> logging.handlers.QueueListener:
+    """Configure root logger to hand records to a background writer thread.
 
-def setup_logging(cfg: Config, level_override: str | None = None) -> None:
-    """Configure root logger with rotating file handler and stream handler."""
+    The root logger only gets a ``QueueHandler``; redaction, formatting and
+    file/console I/O (including rotation) run on the returned, already
+    started ``QueueListener``.  The caller must ``stop()`` it on shutdown.
+    """
     level_name = level_override or cfg.logging.level
     level = getattr(logging, level_name.upper(), logging.INFO)
 
@@ -85,6 +130,9 @@ def setup_logging(cfg: Config, level_override: str | None = None) -> None:
         style="{",
     )
 
+    # Attached per output handler rather than to a logger: logger-level
+    # filters do not run for records propagated from child loggers, and
+    # filtering on the listener side keeps regex work off the event loop.
     mask_filter = _SensitiveMaskFilter()
 
     # Rotating file handler
@@ -98,18 +146,34 @@ def setup_logging(cfg: Config, level_override: str | None = None) -> None:
     )
     file_handler.setFormatter(formatter)
     file_handler.addFilter(mask_filter)
-    root.addHandler(file_handler)
 
     # Console handler
     stream_handler = logging.StreamHandler(sys.stdout)
     stream_handler.setFormatter(formatter)
     stream_handler.addFilter(mask_filter)
-    root.addHandler(stream_handler)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True,
+    )
+    listener.start()
 
     # Silence noisy libraries
     logging.getLogger("discord").setLevel(logging.WARNING)
     logging.getLogger("aiohttp").setLevel(logging.WARNING)
 
+    return listener
+
+
+def _probe_gpu() -> bool:
+    """Return True if ctranslate2 can see at least one CUDA device."""
+    try:
+        import ctranslate2
+        return ctranslate2.get_cuda_device_count() > 0
+    except Exception:
+        return False
+
 
 # ---------------------------------------------------------------------------
 # Bot client
@@ -126,6 +190,7 @@ class MinutesBot(discord.Client):
         state_store: StateStore,
         archive: MinutesArchive | None = None,
         exporter: object | None = None,
+        log_listener: logging.handlers.QueueListener | None = None,
         **kwargs: object,
     ) -> None:
         self.cfg = cfg
@@ -134,9 +199,17 @@ class MinutesBot(discord.Client):
         self.state_store = state_store
         self.archive = archive
         self.exporter = exporter
+        self.log_listener = log_listener
         self.http_session: aiohttp.ClientSession | None = None
         self.drive_watchers: dict[int, list[DriveWatcher]] = {}
         self._start_time = time.monotonic()
+        self.gpu_available = False
+        # Caps concurrently running pipelines; per-channel locks keep
+        # recordings for the same channel in arrival order.
+        self._pipeline_sem = asyncio.Semaphore(cfg.pipeline.max_concurrent)
+        self._channel_locks: dict[int, asyncio.Lock] = {}
+        # Pipelines queued or running per channel; a lock is dropped at zero
+        self._channel_lock_users: collections.Counter[int] = collections.Counter()
         super().__init__(**kwargs)
         self.tree = discord.app_commands.CommandTree(self)
 
@@ -144,6 +217,7 @@ class MinutesBot(discord.Client):
         """Called once when the bot starts, before connecting to the gateway."""
         self.http_session = aiohttp.ClientSession()
         logger.debug("aiohttp.ClientSession created in setup_hook")
+        self.gpu_available = _probe_gpu()
 
     async def close(self) -> None:
         """Clean up resources on shutdown."""
@@ -152,10 +226,15 @@ class MinutesBot(discord.Client):
                 watcher.stop()
         if self.archive is not None:
             self.archive.close()
+        self.state_store.close()
         if self.http_session and not self.http_session.closed:
             await self.http_session.close()
             logger.debug("aiohttp.ClientSession closed")
         await super().close()
+        if self.log_listener is not None:
+            # Flushes queued records; must run last so shutdown logs are kept.
+            self.log_listener.stop()
+            self.log_listener = None
 
     async def on_ready(self) -> None:
         logger.info("Bot connected as %s (id=%d)", self.user, self.user.id)
@@ -297,12 +376,8 @@ class MinutesBot(discord.Client):
                     folder_id,
                 )
 
-        watcher_cfg = GoogleDriveConfig(
-            enabled=True,
-            credentials_path=global_drive.credentials_path,
-            folder_id=folder_id,
-            file_pattern=global_drive.file_pattern,
-            poll_interval_sec=global_drive.poll_interval_sec,
+        watcher_cfg = dataclasses.replace(
+            global_drive, enabled=True, folder_id=folder_id,
         )
 
         guild_obj = self.get_guild(gcfg.guild_id)
@@ -315,21 +390,22 @@ class MinutesBot(discord.Client):
         ) -> None:
             template_name = self.resolve_template(gcfg.guild_id)
             error_role = self.cfg.discord.resolve_error_role(gcfg.guild_id)
-            await run_pipeline_from_tracks(
-                tracks=tracks,
-                cfg=self.cfg,
-                transcriber=self.transcriber,
-                generator=self.generator,
-                output_channel=output_channel,
-                state_store=self.state_store,
-                source_label=source_label,
-                template_name=template_name,
-                archive=self.archive,
-                exporter=self.exporter,
-                error_mention_role_id=error_role,
-                guild_id=gcfg.guild_id,
-                guild_name=guild_name,
-            )
+            async with self._pipeline_sem:
+                await run_pipeline_from_tracks(
+                    tracks=tracks,
+                    cfg=self.cfg,
+                    transcriber=self.transcriber,
+                    generator=self.generator,
+                    output_channel=output_channel,
+                    state_store=self.state_store,
+                    source_label=source_label,
+                    template_name=template_name,
+                    archive=self.archive,
+                    exporter=self.exporter,
+                    error_mention_role_id=error_role,
+                    guild_id=gcfg.guild_id,
+                    guild_name=guild_name,
+                )
 
         watcher = DriveWatcher(
             cfg=watcher_cfg,
@@ -415,35 +491,50 @@ class MinutesBot(discord.Client):
         template_name = self.resolve_template(recording.guild_id)
         error_role = self.cfg.discord.resolve_error_role(recording.guild_id)
 
-        task = asyncio.create_task(
-            run_pipeline(
-                recording=recording,
-                session=self.http_session,
-                cfg=self.cfg,
-                transcriber=self.transcriber,
-                generator=self.generator,
-                output_channel=output_channel,
-                state_store=self.state_store,
-                template_name=template_name,
-                archive=self.archive,
-                exporter=self.exporter,
-                error_mention_role_id=error_role,
-            ),
-            name=f"pipeline-{rec_id}",
-        )
-
-        def _on_done(t: asyncio.Task, rid: str = rec_id) -> None:
-            if t.cancelled():
-                self.state_store.mark_failed(rid, "Pipeline cancelled")
-                logger.warning("Pipeline cancelled for rec_id=%s", rid)
-            elif (exc := t.exception()) is not None:
-                self.state_store.mark_failed(rid, str(exc))
-                logger.exception("Pipeline failed for rec_id=%s", rid, exc_info=exc)
-            else:
-                self.state_store.mark_success(rid)
-                logger.info("Pipeline completed successfully for rec_id=%s", rid)
+        channel_id = recording.channel_id
+        if channel_id not in self._channel_locks:
+            self._channel_locks[channel_id] = asyncio.Lock()
+        channel_lock = self._channel_locks[channel_id]
+        self._channel_lock_users[channel_id] += 1
+
+        async def _run() -> None:
+            async with channel_lock, self._pipeline_sem:
+                await run_pipeline(
+                    recording=recording,
+                    session=self.http_session,
+                    cfg=self.cfg,
+                    transcriber=self.transcriber,
+                    generator=self.generator,
+                    output_channel=output_channel,
+                    state_store=self.state_store,
+                    template_name=template_name,
+                    archive=self.archive,
+                    exporter=self.exporter,
+                    error_mention_role_id=error_role,
+                )
 
-        task.add_done_callback(_on_done)
+        task = asyncio.create_task(_run(), name=f"pipeline-{rec_id}")
+        task.add_done_callback(functools.partial(self._on_pipeline_done, rec_id))
+        task.add_done_callback(functools.partial(self._release_channel_lock, channel_id))
+
+    def _release_channel_lock(self, channel_id: int, task: asyncio.Task) -> None:
+        """Forget *channel_id*'s lock once no pipeline is queued or running on it."""
+        self._channel_lock_users[channel_id] -= 1
+        if self._channel_lock_users[channel_id] <= 0:
+            del self._channel_lock_users[channel_id]
+            del self._channel_locks[channel_id]
+
+    def _on_pipeline_done(self, rec_id: str, task: asyncio.Task) -> None:
+        """Record the outcome of the pipeline task for *rec_id*."""
+        if task.cancelled():
+            self.state_store.mark_failed(rec_id, "Pipeline cancelled")
+            logger.warning("Pipeline cancelled for rec_id=%s", rec_id)
+        elif (exc := task.exception()) is not None:
+            self.state_store.mark_failed(rec_id, str(exc))
+            logger.exception("Pipeline failed for rec_id=%s", rec_id, exc_info=exc)
+        else:
+            self.state_store.mark_success(rec_id)
+            logger.info("Pipeline completed successfully for rec_id=%s", rec_id)
 
 
 # ---------------------------------------------------------------------------
@@ -461,12 +552,6 @@ def register_commands(client: MinutesBot, tree: discord.app_commands.CommandTree
         hours, remainder = divmod(int(uptime_sec), 3600)
         minutes, seconds = divmod(remainder, 60)
 
-        try:
-            import ctranslate2
-            gpu_available = ctranslate2.get_cuda_device_count() > 0
-        except Exception:
-            gpu_available = False
-
         guild_cfg = client.cfg.discord.get_guild(interaction.guild_id or 0)
 
         backend = getattr(client.transcriber, 'backend_name', 'local')
@@ -475,7 +560,7 @@ def register_commands(client: MinutesBot, tree: discord.app_commands.CommandTree
         lines = [
             f"**Uptime**: {hours}h {minutes}m {seconds}s",
             f"**Whisper backend**: {backend} ({model}, {'loaded' if client.transcriber.is_loaded else 'not loaded'})",
-            f"**GPU**: {'available' if gpu_available else 'not available'}",
+            f"**GPU**: {'available' if client.gpu_available else 'not available'}",
             f"**Generator**: {client.cfg.generator.model} ({'ready' if client.generator.is_loaded else 'not ready'})",
         ]
         lines.append(f"**Template**: {client.resolve_template(interaction.guild_id or 0)}")
@@ -498,20 +583,13 @@ def register_commands(client: MinutesBot, tree: discord.app_commands.CommandTree
             )
             return
 
-        domain = match.group("domain")
-        rec_id = match.group("rec_id")
-        key = match.group("key")
-        rec_url = f"https://{domain}/rec/{rec_id}?key={key}"
-
-        recording = DetectedRecording(
-            rec_id=rec_id,
-            access_key=key,
-            rec_url=rec_url,
-            guild_id=interaction.guild_id or 0,
+        recording = recording_from_match(
+            match,
             channel_id=interaction.channel_id,
+            guild_id=interaction.guild_id or 0,
             message_id=0,
-            craig_domain=domain,
         )
+        rec_id = recording.rec_id
 
         guild_cfg = client.cfg.discord.get_guild(interaction.guild_id or 0)
         output_channel = client._get_output_channel_for_guild(guild_cfg)
@@ -794,7 +872,7 @@ def main() -> None:
     cfg = load(config_path=args.config)
 
     # Setup logging
-    setup_logging(cfg, level_override=args.log_level)
+    log_listener = setup_logging(cfg, level_override=args.log_level)
 
     logger.info("Starting Discord Minutes Bot")
 
@@ -840,6 +918,7 @@ def main() -> None:
         state_store=state_store,
         archive=archive,
         exporter=exporter,
+        log_listener=log_listener,
         intents=intents,
     )
 
@@ -4,11 +4,15 @@ from __future__ import annotations
 
 import io
 import logging
+import os
 import re
+import shutil
 import zipfile
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path, PurePosixPath
+from typing import BinaryIO
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +21,14 @@ ZIP_FILENAME_PATTERN = re.compile(
     r"^(\d+)-(.+)\.(aac|flac|ogg|mp3|wav)$"
 )
 
+# Chunk size for streaming ZIP members to disk (1 MiB).
+_COPY_CHUNK_SIZE = 1 << 20
+
+# Tracks are inflated in parallel (zlib releases the GIL) above this count;
+# for one or two tracks the thread startup is not worth it.
+_PARALLEL_MIN_TRACKS = 3
+_MAX_EXTRACT_WORKERS = 8
+
 
 @dataclass(frozen=True)
 class SpeakerInfo:
@@ -41,19 +53,67 @@ class AudioSource(ABC):
         ...
 
 
-def extract_speaker_zip(zip_bytes: bytes, dest_dir: Path) -> list[SpeakerAudio]:
+def _preallocate(fh: BinaryIO, size: int) -> None:
+    """Reserve *size* bytes for *fh* so the track is written contiguously.
+
+    Best effort: skipped where ``posix_fallocate`` is unavailable or fails.
+    """
+    if size <= 0 or not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(fh.fileno(), 0, size)
+    except OSError:
+        pass
+
+
+def _copy_member(zf: zipfile.ZipFile, info: zipfile.ZipInfo, dest_file: Path) -> None:
+    """Stream one ZIP member to *dest_file* in fixed-size chunks."""
+    with zf.open(info) as src, open(dest_file, "wb") as dst:
+        _preallocate(dst, info.file_size)
+        shutil.copyfileobj(src, dst, length=_COPY_CHUNK_SIZE)
+    logger.debug("Extracted %s -> %s", info.filename, dest_file)
+
+
+def extract_speaker_zip(
+    zip_source: bytes | Path | BinaryIO,
+    dest_dir: Path,
+) -> list[SpeakerAudio]:
     """Extract per-speaker audio files from a Craig ZIP archive.
 
+    *zip_source* may be the archive bytes, a path to the archive on disk, or
+    a seekable binary file object.  Members are streamed to *dest_dir* in
+    fixed-size chunks, so no audio track is held in memory in full.  For
+    bytes and paths, larger archives are extracted by several threads, each
+    reading through its own ``ZipFile`` handle.
+
     Parses ZIP entry filenames matching ``{track}-{username}.{ext}``.
     Includes Zip Slip protection to prevent path traversal attacks.
 
     Raises ``zipfile.BadZipFile`` on invalid ZIP data.
     """
+    archive = zip_source  # reopened by each worker when bytes or a path
+    if isinstance(zip_source, (bytes, bytearray, memoryview)):
+        zip_source = io.BytesIO(zip_source)
+
     results: list[SpeakerAudio] = []
+    members: list[tuple[zipfile.ZipInfo, Path]] = []
 
-    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zf:
-        for name in zf.namelist():
+    with zipfile.ZipFile(zip_source) as zf:
+        for info in zf.infolist():
+            if info.is_dir():
+                continue
+            name = info.filename
+            # Zip Slip protection: only the final path component is used as
+            # the destination name, so "/" can never reach dest_dir.  Reject
+            # backslashes too (separator in Windows-created archives).  A
+            # pattern-matched name ends in an audio extension, so it cannot
+            # be "." or "..", and the result always stays inside dest_dir
+            # without resolving paths on disk.
             basename = PurePosixPath(name).name
+            if "\\" in basename:
+                logger.warning("Blocked Zip Slip attempt: %s", name)
+                continue
+
             match = ZIP_FILENAME_PATTERN.match(basename)
             if not match:
                 logger.debug("Skipping non-audio ZIP entry: %s", name)
@@ -63,10 +123,6 @@ def extract_speaker_zip(zip_bytes: bytes, dest_dir: Path) -> list[SpeakerAudio]:
             username = match.group(2)
 
             dest_file = dest_dir / basename
-            # Zip Slip protection: ensure extracted path stays inside dest_dir
-            if not dest_file.resolve().is_relative_to(dest_dir.resolve()):
-                logger.warning("Blocked Zip Slip attempt: %s", name)
-                continue
 
             speaker = SpeakerInfo(
                 track=track_num,
@@ -74,9 +130,28 @@ def extract_speaker_zip(zip_bytes: bytes, dest_dir: Path) -> list[SpeakerAudio]:
                 user_id=0,
             )
 
-            dest_file.write_bytes(zf.read(name))
-            logger.debug("Extracted %s -> %s", name, dest_file)
-
+            members.append((info, dest_file))
             results.append(SpeakerAudio(speaker=speaker, file_path=dest_file))
 
+        # Parallel writers need distinct destinations; a repeated basename
+        # keeps the serial order so the last entry wins as before.
+        parallel = (
+            isinstance(archive, (bytes, Path))
+            and len(members) >= _PARALLEL_MIN_TRACKS
+            and len({dest for _, dest in members}) == len(members)
+        )
+        if not parallel:
+            for info, dest_file in members:
+                _copy_member(zf, info, dest_file)
+
+    if parallel:
+        def _extract_one(member: tuple[zipfile.ZipInfo, Path]) -> None:
+            handle = io.BytesIO(archive) if isinstance(archive, bytes) else archive
+            with zipfile.ZipFile(handle) as own_zf:
+                _copy_member(own_zf, *member)
+
+        workers = min(_MAX_EXTRACT_WORKERS, os.cpu_count() or 1, len(members))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="unzip") as pool:
+            list(pool.map(_extract_one, members))
+
     return results
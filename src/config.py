@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
+import dataclasses
+import functools
 import logging
 import os
+import types
 from dataclasses import dataclass, fields
 from pathlib import Path
+from typing import Callable
 
 import yaml
 from dotenv import load_dotenv
 
 from src.errors import ConfigError
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
 VALID_WHISPER_MODELS = frozenset({
@@ -109,6 +118,10 @@ class WhisperConfig:
     compute_type: str = "float16"
     beam_size: int = 5
     vad_filter: bool = True
+    max_parallel_tracks: int = 2
+    batch_size: int = 1
+    model_cache_dir: str = ""
+    cpu_threads: int = 0
     backend: str = "local"
     api_model: str = "whisper-1"
     api_max_retries: int = 2
@@ -147,6 +160,7 @@ class PosterConfig:
 class PipelineConfig:
     processing_timeout_sec: int = 3600
     state_dir: str = "state"
+    max_concurrent: int = 2
 
 
 @dataclass(frozen=True)
@@ -164,6 +178,8 @@ class GoogleDriveConfig:
     folder_id: str = ""
     file_pattern: str = "craig[_-]*.aac.zip"
     poll_interval_sec: int = 30
+    max_concurrent_downloads: int = 4
+    download_chunk_bytes: int = 32 * 1024 * 1024
 
 
 @dataclass(frozen=True)
@@ -244,16 +260,26 @@ _SECTION_CLASSES: dict[str, type] = {
 }
 
 
+def _coerce_bool(value: str) -> bool:
+    return value.lower() in ("1", "true", "yes")
+
+
+def _coerce_int(value: str) -> int:
+    # int(value, 0) auto-detects base from prefix: 0x=hex, 0o=octal, 0b=binary
+    return int(value, 0)
+
+
+_COERCERS: dict[type, Callable[[str], object]] = {
+    bool: _coerce_bool,
+    int: _coerce_int,
+    float: float,
+    str: str,
+}
+
+
 def _coerce(value: str, target_type: type) -> object:
     """Coerce a string env-var value to the target field type."""
-    if target_type is bool:
-        return value.lower() in ("1", "true", "yes")
-    if target_type is int:
-        # int(value, 0) auto-detects base from prefix: 0x=hex, 0o=octal, 0b=binary
-        return int(value, 0)
-    if target_type is float:
-        return float(value)
-    return value
+    return _COERCERS.get(target_type, str)(value)
 
 
 # Mapping from annotation string to Python type for coercion.
@@ -274,49 +300,61 @@ def _resolve_field_type(annotation: str | type) -> type:
     stored as strings at runtime. This function handles both string and
     live-type annotations.
     """
-    if isinstance(annotation, str):
+    if type(annotation) is str:
         return _TYPE_MAP.get(annotation, str)
 
     # Live type (without __future__ annotations)
-    import types as _types
-    if isinstance(annotation, _types.UnionType):
+    if isinstance(annotation, types.UnionType):
         args = [a for a in annotation.__args__ if a is not type(None)]
         return args[0] if args else str
     return annotation  # type: ignore[return-value]
 
 
+# Per-section field specs resolved once at import time:
+# section name -> ((field_name, env_key, coercion_type), ...)
+_SECTION_SPEC: dict[str, tuple[tuple[str, str, type], ...]] = {
+    section_name: tuple(
+        (f.name, f"{section_name}_{f.name}".upper(), _resolve_field_type(f.type))
+        for f in fields(cls)
+    )
+    for section_name, cls in _SECTION_CLASSES.items()
+}
+
+
 def _build_section(
     section_name: str,
     cls: type,
     yaml_values: dict,
+    env: dict[str, str],
 ) -> object:
     """Build a config dataclass from YAML values + env-var overrides.
 
     Env-var naming convention: ``SECTION_FIELD`` (uppercased).
     Example: ``WHISPER_MODEL=large-v2`` overrides whisper.model.
+    *env* is a snapshot of ``os.environ`` taken once per ``load()``.
     """
     kwargs: dict[str, object] = {}
-    for f in fields(cls):
-        env_key = f"{section_name}_{f.name}".upper()
-        env_val = os.environ.get(env_key)
+    for name, env_key, target in _SECTION_SPEC[section_name]:
+        env_val = env.get(env_key)
 
         if env_val is not None:
-            target = _resolve_field_type(f.type)
-            kwargs[f.name] = _coerce(env_val, target)
-        elif f.name in yaml_values:
-            value = yaml_values[f.name]
+            kwargs[name] = _coerce(env_val, target)
+        elif name in yaml_values:
+            value = yaml_values[name]
             # YAML lists → frozen dataclass tuples
             if isinstance(value, list):
                 value = tuple(value)
-            kwargs[f.name] = value
+            kwargs[name] = value
         # else: rely on dataclass default
 
     return cls(**kwargs)
 
 
-def _build_discord_section(yaml_section: dict) -> DiscordConfig:
+def _build_discord_section(yaml_section: dict, token: str) -> DiscordConfig:
     """Build DiscordConfig from YAML, supporting both old and new formats.
 
+    *token* comes from the environment; the bot token is never read from YAML.
+
     Old format (single guild)::
 
         discord:
@@ -394,7 +432,7 @@ def _build_discord_section(yaml_section: dict) -> DiscordConfig:
         guilds = ()
 
     return DiscordConfig(
-        token=yaml_section.get("token", ""),
+        token=token,
         guilds=guilds,
         error_mention_role_id=error_mention_role_id,
     )
@@ -404,7 +442,7 @@ def _build_discord_section(yaml_section: dict) -> DiscordConfig:
 # Validation
 # ---------------------------------------------------------------------------
 
-def _validate(cfg: Config) -> None:
+def _validate(cfg: Config, env: dict[str, str]) -> None:
     """Raise ConfigError for any invalid configuration values."""
     errors: list[str] = []
 
@@ -430,6 +468,15 @@ def _validate(cfg: Config) -> None:
     # Whisper
     if cfg.whisper.beam_size < 1:
         errors.append("whisper.beam_size must be >= 1")
+    if cfg.whisper.max_parallel_tracks < 1:
+        errors.append("whisper.max_parallel_tracks must be >= 1")
+    if cfg.whisper.batch_size < 1:
+        errors.append("whisper.batch_size must be >= 1")
+    elif cfg.whisper.batch_size > 1 and not cfg.whisper.vad_filter and cfg.whisper.backend == "local":
+        # The batched pipeline needs VAD clip timestamps for audio over 30s
+        errors.append("whisper.batch_size > 1 requires whisper.vad_filter")
+    if cfg.whisper.cpu_threads < 0:
+        errors.append("whisper.cpu_threads must be >= 0")
     if cfg.whisper.language not in VALID_WHISPER_LANGUAGES:
         errors.append(
             f"whisper.language '{cfg.whisper.language}' is not valid. "
@@ -462,6 +509,8 @@ def _validate(cfg: Config) -> None:
     # Pipeline
     if cfg.pipeline.processing_timeout_sec < 1:
         errors.append("pipeline.processing_timeout_sec must be >= 1")
+    if cfg.pipeline.max_concurrent < 1:
+        errors.append("pipeline.max_concurrent must be >= 1")
 
     # Poster
     if cfg.poster.max_embed_length < 1:
@@ -473,7 +522,7 @@ def _validate(cfg: Config) -> None:
     if cfg.whisper.backend not in ("local", "api"):
         errors.append("whisper.backend must be 'local' or 'api'")
     if cfg.whisper.backend == "api":
-        if not os.environ.get("OPENAI_API_KEY", ""):
+        if not env.get("OPENAI_API_KEY", ""):
             errors.append("OPENAI_API_KEY is required when whisper.backend is 'api'")
         if cfg.whisper.api_timeout_sec < 10:
             errors.append("whisper.api_timeout_sec must be >= 10")
@@ -490,6 +539,11 @@ def _validate(cfg: Config) -> None:
             errors.append("google_drive.folder_id is required when google_drive.enabled is true")
         if cfg.google_drive.poll_interval_sec < 5:
             errors.append("google_drive.poll_interval_sec must be >= 5")
+    # Also used by per-guild watchers when the global watcher is disabled
+    if cfg.google_drive.max_concurrent_downloads < 1:
+        errors.append("google_drive.max_concurrent_downloads must be >= 1")
+    if cfg.google_drive.download_chunk_bytes < 256 * 1024:
+        errors.append("google_drive.download_chunk_bytes must be >= 262144")
 
     # Export Google Docs (only validate when enabled)
     if cfg.export_google_docs.enabled:
@@ -540,6 +594,15 @@ def _validate(cfg: Config) -> None:
 # Public API
 # ---------------------------------------------------------------------------
 
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    """Return ``(mtime_ns, size)`` for *path*, or None if it does not exist."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 def load(config_path: str = "config.yaml", env_path: str = ".env") -> Config:
     """Load and validate configuration from *config_path* and *.env*.
 
@@ -547,12 +610,39 @@ def load(config_path: str = "config.yaml", env_path: str = ".env") -> Config:
       1. Environment variables  (``SECTION_FIELD``)
       2. YAML file values
       3. Dataclass defaults
+
+    Results are memoized per process; a changed YAML/.env file or process
+    environment yields a fresh load.  Call ``clear_load_cache()`` to reset.
     """
-    # 1. Load .env (does NOT override existing env vars by default)
+    # 1. Load .env (does NOT override existing env vars by default).  This
+    # happens before the cache lookup so the environment key includes it.
     env_file = Path(env_path)
-    if env_file.exists():
+    env_stamp = _file_stamp(env_file)
+    if env_stamp is not None:
         load_dotenv(env_file)
         logger.debug("Loaded .env from %s", env_file.resolve())
+    return _load_cached(
+        config_path,
+        _file_stamp(Path(config_path)),
+        env_stamp,
+        frozenset(os.environ.items()),
+    )
+
+
+def clear_load_cache() -> None:
+    """Forget all memoized ``load()`` results."""
+    _load_cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=8)
+def _load_cached(
+    config_path: str,
+    config_stamp: tuple[int, int] | None,
+    env_stamp: tuple[int, int] | None,
+    environ: frozenset[tuple[str, str]],
+) -> Config:
+    """Perform the actual load for ``load()``; the stamps only key the cache."""
+    env = dict(environ)
 
     # 2. Read YAML
     yaml_path = Path(config_path)
@@ -560,7 +650,9 @@ def load(config_path: str = "config.yaml", env_path: str = ".env") -> Config:
         raise ConfigError(f"Config file not found: {yaml_path.resolve()}")
 
     with open(yaml_path, encoding="utf-8") as fh:
-        raw: dict = yaml.safe_load(fh) or {}
+        raw = yaml.load(fh, Loader=_YamlLoader) or {}
+    if not isinstance(raw, dict):
+        raise ConfigError(f"Config must be a mapping, got {type(raw).__name__}")
 
     # 3. Build each section (except discord, which needs custom handling)
     sections: dict[str, object] = {}
@@ -568,35 +660,24 @@ def load(config_path: str = "config.yaml", env_path: str = ".env") -> Config:
         yaml_section = raw.get(section_name, {}) or {}
         if not isinstance(yaml_section, dict):
             raise ConfigError(f"Config section '{section_name}' must be a mapping, got {type(yaml_section).__name__}")
-        sections[section_name] = _build_section(section_name, cls, yaml_section)
-
-    # 3b. Build discord section with multi-guild support + backward compat
-    sections["discord"] = _build_discord_section(raw.get("discord", {}) or {})
+        sections[section_name] = _build_section(section_name, cls, yaml_section, env)
 
-    # 4. Inject secrets that use non-standard env-var names
+    # 3b. Build discord section with multi-guild support + backward compat.
     # Token: DISCORD_BOT_TOKEN takes precedence, fallback to DISCORD_TOKEN
-    token = os.environ.get("DISCORD_BOT_TOKEN") or os.environ.get("DISCORD_TOKEN") or ""
-    dc: DiscordConfig = sections["discord"]  # type: ignore[assignment]
-    sections["discord"] = DiscordConfig(
-        token=token,
-        guilds=dc.guilds,
-        error_mention_role_id=dc.error_mention_role_id,
-    )
+    token = env.get("DISCORD_BOT_TOKEN") or env.get("DISCORD_TOKEN") or ""
+    sections["discord"] = _build_discord_section(raw.get("discord", {}) or {}, token)
 
+    # 4. Inject secrets that use non-standard env-var names
     # API key: ANTHROPIC_API_KEY
-    api_key = os.environ.get("ANTHROPIC_API_KEY") or ""
+    api_key = env.get("ANTHROPIC_API_KEY") or ""
     if api_key:
-        gen_section: dict = {}
-        for f in fields(GeneratorConfig):
-            gen_section[f.name] = getattr(sections["generator"], f.name)
-        gen_section["api_key"] = api_key
-        sections["generator"] = GeneratorConfig(**gen_section)
+        sections["generator"] = dataclasses.replace(sections["generator"], api_key=api_key)
 
     # 5. Assemble top-level Config
     cfg = Config(**sections)  # type: ignore[arg-type]
 
     # 6. Validate
-    _validate(cfg)
+    _validate(cfg, env)
 
     logger.info("Configuration loaded successfully from %s", yaml_path.resolve())
     return cfg
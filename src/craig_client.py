@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
 import zipfile
 from pathlib import Path
 
@@ -22,8 +23,17 @@ from src.errors import AudioAcquisitionError, CookTimeoutError
 
 logger = logging.getLogger(__name__)
 
-# Polling interval for job readiness checks (seconds)
-_JOB_POLL_INTERVAL = 2
+# Job readiness polling: start at _JOB_POLL_INTERVAL seconds and grow by
+# _JOB_POLL_BACKOFF per poll up to _JOB_POLL_MAX_INTERVAL, plus up to 25% jitter
+_JOB_POLL_INTERVAL = 2.0
+_JOB_POLL_BACKOFF = 1.5
+_JOB_POLL_MAX_INTERVAL = 15.0
+
+# Timeout for the job start/poll API calls
+_API_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+# Read size when streaming the cooked ZIP to disk
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
 
 
 class CraigClient(AudioSource):
@@ -45,6 +55,7 @@ class CraigClient(AudioSource):
         self._recording = recording
         self._cfg = cfg
         self._base_url = f"https://{recording.craig_domain}"
+        self._download_timeout = aiohttp.ClientTimeout(total=cfg.download_timeout_sec)
 
     # ------------------------------------------------------------------
     # AudioSource interface
@@ -83,13 +94,17 @@ class CraigClient(AudioSource):
         # Step 2: Poll until job completes -> returns outputFileName
         output_filename = await self._poll_until_complete(job_url)
 
-        # Step 3: Download the cooked ZIP file
+        # Step 3: Download the cooked ZIP file straight to disk
         dl_url = f"{self._base_url}/dl/{output_filename}"
         logger.info("Downloading cooked file from %s", dl_url)
-        zip_bytes = await self._download_bytes(dl_url)
+        zip_path = dest_dir / f"craig-{self._recording.rec_id}.zip"
+        try:
+            await self._download_to_file(dl_url, zip_path)
 
-        # Step 4: Extract ZIP
-        results = self._extract_zip(zip_bytes, dest_dir)
+            # Step 4: Extract ZIP
+            results = await asyncio.to_thread(self._extract_zip, zip_path, dest_dir)
+        finally:
+            zip_path.unlink(missing_ok=True)
 
         if not results:
             raise AudioAcquisitionError(
@@ -128,9 +143,8 @@ class CraigClient(AudioSource):
             self._cfg.cook_container,
         )
         try:
-            timeout = aiohttp.ClientTimeout(total=30)
             async with self._session.post(
-                job_url, json=payload, timeout=timeout,
+                job_url, json=payload, timeout=_API_TIMEOUT,
             ) as resp:
                 if resp.status in (200, 201):
                     logger.info("Cook job started (HTTP %d)", resp.status)
@@ -169,11 +183,18 @@ class CraigClient(AudioSource):
             self._cfg.poll_timeout_sec,
         )
 
+        interval = _JOB_POLL_INTERVAL
+        job_seen = False
+
         while loop.time() < deadline:
             try:
-                timeout = aiohttp.ClientTimeout(total=30)
-                async with self._session.get(job_url, timeout=timeout) as resp:
+                async with self._session.get(job_url, timeout=_API_TIMEOUT) as resp:
                     if resp.status == 200:
+                        if not job_seen:
+                            # Job is now visible: restart backoff from the
+                            # short interval so fast cooks finish quickly.
+                            job_seen = True
+                            interval = _JOB_POLL_INTERVAL
                         data = await resp.json(content_type=None)
                         job = data.get("job") or {}
 
@@ -208,25 +229,36 @@ class CraigClient(AudioSource):
             except (asyncio.TimeoutError, aiohttp.ClientError) as exc:
                 logger.warning("Job poll error: %s", exc)
 
-            await asyncio.sleep(_JOB_POLL_INTERVAL)
+            delay = interval + random.uniform(0, 0.25 * interval)
+            await asyncio.sleep(max(0.0, min(delay, deadline - loop.time())))
+            interval = min(interval * _JOB_POLL_BACKOFF, _JOB_POLL_MAX_INTERVAL)
 
         raise CookTimeoutError(
             f"Job polling timed out after {self._cfg.poll_timeout_sec}s "
             f"for recording {self._recording.rec_id}"
         )
 
-    async def _download_bytes(self, url: str) -> bytes:
-        """Download raw bytes from a URL with retry logic."""
+    async def _download_to_file(self, url: str, dest: Path) -> None:
+        """Stream the body of *url* into *dest* with retry logic.
+
+        The response is written in fixed-size chunks so the cooked ZIP is
+        never held in memory; a failed attempt's partial file is overwritten
+        by the next one.
+        """
         last_exc: Exception | None = None
 
         for attempt in range(1, self._cfg.max_retries + 2):  # +2: 1 initial + max_retries
             try:
-                timeout = aiohttp.ClientTimeout(total=self._cfg.download_timeout_sec)
-                async with self._session.get(url, timeout=timeout) as resp:
+                async with self._session.get(url, timeout=self._download_timeout) as resp:
                     if resp.status == 200:
-                        data = await resp.read()
-                        logger.debug("Downloaded %d bytes from %s", len(data), url)
-                        return data
+                        size = 0
+                        with dest.open("wb") as fh:
+                            async for chunk in resp.content.iter_chunked(_DOWNLOAD_CHUNK_SIZE):
+                                # Off the loop so a slow disk does not stall the gateway.
+                                await asyncio.to_thread(fh.write, chunk)
+                                size += len(chunk)
+                        logger.debug("Downloaded %d bytes from %s", size, url)
+                        return
 
                     resp_text = await resp.text()
                     last_exc = AudioAcquisitionError(
@@ -257,12 +289,12 @@ class CraigClient(AudioSource):
         raise last_exc  # type: ignore[misc]
 
     @staticmethod
-    def _extract_zip(zip_bytes: bytes, dest_dir: Path) -> list[SpeakerAudio]:
+    def _extract_zip(zip_source: bytes | Path, dest_dir: Path) -> list[SpeakerAudio]:
         """Extract per-speaker audio files from a ZIP archive.
 
         Delegates to the shared ``extract_speaker_zip`` utility.
         """
         try:
-            return extract_speaker_zip(zip_bytes, dest_dir)
+            return extract_speaker_zip(zip_source, dest_dir)
         except zipfile.BadZipFile as exc:
             raise AudioAcquisitionError(f"Invalid ZIP response from Job API: {exc}") from exc
@@ -6,10 +6,10 @@ types so they can be tested with JSON fixtures without importing discord.
 
 from __future__ import annotations
 
-import json
 import logging
 import re
 from dataclasses import dataclass
+from typing import Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +18,8 @@ CRAIG_BOT_ID = "272937604339466240"
 RECORDING_URL_PATTERN = re.compile(
     r"https?://(?P<domain>craig\.\w+)/rec/(?P<rec_id>[a-zA-Z0-9]+)\?key=(?P<key>[a-zA-Z0-9]+)"
 )
+# Bound once so the per-message scan skips the attribute lookup
+_SEARCH = RECORDING_URL_PATTERN.search
 
 
 @dataclass(frozen=True)
@@ -43,18 +45,26 @@ def is_recording_ended(payload_data: dict) -> bool:
     """Return True if the components payload contains 'Recording ended'.
 
     Craig updates its recording panel message (Components V2) to include
-    ``Recording ended.`` when the recording stops.  We serialize the
-    components list to a JSON string and do a simple substring search
-    to sidestep discord.py Components V2 parsing issues.
+    ``Recording ended.`` when the recording stops.  We walk the raw
+    components tree and substring-search its strings to sidestep
+    discord.py Components V2 parsing issues.
     """
     components = payload_data.get("components")
     if not components:
         return False
-    try:
-        serialized = json.dumps(components)
-    except (TypeError, ValueError):
-        return False
-    return "Recording ended" in serialized
+    return any("Recording ended" in text for text in _iter_strings(components))
+
+
+def _iter_strings(obj: object) -> Iterator[str]:
+    """Yield every string value nested in *obj* (dicts and lists), depth first."""
+    if isinstance(obj, str):
+        yield obj
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            yield from _iter_strings(value)
+    elif isinstance(obj, list):
+        for value in obj:
+            yield from _iter_strings(value)
 
 
 def extract_recording_info(
@@ -65,29 +75,36 @@ def extract_recording_info(
 ) -> DetectedRecording | None:
     """Extract recording URL from the full payload and return DetectedRecording.
 
-    Searches the entire JSON-serialized payload for the Craig recording URL
+    Searches every string in the payload for the Craig recording URL
     pattern, which may appear in components, embeds, or content fields.
+    The strings are joined with newlines (which the pattern cannot span) and
+    scanned in a single regex call; the first match in payload order wins.
     """
-    try:
-        serialized = json.dumps(payload_data)
-    except (TypeError, ValueError):
-        logger.warning("Failed to serialize payload_data to JSON")
-        return None
+    match = _SEARCH("\n".join(_iter_strings(payload_data)))
+    if match:
+        return recording_from_match(match, channel_id, guild_id, message_id)
+
+    logger.debug("No recording URL found in payload")
+    return None
 
-    match = RECORDING_URL_PATTERN.search(serialized)
-    if not match:
-        logger.debug("No recording URL found in payload")
-        return None
 
-    domain = match.group("domain")
-    rec_id = match.group("rec_id")
-    key = match.group("key")
-    rec_url = f"https://{domain}/rec/{rec_id}?key={key}"
+def recording_from_match(
+    match: re.Match[str],
+    channel_id: int,
+    guild_id: int,
+    message_id: int,
+) -> DetectedRecording:
+    """Build a DetectedRecording from a ``RECORDING_URL_PATTERN`` match.
 
+    ``rec_url`` is rebuilt in canonical ``https://`` form from the captured
+    fields, whatever scheme the message used.
+    """
+    # One group() call fetches every field as a tuple
+    domain, rec_id, key = match.group("domain", "rec_id", "key")
     return DetectedRecording(
         rec_id=rec_id,
         access_key=key,
-        rec_url=rec_url,
+        rec_url=f"https://{domain}/rec/{rec_id}?key={key}",
         guild_id=guild_id,
         channel_id=channel_id,
         message_id=message_id,
@@ -113,10 +130,16 @@ def parse_recording_ended(
     if watch_channel_id and channel_id != watch_channel_id:
         return None
 
-    if not is_craig_message(payload_data):
+    # Checks 2 and 3 are inlined (same logic as is_craig_message and
+    # is_recording_ended): this runs for every edit in watched channels.
+    author = payload_data.get("author")
+    if not isinstance(author, dict) or author.get("id") != CRAIG_BOT_ID:
         return None
 
-    if not is_recording_ended(payload_data):
+    components = payload_data.get("components")
+    if not components or not any(
+        "Recording ended" in text for text in _iter_strings(components)
+    ):
         return None
 
     recording = extract_recording_info(payload_data, channel_id, guild_id, message_id)
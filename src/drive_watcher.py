@@ -10,11 +10,14 @@ Authentication uses a service-account JSON key with drive.readonly scope.
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import fnmatch
-import io
+import functools
 import logging
 import re
+import shutil
 import tempfile
+import threading
 import zipfile
 from pathlib import Path
 from typing import Any, Awaitable, Callable
@@ -29,6 +32,19 @@ logger = logging.getLogger(__name__)
 # Google Drive API scopes required for read-only access.
 _SCOPES = ["https://www.googleapis.com/auth/drive.readonly"]
 
+# Google Drive reports ZIP files as either of these depending on the uploader.
+_ZIP_MIME_TYPES = ("application/zip", "application/x-zip-compressed")
+
+# Fields requested from changes.list (only what _list_changes_sync reads).
+_CHANGES_FIELDS = (
+    "nextPageToken, newStartPageToken, "
+    "changes(removed, fileId, file(id, name, mimeType, createdTime, parents, trashed))"
+)
+_LIST_FIELDS = "nextPageToken, files(id, name, mimeType, createdTime)"
+
+# Maximum page size accepted by files.list and changes.list.
+_PAGE_SIZE = 1000
+
 # Type alias for the callback invoked when new tracks are found.
 OnNewTracksCallback = Callable[
     [list[SpeakerAudio], str, Path],
@@ -36,6 +52,55 @@ OnNewTracksCallback = Callable[
 ]
 
 
+# Glob of the form "<literal>*<literal>" (no ?, [ or further *).
+_FIXED_AFFIX_RE = re.compile(r"^([^*?\[]+)\*+([^*?\[]+)$")
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_name_matcher(file_pattern: str) -> Callable[[str], bool]:
+    """Return a predicate equivalent to matching *file_pattern* as a glob.
+
+    Memoized per pattern, so watchers sharing a pattern share one predicate.
+
+    Patterns with a fixed prefix and suffix around a single wildcard are
+    checked with ``startswith``/``endswith``; anything else uses the
+    compiled ``fnmatch`` regex.
+    """
+    m = _FIXED_AFFIX_RE.match(file_pattern)
+    if m is None:
+        regex = re.compile(fnmatch.translate(file_pattern))
+        return lambda name: regex.match(name) is not None
+
+    prefix, suffix = m.groups()
+    min_len = len(prefix) + len(suffix)
+    return lambda name: (
+        len(name) >= min_len and name.startswith(prefix) and name.endswith(suffix)
+    )
+
+
+def _build_list_query(folder_id: str, file_pattern: str) -> str:
+    """Build the files.list query for ZIPs in *folder_id* matching *file_pattern*.
+
+    For a pattern like "craig_*.aac.zip", we use:
+      name contains 'craig' and name contains '.aac.zip'
+    combined with parent folder and mimeType constraints.  The Drive
+    'contains' clauses are only a prefilter; callers still apply the
+    exact glob locally.
+    """
+    query_parts: list[str] = [
+        f"'{folder_id}' in parents",
+        "trashed = false",
+        "(" + " or ".join(f"mimeType = '{m}'" for m in _ZIP_MIME_TYPES) + ")",
+    ]
+
+    # Convert glob pattern to Drive API name-contains clauses.
+    # Split on wildcards and character classes, keep non-empty literal segments.
+    for segment in re.split(r"[*?]+|\[.*?\]", file_pattern):
+        if segment:
+            query_parts.append(f"name contains '{segment}'")
+
+    return " and ".join(query_parts)
+
 
 class DriveWatcher:
     """Monitors a Google Drive folder for new Craig recording ZIPs.
@@ -57,8 +122,29 @@ class DriveWatcher:
         self._cfg = cfg
         self._state_store = state_store
         self._on_new_tracks = on_new_tracks
+        self._creds_path = Path(cfg.credentials_path)
         self._task: asyncio.Task[None] | None = None
-        self._service: Any = None  # googleapiclient.discovery.Resource
+        # googleapiclient.discovery.Resource per executor thread: the
+        # underlying httplib2 transport is not thread-safe, and files are
+        # downloaded concurrently.
+        self._local = threading.local()
+        # The config is immutable, so the listing query and the name
+        # predicate used for local filtering are built once.
+        self._list_query = _build_list_query(cfg.folder_id, cfg.file_pattern)
+        self._name_matches = _compile_name_matcher(cfg.file_pattern)
+        # Drive changes token; None until the first full listing succeeds.
+        self._page_token: str | None = None
+        # Newest createdTime (RFC 3339) seen so far.  A full listing that
+        # replaces a failed changes query only asks for files no older than it.
+        # modifiedTime is not used: uploaders may preserve an older one.
+        self._seen_ctime: str | None = None
+        self._sem = asyncio.Semaphore(cfg.max_concurrent_downloads)
+        # Dedicated pool for Drive I/O so downloads do not queue behind
+        # other users of the loop's default executor.  Created on demand.
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+        # Parent of the per-file working directories.  Created on demand
+        # and removed by stop().
+        self._work_root: Path | None = None
 
     # ------------------------------------------------------------------
     # Public properties
@@ -99,6 +185,27 @@ class DriveWatcher:
             self._task.cancel()
             logger.info("DriveWatcher polling task cancelled")
         self._task = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._work_root is not None:
+            shutil.rmtree(self._work_root, ignore_errors=True)
+            self._work_root = None
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Return the watcher's I/O thread pool, creating it if needed."""
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self._cfg.max_concurrent_downloads,
+                thread_name_prefix="drive-io",
+            )
+        return self._executor
+
+    def _get_work_root(self) -> Path:
+        """Return the watcher's temp root, creating it if needed."""
+        if self._work_root is None:
+            self._work_root = Path(tempfile.mkdtemp(prefix="drive-watcher-"))
+        return self._work_root
 
     # ------------------------------------------------------------------
     # Google Drive API (synchronous — run in executor)
@@ -107,12 +214,14 @@ class DriveWatcher:
     def _build_service(self) -> Any:
         """Build and cache the Google Drive API v3 service client.
 
-        Returns the service object, or raises DriveWatchError on failure.
+        One client is cached per calling thread.  Returns the service
+        object, or raises DriveWatchError on failure.
         """
-        if self._service is not None:
-            return self._service
+        service = getattr(self._local, "service", None)
+        if service is not None:
+            return service
 
-        creds_path = Path(self._cfg.credentials_path)
+        creds_path = self._creds_path
         if not creds_path.exists():
             raise DriveWatchError(
                 f"Service-account credentials not found: {creds_path.resolve()}"
@@ -125,9 +234,16 @@ class DriveWatcher:
             credentials = Credentials.from_service_account_file(
                 str(creds_path), scopes=_SCOPES
             )
-            self._service = build("drive", "v3", credentials=credentials)
-            logger.info("Google Drive API service built successfully")
-            return self._service
+            # Each thread gets its own Resource (and httplib2 transport);
+            # skip the discovery file cache, which only logs a warning with
+            # oauth2client-free installs and costs a lookup per build.
+            service = build("drive", "v3", credentials=credentials, cache_discovery=False)
+            self._local.service = service
+            logger.info(
+                "Google Drive API service built for thread %s",
+                threading.current_thread().name,
+            )
+            return service
         except Exception as exc:
             raise DriveWatchError(
                 f"Failed to build Google Drive service: {exc}"
@@ -136,7 +252,13 @@ class DriveWatcher:
     def _list_files_sync(self) -> list[dict[str, str]]:
         """List files in the configured folder matching the file pattern.
 
-        Returns a list of dicts with keys: id, name, mimeType.
+        The first call lists the whole folder and records a Drive changes
+        start token; later calls only fetch changes made since the previous
+        call.  If the changes query fails (e.g. an expired token), the folder
+        is listed again, restricted to files created no earlier than the
+        newest one already seen.
+
+        Returns a list of dicts with keys: id, name, mimeType, createdTime.
         This is a synchronous call — must be run in an executor.
         """
         service = self._build_service()
@@ -144,28 +266,85 @@ class DriveWatcher:
         if not self._cfg.folder_id:
             raise DriveWatchError("google_drive.folder_id is not configured")
 
-        # Build the Drive API query.
-        # For a pattern like "craig_*.aac.zip", we use:
-        #   name contains 'craig' and name contains '.aac.zip'
-        # Combined with parent folder and mimeType constraints.
-        # Note: Google Drive reports ZIP files as either 'application/zip'
-        # or 'application/x-zip-compressed' depending on the uploader,
-        # so we accept both.
-        query_parts: list[str] = [
-            f"'{self._cfg.folder_id}' in parents",
-            "trashed = false",
-            "(mimeType = 'application/zip' or mimeType = 'application/x-zip-compressed')",
-        ]
-
-        # Convert glob pattern to Drive API name-contains clauses.
-        # Split on wildcards and character classes, keep non-empty literal segments.
-        pattern = self._cfg.file_pattern
-        literal_segments = re.split(r"[*?]+|\[.*?\]", pattern)
-        for segment in literal_segments:
-            if segment:
-                query_parts.append(f"name contains '{segment}'")
-
-        query = " and ".join(query_parts)
+        if self._page_token is not None:
+            try:
+                return self._list_changes_sync(service)
+            except Exception as exc:
+                logger.warning(
+                    "Drive changes query failed, falling back to full listing: %s", exc,
+                )
+                self._page_token = None
+
+        # Take the start token before listing so nothing uploaded during the
+        # listing is missed; a file seen by both is filtered by StateStore.
+        try:
+            start_token = service.changes().getStartPageToken().execute()["startPageToken"]
+        except Exception as exc:
+            logger.warning("Could not get Drive changes start token: %s", exc)
+            start_token = None
+
+        results = self._list_folder_sync(service, created_after=self._seen_ctime)
+        self._page_token = start_token
+        return results
+
+    def _note_ctime(self, f: dict[str, str]) -> None:
+        ctime = f.get("createdTime")
+        if ctime and (self._seen_ctime is None or ctime > self._seen_ctime):
+            self._seen_ctime = ctime
+
+    def _list_changes_sync(self, service: Any) -> list[dict[str, str]]:
+        """Return matching files added or modified since ``self._page_token``."""
+        found: dict[str, dict[str, str]] = {}
+        page_token = self._page_token
+
+        while True:
+            response = (
+                service.changes()
+                .list(
+                    pageToken=page_token,
+                    spaces="drive",
+                    fields=_CHANGES_FIELDS,
+                    pageSize=_PAGE_SIZE,
+                )
+                .execute()
+            )
+
+            for change in response.get("changes", []):
+                f = change.get("file")
+                if change.get("removed") or not f or f.get("trashed"):
+                    continue
+                if self._cfg.folder_id not in f.get("parents", ()):
+                    continue
+                if f.get("mimeType") not in _ZIP_MIME_TYPES:
+                    continue
+                self._note_ctime(f)
+                if self._name_matches(f["name"]):
+                    found[f["id"]] = {
+                        "id": f["id"], "name": f["name"], "mimeType": f["mimeType"],
+                        "createdTime": f.get("createdTime", ""),
+                    }
+
+            if "newStartPageToken" in response:
+                self._page_token = response["newStartPageToken"]
+                break
+            page_token = response["nextPageToken"]
+
+        logger.debug("Drive changes returned %d matching files", len(found))
+        return list(found.values())
+
+    def _list_folder_sync(
+        self, service: Any, created_after: str | None = None
+    ) -> list[dict[str, str]]:
+        """List files in the configured folder matching the file pattern.
+
+        With *created_after*, only files created at or after that RFC 3339
+        timestamp are requested.  The bound is inclusive so a file sharing
+        the newest timestamp is not skipped; already-processed IDs are
+        dropped by the usual dedup.
+        """
+        query = self._list_query
+        if created_after:
+            query += f" and createdTime >= '{created_after}'"
         logger.debug("Drive API query: %s", query)
 
         try:
@@ -178,18 +357,19 @@ class DriveWatcher:
                     .list(
                         q=query,
                         spaces="drive",
-                        fields="nextPageToken, files(id, name, mimeType)",
+                        fields=_LIST_FIELDS,
                         pageToken=page_token,
-                        pageSize=100,
+                        pageSize=_PAGE_SIZE,
                     )
                     .execute()
                 )
 
                 files = response.get("files", [])
-                # Apply local fnmatch filtering for exact glob match,
+                # Apply local glob filtering for exact match,
                 # since Drive API 'contains' is a substring check.
                 for f in files:
-                    if fnmatch.fnmatch(f["name"], self._cfg.file_pattern):
+                    self._note_ctime(f)
+                    if self._name_matches(f["name"]):
                         results.append(f)
 
                 page_token = response.get("nextPageToken")
@@ -204,34 +384,36 @@ class DriveWatcher:
                 f"Failed to list files in folder {self._cfg.folder_id}: {exc}"
             ) from exc
 
-    def _download_file_sync(self, file_id: str, file_name: str) -> bytes:
-        """Download a file's content by ID.
+    def _download_file_sync(self, file_id: str, file_name: str, dest_path: Path) -> Path:
+        """Download a file's content by ID into *dest_path*.
 
-        Returns the raw bytes. This is a synchronous call.
+        Chunks are written straight to disk so the ZIP is never held in
+        memory.  Returns *dest_path*.  This is a synchronous call.
         """
         service = self._build_service()
 
         try:
             request = service.files().get_media(fileId=file_id)
-            buffer = io.BytesIO()
 
             # Use MediaIoBaseDownload for chunked download.
             from googleapiclient.http import MediaIoBaseDownload
 
-            downloader = MediaIoBaseDownload(buffer, request)
-            done = False
-            while not done:
-                status, done = downloader.next_chunk()
-                if status:
-                    logger.debug(
-                        "Download %s: %.0f%%",
-                        file_name,
-                        status.progress() * 100,
-                    )
+            with open(dest_path, "wb") as fh:
+                downloader = MediaIoBaseDownload(
+                    fh, request, chunksize=self._cfg.download_chunk_bytes,
+                )
+                done = False
+                while not done:
+                    status, done = downloader.next_chunk()
+                    if status:
+                        logger.debug(
+                            "Download %s: %.0f%%",
+                            file_name,
+                            status.progress() * 100,
+                        )
 
-            data = buffer.getvalue()
-            logger.info("Downloaded %s (%d bytes)", file_name, len(data))
-            return data
+            logger.info("Downloaded %s (%d bytes)", file_name, dest_path.stat().st_size)
+            return dest_path
 
         except Exception as exc:
             raise DriveWatchError(
@@ -243,13 +425,13 @@ class DriveWatcher:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _extract_zip(zip_bytes: bytes, dest_dir: Path) -> list[SpeakerAudio]:
+    def _extract_zip(zip_source: bytes | Path, dest_dir: Path) -> list[SpeakerAudio]:
         """Extract per-speaker audio files from a Craig ZIP archive.
 
         Delegates to the shared ``extract_speaker_zip`` utility.
         """
         try:
-            return extract_speaker_zip(zip_bytes, dest_dir)
+            return extract_speaker_zip(zip_source, dest_dir)
         except zipfile.BadZipFile as exc:
             raise DriveWatchError(f"Invalid ZIP file: {exc}") from exc
 
@@ -278,7 +460,7 @@ class DriveWatcher:
             logger.error("google_drive.folder_id is empty, watch loop will not run")
             return
 
-        creds_path = Path(self._cfg.credentials_path)
+        creds_path = self._creds_path
         if not creds_path.exists():
             logger.error(
                 "Credentials file not found at %s, watch loop will not run",
@@ -291,7 +473,9 @@ class DriveWatcher:
         while True:
             try:
                 # List files (synchronous, run in executor)
-                files = await loop.run_in_executor(None, self._list_files_sync)
+                files = await loop.run_in_executor(
+                    self._get_executor(), self._list_files_sync
+                )
 
                 # Filter out already-known files via StateStore
                 new_files: list[dict[str, str]] = []
@@ -307,26 +491,10 @@ class DriveWatcher:
                         [f["name"] for f in new_files],
                     )
 
-                for file_info in new_files:
-                    file_id = file_info["id"]
-                    file_name = file_info["name"]
-
-                    try:
-                        await self._process_file(loop, file_id, file_name)
-                    except DriveWatchError as exc:
-                        logger.error(
-                            "Failed to process Drive file %s (%s): %s",
-                            file_name,
-                            file_id,
-                            exc,
-                        )
-                    except Exception as exc:
-                        logger.exception(
-                            "Unexpected error processing Drive file %s (%s): %s",
-                            file_name,
-                            file_id,
-                            exc,
-                        )
+                await asyncio.gather(*(
+                    self._guarded_process(loop, f["id"], f["name"])
+                    for f in new_files
+                ))
 
             except asyncio.CancelledError:
                 logger.info("DriveWatcher loop cancelled")
@@ -338,6 +506,35 @@ class DriveWatcher:
 
             await asyncio.sleep(self._cfg.poll_interval_sec)
 
+    async def _guarded_process(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        file_id: str,
+        file_name: str,
+    ) -> None:
+        """Run ``_process_file`` under the concurrency limit, logging failures.
+
+        Errors are contained per file so one bad file does not abort the
+        others started in the same poll tick.
+        """
+        async with self._sem:
+            try:
+                await self._process_file(loop, file_id, file_name)
+            except DriveWatchError as exc:
+                logger.error(
+                    "Failed to process Drive file %s (%s): %s",
+                    file_name,
+                    file_id,
+                    exc,
+                )
+            except Exception as exc:
+                logger.exception(
+                    "Unexpected error processing Drive file %s (%s): %s",
+                    file_name,
+                    file_id,
+                    exc,
+                )
+
     async def _process_file(
         self,
         loop: asyncio.AbstractEventLoop,
@@ -359,20 +556,25 @@ class DriveWatcher:
             return
 
         logger.info("Processing Drive file: %s (%s) rec_id=%s", file_name, file_id, rec_id)
-        # Download (synchronous, run in executor)
-        zip_bytes = await loop.run_in_executor(
-            None, self._download_file_sync, file_id, file_name
-        )
 
-        # Extract to a temporary directory.
+        # Download and extract into a temporary directory.
         # The callback runs synchronously (awaited) within this function,
         # so the temp dir is alive for the entire pipeline execution.
         # Cleanup happens in the finally block after the callback returns.
-        tmp_dir_obj = tempfile.TemporaryDirectory(prefix=f"drive-{file_id[:8]}-")
-        tmp_path = Path(tmp_dir_obj.name)
+        tmp_path = Path(tempfile.mkdtemp(prefix=f"{file_id[:8]}-", dir=self._get_work_root()))
+        zip_path = tmp_path / "source.zip"
 
         try:
-            tracks = self._extract_zip(zip_bytes, tmp_path)
+            # Download (synchronous, run in executor)
+            await loop.run_in_executor(
+                self._get_executor(), self._download_file_sync, file_id, file_name, zip_path
+            )
+            # Extraction decompresses and writes every track; keep it off the loop
+            tracks = await loop.run_in_executor(
+                self._get_executor(), self._extract_zip, zip_path, tmp_path
+            )
+            # The archive is no longer needed once the tracks are on disk
+            zip_path.unlink(missing_ok=True)
 
             if not tracks:
                 logger.warning(
@@ -381,7 +583,6 @@ class DriveWatcher:
                     file_id,
                 )
                 self._state_store.mark_success(rec_id)
-                tmp_dir_obj.cleanup()
                 return
 
             logger.info(
@@ -406,9 +607,10 @@ class DriveWatcher:
             self._state_store.mark_failed(rec_id, str(exc))
             raise
         finally:
-            # Clean up temporary directory
-            try:
-                tmp_dir_obj.cleanup()
-            except OSError as exc:
-                logger.debug("Temp dir cleanup failed (may already be removed): %s", exc)
+            # Removing the extracted tracks can take a while; keep it off
+            # the loop.  The default executor is used because stop() may
+            # already have shut down the watcher's own pool.
+            await loop.run_in_executor(
+                None, functools.partial(shutil.rmtree, tmp_path, ignore_errors=True)
+            )
 
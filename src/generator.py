@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
 import logging
+import random
+import re
 import time
 from dataclasses import dataclass
 from pathlib import Path
@@ -15,10 +19,43 @@ from src.errors import GenerationError
 
 logger = logging.getLogger(__name__)
 
+# Template placeholders, substituted in a single pass by render_prompt().
+_PLACEHOLDER_RE = re.compile(
+    r"\{(transcript|date|speakers|guild_name|channel_name"
+    r"|event_title|event_attendees|event_description)\}"
+)
+
+
+# Retry backoff: 2**(attempt-1) seconds capped at _RETRY_MAX_DELAY, or the
+# server's Retry-After (capped at _RETRY_AFTER_MAX), plus up to 25% jitter.
+_RETRY_MAX_DELAY = 30.0
+_RETRY_AFTER_MAX = 120.0
+
 
 class _ApiRetryable(Exception):
     """Backend-agnostic retryable API error."""
 
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _retry_after_seconds(exc: Exception) -> float | None:
+    """Return the numeric ``Retry-After`` header of an API error, if any."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return None  # HTTP-date form: fall back to exponential backoff
+    if seconds < 0:
+        return None
+    return min(seconds, _RETRY_AFTER_MAX)
+
 
 @dataclass
 class TemplateInfo:
@@ -54,6 +91,28 @@ def _parse_template_metadata(path: Path) -> tuple[str, str]:
     return display_name, description
 
 
+@functools.lru_cache(maxsize=32)
+def _read_template_text(path: str, mtime_ns: int) -> str:
+    return Path(path).read_text(encoding="utf-8")
+
+
+def _read_template(path: Path) -> str:
+    """Return the text of the template at *path*.
+
+    The text is shared between generators and re-read only when the file's
+    mtime changes.  Raises ``FileNotFoundError`` if *path* does not exist.
+    """
+    return _read_template_text(str(path), path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_client(api_key: str) -> anthropic.AsyncAnthropic:
+    """Return the Claude client for *api_key*, shared between generators."""
+    # Native async client: requests share its keep-alive connection
+    # pool instead of going through a worker thread each.
+    return anthropic.AsyncAnthropic(api_key=api_key)
+
+
 class MinutesGenerator:
     """Renders a prompt template and calls the Claude API to generate minutes."""
 
@@ -61,7 +120,7 @@ class MinutesGenerator:
         self._cfg = cfg
         self._templates: dict[str, str] = {}
         self._prompts_dir: Path | None = None
-        self._client: anthropic.Anthropic | None = None
+        self._client: anthropic.AsyncAnthropic | None = None
         self._openai_client: object | None = None
 
     def load(self) -> None:
@@ -73,17 +132,19 @@ class MinutesGenerator:
             return
 
         path = Path(self._cfg.prompt_template_path)
-        if not path.exists():
-            raise GenerationError(f"Prompt template not found: {path}")
+        try:
+            template = _read_template(path)
+        except FileNotFoundError as exc:
+            raise GenerationError(f"Prompt template not found: {path}") from exc
 
         self._prompts_dir = path.parent
-        self._templates[path.stem] = path.read_text(encoding="utf-8")
+        self._templates[path.stem] = template
         logger.debug("Loaded prompt template from %s (%d chars)", path, len(self._templates[path.stem]))
 
         if self._cfg.backend == "claude":
             if not self._cfg.api_key:
                 raise GenerationError("ANTHROPIC_API_KEY is not set")
-            self._client = anthropic.Anthropic(api_key=self._cfg.api_key)
+            self._client = _build_client(self._cfg.api_key)
         elif self._cfg.backend == "openai_compat":
             try:
                 import openai
@@ -113,14 +174,26 @@ class MinutesGenerator:
             raise GenerationError("Generator not loaded -- call load() first")
 
         path = self._prompts_dir / f"{name}.txt"
-        if not path.exists():
-            raise GenerationError(f"Template not found: {name}")
+        try:
+            content = _read_template(path)
+        except FileNotFoundError as exc:
+            raise GenerationError(f"Template not found: {name}") from exc
 
-        content = path.read_text(encoding="utf-8")
         self._templates[name] = content
         logger.debug("Loaded template '%s' from %s (%d chars)", name, path, len(content))
         return content
 
+    def cache_key(self, template_name: str = "minutes") -> str:
+        """Fingerprint of everything besides the inputs that shapes the output.
+
+        Covers the backend, model, sampling settings and the template text,
+        so cached minutes are not reused after any of them change.
+        """
+        template = self._load_template(template_name)
+        digest = hashlib.sha256(template.encode("utf-8")).hexdigest()[:16]
+        cfg = self._cfg
+        return f"{cfg.backend}:{cfg.model}:{cfg.temperature}:{cfg.max_tokens}:{digest}"
+
     def list_templates(self) -> list[TemplateInfo]:
         """Scan prompts/ directory for available templates."""
         if self._prompts_dir is None:
@@ -157,26 +230,24 @@ class MinutesGenerator:
     ) -> str:
         """Fill in template variables and return the rendered prompt.
 
-        Uses simple string replacement instead of str.format() to avoid
+        Uses a single regex substitution instead of str.format() to avoid
         breakage from literal braces in user-supplied values (guild names,
-        transcript text, etc.).
+        transcript text, etc.).  The template is scanned once, and inserted
+        values are never re-scanned for placeholders.
         """
         template = self._load_template(template_name)
 
         replacements = {
-            "{transcript}": transcript,
-            "{date}": date,
-            "{speakers}": speakers,
-            "{guild_name}": guild_name,
-            "{channel_name}": channel_name,
-            "{event_title}": event_title,
-            "{event_attendees}": event_attendees,
-            "{event_description}": event_description,
+            "transcript": transcript,
+            "date": date,
+            "speakers": speakers,
+            "guild_name": guild_name,
+            "channel_name": channel_name,
+            "event_title": event_title,
+            "event_attendees": event_attendees,
+            "event_description": event_description,
         }
-        result = template
-        for placeholder, value in replacements.items():
-            result = result.replace(placeholder, value)
-        return result
+        return _PLACEHOLDER_RE.sub(lambda m: replacements[m.group(1)], template)
 
     async def _call_api(self, prompt: str) -> str:
         """Dispatch to the configured backend."""
@@ -186,28 +257,30 @@ class MinutesGenerator:
 
     async def _call_claude_api(self, prompt: str) -> str:
         try:
-            response = await asyncio.to_thread(
-                self._client.messages.create,
+            # Streamed so long generations are not subject to the SDK's
+            # non-streaming request time limit; text arrives incrementally.
+            async with self._client.messages.stream(
                 model=self._cfg.model,
                 max_tokens=self._cfg.max_tokens,
                 temperature=self._cfg.temperature,
                 messages=[{"role": "user", "content": prompt}],
-            )
-            text = response.content[0].text
+            ) as stream:
+                chunks = [chunk async for chunk in stream.text_stream]
+                response = await stream.get_final_message()
             logger.info(
                 "Claude: %d input tokens, %d output tokens",
                 response.usage.input_tokens,
                 response.usage.output_tokens,
             )
-            return text
+            return "".join(chunks)
         except anthropic.RateLimitError as exc:
-            raise _ApiRetryable(str(exc)) from exc
+            raise _ApiRetryable(str(exc), _retry_after_seconds(exc)) from exc
         except anthropic.APIStatusError as exc:
             if 400 <= exc.status_code < 500 and exc.status_code != 429:
                 raise GenerationError(
                     f"Claude API client error (HTTP {exc.status_code}): {exc.message}"
                 ) from exc
-            raise _ApiRetryable(str(exc)) from exc
+            raise _ApiRetryable(str(exc), _retry_after_seconds(exc)) from exc
         except anthropic.APIConnectionError as exc:
             raise _ApiRetryable(str(exc)) from exc
 
@@ -233,13 +306,13 @@ class MinutesGenerator:
                 )
             return text
         except openai.RateLimitError as exc:
-            raise _ApiRetryable(str(exc)) from exc
+            raise _ApiRetryable(str(exc), _retry_after_seconds(exc)) from exc
         except openai.APIStatusError as exc:
             if 400 <= exc.status_code < 500 and exc.status_code != 429:
                 raise GenerationError(
                     f"API client error (HTTP {exc.status_code}): {exc.message}"
                 ) from exc
-            raise _ApiRetryable(str(exc)) from exc
+            raise _ApiRetryable(str(exc), _retry_after_seconds(exc)) from exc
         except openai.APIConnectionError as exc:
             raise _ApiRetryable(str(exc)) from exc
 
@@ -257,7 +330,8 @@ class MinutesGenerator:
     ) -> str:
         """Generate meeting minutes from a transcript.
 
-        Retries on transient API errors with exponential backoff.
+        Retries on transient API errors, waiting for the server's
+        ``Retry-After`` when given and jittered exponential backoff otherwise.
         Returns the generated minutes as a Markdown string.
         """
         if not self.is_loaded:
@@ -275,7 +349,7 @@ class MinutesGenerator:
             event_description=event_description,
         )
 
-        last_exc: Exception | None = None
+        last_exc: _ApiRetryable | None = None
         max_attempts = self._cfg.max_retries + 1
 
         for attempt in range(1, max_attempts + 1):
@@ -302,10 +376,14 @@ class MinutesGenerator:
                     attempt, max_attempts, exc,
                 )
 
-            # Exponential backoff before next retry
+            # Honour Retry-After when given, else exponential backoff
             if attempt < max_attempts:
-                delay = 2 ** (attempt - 1)
-                logger.debug("Retrying in %ds...", delay)
+                if last_exc.retry_after is not None:
+                    delay = last_exc.retry_after
+                else:
+                    delay = min(2 ** (attempt - 1), _RETRY_MAX_DELAY)
+                delay += random.uniform(0, 0.25 * delay)
+                logger.debug("Retrying in %.1fs...", delay)
                 await asyncio.sleep(delay)
 
         raise GenerationError(
@@ -2,27 +2,59 @@
 
 from __future__ import annotations
 
+import functools
+import itertools
 import logging
+import math
+import operator
 import re
+from typing import Callable
 
 from src.config import MergerConfig
 from src.transcriber import Segment
 
 logger = logging.getLogger(__name__)
 
+_SORT_KEY = operator.attrgetter("start", "end")
+
 
 def _format_timestamp(seconds: float, fmt: str) -> str:
     """Format a timestamp in seconds using the configured format string.
 
     Supported placeholders: {hh}, {mm}, {ss}.
     """
-    total_seconds = int(seconds)
-    hh = total_seconds // 3600
-    mm = (total_seconds % 3600) // 60
-    ss = total_seconds % 60
+    hh, rem = divmod(int(seconds), 3600)
+    mm, ss = divmod(rem, 60)
     return fmt.format(hh=f"{hh:02d}", mm=f"{mm:02d}", ss=f"{ss:02d}")
 
 
+def _fmt_mm_ss(seconds: float) -> str:
+    mm, ss = divmod(int(seconds) % 3600, 60)
+    return f"[{mm:02d}:{ss:02d}]"
+
+
+def _fmt_hh_mm_ss(seconds: float) -> str:
+    hh, rem = divmod(int(seconds), 3600)
+    mm, ss = divmod(rem, 60)
+    return f"[{hh:02d}:{mm:02d}:{ss:02d}]"
+
+
+# Common formats rendered with f-strings instead of parsing the format
+# string for every transcript line.
+_FAST_TIMESTAMP_FORMATTERS: dict[str, Callable[[float], str]] = {
+    "[{mm}:{ss}]": _fmt_mm_ss,
+    "[{hh}:{mm}:{ss}]": _fmt_hh_mm_ss,
+}
+
+
+def _timestamp_formatter(fmt: str) -> Callable[[float], str]:
+    """Return a one-argument formatter equivalent to ``_format_timestamp(s, fmt)``."""
+    fast = _FAST_TIMESTAMP_FORMATTERS.get(fmt)
+    if fast is not None:
+        return fast
+    return functools.partial(_format_timestamp, fmt=fmt)
+
+
 def merge_transcripts(
     segments: list[Segment],
     cfg: MergerConfig,
@@ -38,47 +70,53 @@ def merge_transcripts(
     if not segments:
         return ""
 
-    # Sort by start time, breaking ties by end time
-    sorted_segs = sorted(segments, key=lambda s: (s.start, s.end))
-
-    # Filter segments below minimum character threshold
+    # Filter segments below minimum character threshold, then sort the
+    # filtered copy in place by start time, breaking ties by end time.
+    # attrgetter builds the (start, end) keys in C, reading Segment's slots
+    # without a Python-level call per element.
     min_chars = cfg.min_segment_chars
-    sorted_segs = [s for s in sorted_segs if len(s.text) >= min_chars]
+    sorted_segs = [s for s in segments if len(s.text) >= min_chars]
+    sorted_segs.sort(key=_SORT_KEY)
 
     if not sorted_segs:
         return ""
 
-    # Merge adjacent same-speaker segments within gap threshold
-    merged: list[Segment] = [sorted_segs[0]]
-
-    for seg in sorted_segs[1:]:
-        prev = merged[-1]
-        gap = max(0.0, seg.start - prev.end)
-
-        if seg.speaker == prev.speaker and gap <= cfg.gap_merge_threshold_sec:
-            # Merge: extend the previous segment
-            merged[-1] = Segment(
-                start=prev.start,
-                end=seg.end,
-                text=prev.text + " " + seg.text,
-                speaker=prev.speaker,
-            )
+    # Merge adjacent same-speaker segments within gap threshold.  The open
+    # run lives in locals and is flushed as a tuple when the speaker changes
+    # or the gap is too wide, so each step only reads the current segment's
+    # fields; the gap threshold is resolved once before the loop.  Text of a
+    # run is collected as fragments and joined once, so a long same-speaker
+    # run costs linear rather than quadratic copying.  A negative threshold
+    # never merges (overlaps count as gap 0).
+    max_gap = cfg.gap_merge_threshold_sec if cfg.gap_merge_threshold_sec >= 0 else -math.inf
+    first = sorted_segs[0]
+    run_start, run_end, run_speaker = first.start, first.end, first.speaker
+    run_parts = [first.text]
+    merged: list[tuple[float, str, list[str]]] = []
+
+    for seg in itertools.islice(sorted_segs, 1, None):
+        if seg.speaker == run_speaker and seg.start - run_end <= max_gap:
+            run_end = seg.end
+            run_parts.append(seg.text)
         else:
-            merged.append(seg)
+            merged.append((run_start, run_speaker, run_parts))
+            run_start, run_end, run_speaker = seg.start, seg.end, seg.speaker
+            run_parts = [seg.text]
+    merged.append((run_start, run_speaker, run_parts))
+    speakers_seen = {speaker for _, speaker, _ in merged}
 
     # Format output
-    lines: list[str] = []
-    for seg in merged:
-        ts = _format_timestamp(seg.start, cfg.timestamp_format)
-        lines.append(f"{ts} {seg.speaker}: {seg.text}")
-
-    transcript = "\n".join(lines)
+    format_ts = _timestamp_formatter(cfg.timestamp_format)
+    transcript = "\n".join(
+        f"{format_ts(start)} {speaker}: {' '.join(parts)}"
+        for start, speaker, parts in merged
+    )
 
     logger.info(
         "Merged %d raw segments into %d lines (%d speakers)",
         len(segments),
         len(merged),
-        len({s.speaker for s in merged}),
+        len(speakers_seen),
     )
     return transcript
 
@@ -0,0 +1,64 @@
+"""Non-blocking, coalescing status message for pipeline progress updates."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import discord
+
+from src.poster import OutputChannel, send_status_update
+
+logger = logging.getLogger(__name__)
+
+
+class StatusOutbox:
+    """Owns one pipeline status message and applies updates in the background.
+
+    ``update()`` returns immediately; a single worker task sends or edits the
+    message.  Updates that arrive while a request is in flight are coalesced
+    so only the latest text is sent.  ``close()`` waits for the in-flight
+    request, drops any not-yet-sent text, and deletes the message.
+
+    Like ``send_status_update``, this is a no-op when *channel* is None or a
+    ForumChannel.
+    """
+
+    def __init__(self, channel: OutputChannel | None) -> None:
+        self._enabled = channel is not None and not isinstance(channel, discord.ForumChannel)
+        self._channel = channel
+        self._message: discord.Message | None = None
+        self._pending: str | None = None
+        self._worker: asyncio.Task[None] | None = None
+
+    def update(self, text: str) -> None:
+        """Schedule *text* as the status, replacing any unsent text."""
+        if not self._enabled:
+            return
+        self._pending = text
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain(), name="status-outbox")
+
+    async def _drain(self) -> None:
+        while self._pending is not None:
+            text, self._pending = self._pending, None
+            self._message = await send_status_update(self._channel, self._message, text)
+
+    async def close(self) -> None:
+        """Finish the in-flight request and delete the status message.
+
+        Safe to call more than once, including concurrently.
+        """
+        self._pending = None
+        worker, self._worker = self._worker, None
+        if worker is not None:
+            try:
+                await worker
+            except Exception:
+                logger.debug("Status update worker failed", exc_info=True)
+        message, self._message = self._message, None
+        if message is not None:
+            try:
+                await message.delete()
+            except discord.HTTPException:
+                pass
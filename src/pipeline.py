@@ -29,7 +29,8 @@ from src.detector import DetectedRecording
 from src.errors import MinutesBotError, ProcessingTimeoutError, TranscriptionError
 from src.generator import MinutesGenerator
 from src.merger import format_transcript_markdown, merge_transcripts
-from src.poster import OutputChannel, post_error, post_minutes, send_status_update
+from src.outbox import StatusOutbox
+from src.poster import OutputChannel, post_error, post_minutes
 from src.state_store import StateStore
 from src.minutes_archive import MinutesArchive
 from src.transcriber import Segment, Transcriber
@@ -37,9 +38,18 @@ from src.transcriber import Segment, Transcriber
 logger = logging.getLogger(__name__)
 
 
-def _transcript_hash(transcript: str, template_name: str = "minutes") -> str:
-    """Compute a deterministic cache key from the transcript text and template."""
-    key = f"{template_name}:{transcript}"
+def _transcript_hash(
+    transcript: str, template_name: str = "minutes", generation_key: str = "",
+) -> str:
+    """Compute a deterministic cache key from the transcript text and template.
+
+    *generation_key* (see ``MinutesGenerator.cache_key``) ties the entry to
+    the model, sampling settings and template text that produced it.
+    """
+    if generation_key:
+        key = f"{template_name}:{generation_key}:{transcript}"
+    else:
+        key = f"{template_name}:{transcript}"
     return hashlib.sha256(key.encode("utf-8")).hexdigest()
 
 
@@ -69,19 +79,12 @@ async def run_pipeline_from_tracks(
     lookup and archive metadata still work.
     """
     pipeline_start = time.monotonic()
-    status_msg: discord.Message | None = None
+    status = StatusOutbox(output_channel)
 
     # Resolve guild metadata once: explicit params win, fall back to output_channel.
-    resolved_guild_id: int = guild_id or (
-        output_channel.guild.id
-        if output_channel and output_channel.guild
-        else 0
-    )
-    resolved_guild_name: str = guild_name or (
-        output_channel.guild.name
-        if output_channel and output_channel.guild
-        else ""
-    )
+    channel_guild = output_channel.guild if output_channel else None
+    resolved_guild_id: int = guild_id or (channel_guild.id if channel_guild else 0)
+    resolved_guild_name: str = guild_name or (channel_guild.name if channel_guild else "")
     channel_name: str = output_channel.name if output_channel else ""
 
     logger.info(
@@ -96,8 +99,7 @@ async def run_pipeline_from_tracks(
         async with asyncio.timeout(timeout_sec):
             # Status: transcribing
             speaker_names = [t.speaker.username for t in tracks]
-            status_msg = await send_status_update(
-                output_channel, status_msg,
+            status.update(
                 f"文字起こし中... ({len(tracks)}人: {', '.join(speaker_names)})",
             )
 
@@ -169,13 +171,13 @@ async def run_pipeline_from_tracks(
                 transcript_md = format_transcript_markdown(
                     transcript, date_str, speakers_str,
                 )
-            th = _transcript_hash(transcript, template_name)
+            th = _transcript_hash(
+                transcript, template_name, generator.cache_key(template_name),
+            )
             minutes_md = state_store.get_cached_minutes(th)
 
             if minutes_md is None:
-                status_msg = await send_status_update(
-                    output_channel, status_msg, "議事録を生成中..."
-                )
+                status.update("議事録を生成中...")
                 minutes_md = await generator.generate(
                     transcript=transcript,
                     date=date_str,
@@ -195,9 +197,7 @@ async def run_pipeline_from_tracks(
             google_docs_url: str | None = None
             if exporter is not None and cfg.export_google_docs.enabled:
                 try:
-                    status_msg = await send_status_update(
-                        output_channel, status_msg, "Google Docsにエクスポート中..."
-                    )
+                    status.update("Google Docsにエクスポート中...")
                     title = f"Meeting Minutes — {date_str}"
                     export_result = await exporter.export(
                         minutes_md=minutes_md,
@@ -216,19 +216,21 @@ async def run_pipeline_from_tracks(
             # Stage 5: Post to Discord (skipped when channel is None)
             message: discord.Message | None = None
             if output_channel is not None:
-                status_msg = await send_status_update(
-                    output_channel, status_msg, "議事録を投稿中..."
-                )
-                message = await post_minutes(
-                    channel=output_channel,
-                    minutes_md=minutes_md,
-                    date=date_str,
-                    speakers=speakers_str,
-                    cfg=cfg.poster,
-                    speaker_stats=speaker_stats_text,
-                    transcript_md=transcript_md,
-                    event_title=event_title or None,
-                    google_docs_url=google_docs_url,
+                # Remove the status message while the minutes are posted
+                # rather than paying for the delete round trip afterwards
+                message, _ = await asyncio.gather(
+                    post_minutes(
+                        channel=output_channel,
+                        minutes_md=minutes_md,
+                        date=date_str,
+                        speakers=speakers_str,
+                        cfg=cfg.poster,
+                        speaker_stats=speaker_stats_text,
+                        transcript_md=transcript_md,
+                        event_title=event_title or None,
+                        google_docs_url=google_docs_url,
+                    ),
+                    status.close(),
                 )
             else:
                 logger.info(
@@ -255,12 +257,8 @@ async def run_pipeline_from_tracks(
                 except Exception:
                     logger.warning("Archive write failed (non-critical)", exc_info=True)
 
-        # Clean up status message
-        if status_msg:
-            try:
-                await status_msg.delete()
-            except discord.HTTPException:
-                pass
+        # Clean up status message (already gone if minutes were posted)
+        await status.close()
 
         elapsed = time.monotonic() - pipeline_start
         logger.info(
@@ -278,11 +276,7 @@ async def run_pipeline_from_tracks(
             elapsed,
             timeout_sec,
         )
-        if status_msg:
-            try:
-                await status_msg.delete()
-            except discord.HTTPException:
-                pass
+        await status.close()
         raise ProcessingTimeoutError(
             f"ローカル処理がタイムアウトしました ({timeout_sec}秒): {source_label}"
         )
@@ -296,11 +290,7 @@ async def run_pipeline_from_tracks(
             elapsed,
             exc,
         )
-        if status_msg:
-            try:
-                await status_msg.delete()
-            except discord.HTTPException:
-                pass
+        await status.close()
         if output_channel is not None:
             await post_error(
                 channel=output_channel,
@@ -317,11 +307,7 @@ async def run_pipeline_from_tracks(
             source_label,
             elapsed,
         )
-        if status_msg:
-            try:
-                await status_msg.delete()
-            except discord.HTTPException:
-                pass
+        await status.close()
         if output_channel is not None:
             await post_error(
                 channel=output_channel,
@@ -346,7 +332,7 @@ async def run_pipeline(
     error_mention_role_id: int | None = None,
 ) -> None:
     """Execute the full pipeline from Craig download through Discord posting."""
-    status_msg: discord.Message | None = None
+    status = StatusOutbox(output_channel)
 
     logger.info(
         "Pipeline starting for rec_id=%s (channel=%d, guild=%d)",
@@ -356,9 +342,7 @@ async def run_pipeline(
     )
 
     # Status: downloading
-    status_msg = await send_status_update(
-        output_channel, status_msg, "音声ファイルをダウンロード中..."
-    )
+    status.update("音声ファイルをダウンロード中...")
 
     try:
         with tempfile.TemporaryDirectory(prefix=f"minutes-{recording.rec_id}-") as tmp_dir:
@@ -368,11 +352,7 @@ async def run_pipeline(
             tracks = await _stage_download(recording, session, cfg, dest)
 
             # Clean up download status before handing off
-            if status_msg:
-                try:
-                    await status_msg.delete()
-                except discord.HTTPException:
-                    pass
+            await status.close()
 
             # Stages 2-5: transcribe -> merge -> generate -> post
             await run_pipeline_from_tracks(
@@ -391,11 +371,7 @@ async def run_pipeline(
 
     except MinutesBotError as exc:
         # Clean up status if download itself failed
-        if status_msg:
-            try:
-                await status_msg.delete()
-            except discord.HTTPException:
-                pass
+        await status.close()
         if exc.stage == "audio_acquisition":
             await post_error(
                 channel=output_channel,
@@ -406,11 +382,7 @@ async def run_pipeline(
         raise
 
     except Exception as exc:
-        if status_msg:
-            try:
-                await status_msg.delete()
-            except discord.HTTPException:
-                pass
+        await status.close()
         await post_error(
             channel=output_channel,
             error_message=str(exc),
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import io
 import logging
+import random
 import re
+from collections.abc import Mapping
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any
 
 import discord
@@ -21,25 +25,35 @@ OutputChannel = discord.TextChannel | discord.ForumChannel
 
 # Max retry attempts for Discord API calls
 _MAX_RETRIES = 3
+# Fallback backoff cap when a 429 carries no retry hint; every delay gets up
+# to 25% jitter so concurrent pipelines do not retry in lockstep
+_MAX_BACKOFF_SEC = 30.0
 
-# Regex patterns to extract sections from generated minutes markdown
-_SUMMARY_PATTERN = re.compile(
-    r"## まとめ\s*\n(.*?)(?=\n## |\Z)", re.DOTALL
-)
-_DECISIONS_PATTERN = re.compile(
-    r"## 推奨される次のステップ\s*\n(.*?)(?=\n## |\Z)", re.DOTALL
+# Splits generated minutes markdown into "## " sections in one pass
+_H2_SECTION_PATTERN = re.compile(
+    r"^## (?P<title>[^\n]+)\n(?P<body>.*?)(?=\n## |\Z)", re.DOTALL | re.MULTILINE
 )
+_SUMMARY_TITLE = "まとめ"
+_DECISIONS_TITLE = "推奨される次のステップ"
 _SPEAKERS_PATTERN = re.compile(
     r"- 参加者:\s*(.+)"
 )
+# Makes a display date safe for use in an attachment filename in one pass
+_SAFE_DATE_TABLE = str.maketrans({"/": "-", " ": "_", ":": "-"})
+
 
+@functools.lru_cache(maxsize=32)
+def _parse_sections(text: str) -> Mapping[str, str]:
+    """Map each ``## `` heading in the minutes markdown to its stripped body.
 
-def _extract_section(text: str, pattern: re.Pattern) -> str:
-    """Extract a section from the minutes markdown."""
-    match = pattern.search(text)
-    if match:
-        return match.group(1).strip()
-    return ""
+    If a heading repeats, the first occurrence wins.  Results are cached
+    per minutes text and returned read-only, since the cached mapping is
+    shared between callers.
+    """
+    sections: dict[str, str] = {}
+    for match in _H2_SECTION_PATTERN.finditer(text):
+        sections.setdefault(match["title"].strip(), match["body"].strip())
+    return MappingProxyType(sections)
 
 
 def _truncate(text: str, max_length: int) -> str:
@@ -49,6 +63,21 @@ def _truncate(text: str, max_length: int) -> str:
     return text[: max_length - 3] + "..."
 
 
+def _add_capped_field(embed: discord.Embed, name: str, value: str, budget: int) -> int:
+    """Add a field truncated to fit both the 1024-char field limit and *budget*.
+
+    *budget* is the number of characters still available for field names
+    and values.  Returns the remaining budget; the field is skipped when
+    there is no room for a meaningful value.
+    """
+    limit = min(1024, budget - len(name))
+    if limit <= 0 or (len(value) > limit and limit < 4):
+        return budget
+    value = _truncate(value, limit)
+    embed.add_field(name=name, value=value, inline=False)
+    return budget - len(name) - len(value)
+
+
 def build_minutes_embed(
     minutes_md: str,
     date: str,
@@ -59,77 +88,40 @@ def build_minutes_embed(
     google_docs_url: str | None = None,
 ) -> discord.Embed:
     """Build a Discord embed summarising the generated minutes."""
-    summary = _extract_section(minutes_md, _SUMMARY_PATTERN)
-    decisions = _extract_section(minutes_md, _DECISIONS_PATTERN)
+    sections = _parse_sections(minutes_md)
+    summary = sections.get(_SUMMARY_TITLE, "")
+    decisions = sections.get(_DECISIONS_TITLE, "")
 
     embed = discord.Embed(
         title=f"会議議事録 — {date}",
         color=cfg.embed_color,
         timestamp=datetime.now(),
     )
+    footer = "詳細はGoogle Docsを参照" if google_docs_url else "詳細議事録は添付ファイルを参照"
+    embed.set_footer(text=footer)
+
+    # Characters left for field names and values under Discord's embed limit
+    budget = cfg.max_embed_length - len(embed.title) - len(footer)
 
     # Meeting name from calendar
     if event_title:
-        embed.add_field(
-            name="会議名",
-            value=event_title,
-            inline=False,
-        )
+        budget = _add_capped_field(embed, "会議名", event_title, budget)
 
     # Participants
     if speakers:
-        embed.add_field(
-            name="参加者",
-            value=speakers,
-            inline=False,
-        )
+        budget = _add_capped_field(embed, "参加者", speakers, budget)
 
     # Summary
     if summary:
-        embed.add_field(
-            name="まとめ",
-            value=_truncate(summary, 1024),
-            inline=False,
-        )
+        budget = _add_capped_field(embed, "まとめ", summary, budget)
 
     # Next steps
     if decisions:
-        embed.add_field(
-            name="次のステップ",
-            value=_truncate(decisions, 1024),
-            inline=False,
-        )
+        budget = _add_capped_field(embed, "次のステップ", decisions, budget)
 
     # Speaker statistics (after decisions, before footer)
     if speaker_stats:
-        embed.add_field(
-            name="\U0001f4ca 話者統計",
-            value=_truncate(speaker_stats, 1024),
-            inline=False,
-        )
-
-    if google_docs_url:
-        embed.set_footer(text="詳細はGoogle Docsを参照")
-    else:
-        embed.set_footer(text="詳細議事録は添付ファイルを参照")
-
-    # Ensure total embed length stays within Discord limits
-    total_len = len(embed.title or "") + sum(
-        len(f.name) + len(f.value) for f in embed.fields
-    ) + len(embed.footer.text or "")
-
-    if total_len > cfg.max_embed_length:
-        # Trim the summary field to fit
-        if embed.fields and len(embed.fields) >= 2:
-            overshoot = total_len - cfg.max_embed_length
-            current_summary = embed.fields[1].value
-            trimmed = current_summary[: len(current_summary) - overshoot - 3] + "..."
-            embed.set_field_at(
-                1,
-                name="まとめ",
-                value=trimmed,
-                inline=False,
-            )
+        budget = _add_capped_field(embed, "\U0001f4ca 話者統計", speaker_stats, budget)
 
     return embed
 
@@ -158,20 +150,45 @@ def build_error_embed(
     return embed, mention
 
 
-def build_minutes_file(minutes_md: str, date: str) -> discord.File:
-    """Create a discord.File attachment from the full minutes markdown."""
-    safe_date = date.replace("/", "-").replace(" ", "_")
-    filename = f"minutes_{safe_date}.md"
-    buffer = io.BytesIO(minutes_md.encode("utf-8"))
-    return discord.File(fp=buffer, filename=filename)
+def _markdown_file(content: str | bytes, filename: str) -> discord.File:
+    """Wrap markdown (``str`` or pre-encoded UTF-8 ``bytes``) as a discord.File."""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return discord.File(fp=io.BytesIO(content), filename=filename)
+
 
+def build_minutes_file(minutes_md: str | bytes, date: str) -> discord.File:
+    """Create a discord.File attachment from the full minutes markdown.
+
+    *minutes_md* may be pre-encoded UTF-8 bytes so that retries, which need
+    a fresh File each attempt, do not re-encode the text.
+    """
+    safe_date = date.translate(_SAFE_DATE_TABLE)
+    return _markdown_file(minutes_md, f"minutes_{safe_date}.md")
 
-def build_transcript_file(transcript_md: str, date: str) -> discord.File:
+
+def build_transcript_file(transcript_md: str | bytes, date: str) -> discord.File:
     """Create a discord.File attachment from the formatted transcript markdown."""
-    safe_date = date.replace("/", "-").replace(" ", "_")
-    filename = f"transcript_{safe_date}.md"
-    buffer = io.BytesIO(transcript_md.encode("utf-8"))
-    return discord.File(fp=buffer, filename=filename)
+    safe_date = date.translate(_SAFE_DATE_TABLE)
+    return _markdown_file(transcript_md, f"transcript_{safe_date}.md")
+
+
+def _rate_limit_delay(exc: discord.HTTPException, attempt: int) -> float:
+    """Seconds to wait after a 429, with jitter.
+
+    Uses the exception's ``retry_after`` or the ``X-RateLimit-Reset-After``
+    response header when present, else capped exponential backoff.
+    """
+    delay = getattr(exc, "retry_after", None)
+    if not delay:
+        headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+        try:
+            delay = float(headers.get("X-RateLimit-Reset-After", 0))
+        except (TypeError, ValueError):
+            delay = 0.0
+    if not delay:
+        delay = min(_MAX_BACKOFF_SEC, 2 ** (attempt - 1))
+    return random.uniform(delay, delay * 1.25)
 
 
 async def _send_with_retry(coro_factory, description: str) -> discord.Message:
@@ -187,7 +204,9 @@ async def _send_with_retry(coro_factory, description: str) -> discord.Message:
         except discord.HTTPException as exc:
             last_exc = exc
             if exc.status == 429:
-                retry_after = getattr(exc, "retry_after", 2 ** (attempt - 1))
+                if attempt == _MAX_RETRIES:
+                    break
+                retry_after = _rate_limit_delay(exc, attempt)
                 logger.warning(
                     "%s rate-limited (attempt %d/%d), retrying in %.1fs",
                     description, attempt, _MAX_RETRIES, retry_after,
@@ -238,18 +257,20 @@ async def post_minutes(
             emoji="\U0001f4c4",
         ))
 
-    def _build_files() -> list[discord.File]:
-        """Build the list of file attachments (recreated each attempt).
+    # Encoded once; only the File wrappers are rebuilt on each attempt.
+    # When a Google Docs URL is available, the minutes MD file is omitted
+    # (the link is in the embed instead). Transcript is still attached
+    # if configured.
+    minutes_bytes = None if google_docs_url else minutes_md.encode("utf-8")
+    transcript_bytes = transcript_md.encode("utf-8") if transcript_md else None
 
-        When a Google Docs URL is available, the minutes MD file is omitted
-        (the link is in the embed instead). Transcript is still attached
-        if configured.
-        """
+    def _build_files() -> list[discord.File]:
+        """Build the list of file attachments (recreated each attempt)."""
         files: list[discord.File] = []
-        if not google_docs_url:
-            files.append(build_minutes_file(minutes_md, date))
-        if transcript_md:
-            files.append(build_transcript_file(transcript_md, date))
+        if minutes_bytes is not None:
+            files.append(build_minutes_file(minutes_bytes, date))
+        if transcript_bytes is not None:
+            files.append(build_transcript_file(transcript_bytes, date))
         return files
 
     if isinstance(channel, discord.ForumChannel):
@@ -274,8 +295,7 @@ async def post_minutes(
         message = thread_result.message
 
         # Step 2: Send file(s) as a follow-up in the same thread (if any)
-        files_to_send = _build_files()
-        if files_to_send:
+        if minutes_bytes is not None or transcript_bytes is not None:
             async def _send_files():
                 files = _build_files()
                 return await thread.send(files=files)
@@ -375,17 +395,25 @@ async def send_status_update(
     the send fails or no channel is given. Failures are logged but do not
     raise -- status messages are non-critical.
 
+    An edit is skipped when *message* already shows *status_text*.
+
     For ForumChannel, status updates are silently skipped since forum channels
     do not support direct messages (threads are created only for final output).
     """
     if channel is None or isinstance(channel, discord.ForumChannel):
         return None
+    # Re-sending the text already shown would only spend rate limit budget
+    if message is not None and message.content == status_text:
+        return message
 
     try:
         if message is None:
             return await channel.send(status_text)
         else:
             await message.edit(content=status_text)
+            # edit() returns a new Message; keep ours in sync so the
+            # unchanged-text check above sees what is actually displayed
+            message.content = status_text
             return message
     except discord.HTTPException as exc:
         logger.warning("Status update failed (non-critical): %s", exc)
@@ -3,10 +3,15 @@
 Single writer for both state files. In-memory dict mirrors disk state.
 All reads are O(1) dict lookups. Writes update dict then flush atomically.
 
+Processing-state changes are appended to a JSONL journal instead of
+rewriting processing.json each time; the journal is folded back into the
+snapshot on startup, every ``_JOURNAL_COMPACT_EVERY`` records and on close.
+
 File layout::
 
     state/
       processing.json     # {rec_id: {source, source_id, file_name, status, ...}}
+      processing.jsonl    # journal: {"rec_id": ..., "entry": {...} | null} per line
       minutes_cache.json  # {transcript_hash: minutes_md}
 """
 
@@ -26,6 +31,12 @@ logger = logging.getLogger(__name__)
 # Group 1 captures the 12-char alphanumeric rec_id.
 _REC_ID_PATTERN = re.compile(r"^craig[_-]([A-Za-z0-9]{12})[_-]")
 
+# Journal records written before processing.json is rewritten (compacted).
+_JOURNAL_COMPACT_EVERY = 200
+
+# State files are machine-written: compact separators, no indentation.
+_JSON_SEPARATORS = (",", ":")
+
 
 def extract_rec_id(file_name: str) -> str | None:
     """Extract the Craig recording ID from a filename.
@@ -51,6 +62,8 @@ class StateStore:
     ) -> None:
         self._state_dir = state_dir
         self._processing_path = state_dir / "processing.json"
+        self._journal_path = state_dir / "processing.jsonl"
+        self._journal_count = 0
         self._cache_path = state_dir / "minutes_cache.json"
 
         # Create state directory
@@ -73,6 +86,8 @@ class StateStore:
 
         # Load state from disk
         self._processing: dict[str, dict] = self._load_json(self._processing_path)
+        if self._replay_journal():
+            self._flush_processing()
         self._cache: dict[str, str] = self._load_json(self._cache_path)
         self._guild_settings_path = state_dir / "guild_settings.json"
         self._guild_settings: dict[str, dict] = self._load_json(self._guild_settings_path)
@@ -103,7 +118,7 @@ class StateStore:
             "status": "processing",
             "started_at": datetime.now(timezone.utc).isoformat(),
         }
-        self._flush_processing()
+        self._journal(rec_id)
         return True
 
     def mark_success(self, rec_id: str) -> None:
@@ -120,7 +135,7 @@ class StateStore:
         entry["status"] = "success"
         entry["completed_at"] = datetime.now(timezone.utc).isoformat()
         entry.pop("started_at", None)
-        self._flush_processing()
+        self._journal(rec_id)
 
     def mark_failed(self, rec_id: str, error: str) -> None:
         """Mark a recording as failed. NEVER raises."""
@@ -138,7 +153,7 @@ class StateStore:
             entry["error"] = error
             entry["failed_at"] = datetime.now(timezone.utc).isoformat()
             entry.pop("started_at", None)
-            self._flush_processing()
+            self._journal(rec_id)
         except Exception as exc:
             logger.warning("mark_failed itself failed for rec_id=%s: %s", rec_id, exc)
 
@@ -262,11 +277,14 @@ class StateStore:
             logger.warning("Failed to load %s, starting empty: %s", path, exc)
             return {}
 
-    def _flush(self, data: dict, target: Path) -> None:
-        """Atomic write: serialize to .tmp then os.replace()."""
+    def _flush(self, data: dict, target: Path) -> bool:
+        """Atomic write: serialize to .tmp then os.replace().
+
+        Returns False (after logging) if *target* could not be replaced.
+        """
         tmp_path = target.with_suffix(".tmp")
         try:
-            json_str = json.dumps(data, indent=2, ensure_ascii=False)
+            json_str = json.dumps(data, separators=_JSON_SEPARATORS, ensure_ascii=False)
             tmp_path.write_text(json_str, encoding="utf-8")
             os.replace(str(tmp_path), str(target))
         except OSError as exc:
@@ -280,9 +298,73 @@ class StateStore:
                 tmp_path.unlink(missing_ok=True)
             except OSError:
                 pass
+            return False
+        return True
 
     def _flush_processing(self) -> None:
-        self._flush(self._processing, self._processing_path)
+        """Rewrite processing.json and, once it is on disk, empty the journal."""
+        if not self._flush(self._processing, self._processing_path):
+            # The journal still holds records the snapshot lacks
+            return
+        if self._journal_count or self._journal_path.exists():
+            try:
+                self._journal_path.unlink(missing_ok=True)
+            except OSError as exc:
+                logger.warning("Failed to truncate %s: %s", self._journal_path, exc)
+                return
+            self._journal_count = 0
+
+    def _journal(self, rec_id: str) -> None:
+        """Append the current state of *rec_id* to the processing journal."""
+        record = {"rec_id": rec_id, "entry": self._processing.get(rec_id)}
+        line = json.dumps(record, separators=_JSON_SEPARATORS, ensure_ascii=False) + "\n"
+        try:
+            with open(self._journal_path, "a", encoding="utf-8") as fh:
+                fh.write(line)
+        except OSError as exc:
+            logger.warning(
+                "Failed to append to %s (in-memory state preserved): %s",
+                self._journal_path,
+                exc,
+            )
+            return
+        self._journal_count += 1
+        if self._journal_count >= _JOURNAL_COMPACT_EVERY:
+            self._flush_processing()
+
+    def _replay_journal(self) -> bool:
+        """Apply journal records on top of the loaded snapshot.
+
+        Returns True if the journal had any lines, so the caller compacts it
+        away.  A torn final line (crash mid-append) is skipped, and must not
+        be left behind for the next append to be glued onto.
+        """
+        if not self._journal_path.exists():
+            return False
+        read = 0
+        try:
+            with open(self._journal_path, encoding="utf-8") as fh:
+                for line in fh:
+                    read += 1
+                    try:
+                        record = json.loads(line)
+                        rec_id = record["rec_id"]
+                        entry = record["entry"]
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        logger.warning("Skipping malformed journal line in %s", self._journal_path)
+                        continue
+                    if entry is None:
+                        self._processing.pop(rec_id, None)
+                    else:
+                        self._processing[rec_id] = entry
+        except OSError as exc:
+            logger.warning("Failed to read %s: %s", self._journal_path, exc)
+        return read > 0
+
+    def close(self) -> None:
+        """Fold any pending journal records into processing.json."""
+        if self._journal_count:
+            self._flush_processing()
 
     def _flush_cache(self) -> None:
         self._flush(self._cache, self._cache_path)
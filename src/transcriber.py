@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import logging
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
-from faster_whisper import WhisperModel
+from faster_whisper import BatchedInferencePipeline, WhisperModel
 
 from src.audio_source import SpeakerAudio
 from src.config import WhisperConfig
@@ -16,9 +18,12 @@ from src.errors import TranscriptionError
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Segment:
-    """A single transcription segment with speaker attribution."""
+    """A single transcription segment with speaker attribution.
+
+    Slotted because long meetings produce tens of thousands of these.
+    """
 
     start: float
     end: float
@@ -36,6 +41,7 @@ class Transcriber:
     def __init__(self, cfg: WhisperConfig) -> None:
         self._cfg = cfg
         self._model: WhisperModel | None = None
+        self._batched: BatchedInferencePipeline | None = None
 
     def load_model(self) -> None:
         """Load the Whisper model into memory (CPU or GPU).
@@ -45,21 +51,46 @@ class Transcriber:
         if self._model is not None:
             return
 
+        compute_type = self._cfg.compute_type
         logger.info(
-            "Loading whisper model %s (device=%s, compute=%s)",
+            "Loading whisper model %s (device=%s, compute=%s, workers=%d)",
             self._cfg.model,
             self._cfg.device,
-            self._cfg.compute_type,
+            compute_type,
+            self._cfg.max_parallel_tracks,
         )
         t0 = time.monotonic()
-        self._model = WhisperModel(
-            self._cfg.model,
-            device=self._cfg.device,
-            compute_type=self._cfg.compute_type,
-        )
+        # num_workers lets transcribe() calls from several threads run in
+        # parallel instead of queueing on a single CTranslate2 worker.
+        self._model = self._build_model(compute_type)
+        if self._cfg.batch_size > 1:
+            # Decodes several VAD chunks of a track per forward pass
+            self._batched = BatchedInferencePipeline(model=self._model)
         elapsed = time.monotonic() - t0
         logger.info("Whisper model loaded in %.1fs", elapsed)
 
+    def _build_model(self, compute_type: str) -> WhisperModel:
+        """Construct the WhisperModel, preferring the on-disk model cache.
+
+        With ``model_cache_dir`` set, the model is first opened with
+        ``local_files_only=True`` so restarts skip the Hugging Face Hub
+        round trip; only a cache miss falls back to downloading.
+        """
+        cache_dir = self._cfg.model_cache_dir or None
+        kwargs = {
+            "device": self._cfg.device,
+            "compute_type": compute_type,
+            "cpu_threads": self._cfg.cpu_threads,
+            "num_workers": self._cfg.max_parallel_tracks,
+            "download_root": cache_dir,
+        }
+        if cache_dir is not None:
+            try:
+                return WhisperModel(self._cfg.model, local_files_only=True, **kwargs)
+            except OSError:
+                logger.info("Whisper model not cached in %s, downloading", cache_dir)
+        return WhisperModel(self._cfg.model, **kwargs)
+
     @property
     def is_loaded(self) -> bool:
         return self._model is not None
@@ -77,81 +108,95 @@ class Transcriber:
         if self._model is None:
             raise TranscriptionError("Model not loaded -- call load_model() first")
 
-        path = Path(audio_path)
-        if not path.exists():
+        path = os.fspath(audio_path)
+        if not os.path.isfile(path):
             raise TranscriptionError(f"Audio file not found: {path}")
+        name = os.path.basename(path)
 
-        logger.info("Transcribing %s (speaker=%s)", path.name, speaker_name)
+        logger.info("Transcribing %s (speaker=%s)", name, speaker_name)
         t0 = time.monotonic()
 
         try:
             language = None if self._cfg.language == "auto" else self._cfg.language
-            segments_iter, info = self._model.transcribe(
-                str(path),
-                language=language,
-                beam_size=self._cfg.beam_size,
-                vad_filter=self._cfg.vad_filter,
-            )
+            if self._batched is not None:
+                segments_iter, info = self._batched.transcribe(
+                    path,
+                    language=language,
+                    beam_size=self._cfg.beam_size,
+                    vad_filter=self._cfg.vad_filter,
+                    batch_size=self._cfg.batch_size,
+                )
+            else:
+                segments_iter, info = self._model.transcribe(
+                    path,
+                    language=language,
+                    beam_size=self._cfg.beam_size,
+                    vad_filter=self._cfg.vad_filter,
+                )
         except RuntimeError as exc:
             msg = str(exc)
             if "CUDA" in msg or "out of memory" in msg.lower():
                 raise TranscriptionError(
-                    f"GPU out of memory transcribing {path.name}. "
+                    f"GPU out of memory transcribing {name}. "
                     "Try a smaller model or reduce concurrent workload."
                 ) from exc
             raise TranscriptionError(
-                f"Whisper runtime error for {path.name}: {exc}"
+                f"Whisper runtime error for {name}: {exc}"
             ) from exc
         except ValueError as exc:
             raise TranscriptionError(
-                f"Invalid or corrupted audio file {path.name}: {exc}"
+                f"Invalid or corrupted audio file {name}: {exc}"
             ) from exc
         except Exception as exc:
             raise TranscriptionError(
-                f"Whisper transcription failed for {path.name}: {exc}"
+                f"Whisper transcription failed for {name}: {exc}"
             ) from exc
 
-        segments: list[Segment] = []
-        for seg in segments_iter:
-            text = seg.text.strip()
-            if text:
-                segments.append(Segment(
-                    start=seg.start,
-                    end=seg.end,
-                    text=text,
-                    speaker=speaker_name,
-                ))
+        # Whitespace-only segments are dropped; each text is stripped once
+        segments = [
+            Segment(start=seg.start, end=seg.end, text=text, speaker=speaker_name)
+            for seg in segments_iter
+            if (text := seg.text.strip())
+        ]
 
-        elapsed = time.monotonic() - t0
         logger.info(
             "Transcribed %s: %d segments in %.1fs (lang=%s, prob=%.2f)",
-            path.name,
+            name,
             len(segments),
-            elapsed,
+            time.monotonic() - t0,
             info.language,
             info.language_probability,
         )
         return segments
 
     def transcribe_all(self, tracks: list[SpeakerAudio]) -> list[Segment]:
-        """Transcribe all speaker audio tracks sequentially.
+        """Transcribe all speaker audio tracks.
 
-        Returns the combined (unsorted) list of segments from all tracks.
+        Up to ``max_parallel_tracks`` tracks are transcribed concurrently;
+        CTranslate2 releases the GIL during inference.  Segments are
+        returned grouped in track order (unsorted within the transcript).
         """
-        all_segments: list[Segment] = []
+        workers = min(self._cfg.max_parallel_tracks, len(tracks))
 
-        for i, track in enumerate(tracks, 1):
+        def _transcribe(i: int, track: SpeakerAudio) -> list[Segment]:
             logger.info(
                 "Transcribing speaker %d/%d: %s",
                 i,
                 len(tracks),
                 track.speaker.username,
             )
-            segments = self.transcribe_file(
+            return self.transcribe_file(
                 track.file_path,
                 speaker_name=track.speaker.username,
             )
-            all_segments.extend(segments)
+
+        if workers <= 1:
+            per_track = [_transcribe(i, t) for i, t in enumerate(tracks, 1)]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="whisper") as pool:
+                per_track = list(pool.map(_transcribe, range(1, len(tracks) + 1), tracks))
+
+        all_segments = [seg for segments in per_track for seg in segments]
 
         logger.info(
             "Transcription complete: %d total segments from %d speakers",
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from datetime import datetime, timedelta
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -227,7 +226,6 @@ class TestFetchEvent:
         c._service = None
         return c
 
-    @pytest.mark.asyncio
     async def test_fetch_event_single_match(self, client):
         """Mock API returns one event, it is selected."""
         raw = _make_raw_event(
@@ -246,7 +244,6 @@ class TestFetchEvent:
         assert result.error is None
         assert result.fetch_duration_sec >= 0
 
-    @pytest.mark.asyncio
     async def test_fetch_event_best_overlap(self, client):
         """Multiple events returned; the one with best overlap is selected."""
         # Event A: small overlap (only 15 min)
@@ -274,7 +271,6 @@ class TestFetchEvent:
         assert result.candidates_count == 2
         assert result.error is None
 
-    @pytest.mark.asyncio
     async def test_fetch_event_no_match(self, client):
         """Mock API returns empty list."""
         client._list_events_sync = MagicMock(return_value=[])
@@ -287,7 +283,6 @@ class TestFetchEvent:
         assert result.candidates_count == 0
         assert result.error is None
 
-    @pytest.mark.asyncio
     async def test_fetch_event_api_error(self, client):
         """Mock API raises; returns graceful result with error message."""
         client._list_events_sync = MagicMock(
@@ -304,7 +299,6 @@ class TestFetchEvent:
         assert "Network unreachable" in result.error
         assert result.fetch_duration_sec >= 0
 
-    @pytest.mark.asyncio
     async def test_fetch_event_never_raises(self, client):
         """Even unexpected errors (e.g., TypeError) return result, never raise."""
         client._list_events_sync = MagicMock(
@@ -322,7 +316,6 @@ class TestFetchEvent:
         assert result.error is not None
         assert "NoneType" in result.error
 
-    @pytest.mark.asyncio
     async def test_fetch_event_unparseable_events_skipped(self, client):
         """Events that fail to parse are skipped without error."""
         good = _make_raw_event(
@@ -342,7 +335,6 @@ class TestFetchEvent:
         assert result.candidates_count == 2
         assert result.error is None
 
-    @pytest.mark.asyncio
     async def test_fetch_event_tolerance_applied(self, client):
         """Verify that match_tolerance_minutes is applied to the query window."""
         call_args = {}
@@ -2,20 +2,30 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import os
 import textwrap
+from collections.abc import Callable, Iterator
 from pathlib import Path
 
 import pytest
 
-from src.config import Config, CalendarConfig, DiscordConfig, DriveFolderRoute, ExportGoogleDocsConfig, GuildConfig, GuildDriveConfig, TranscriptGlossaryConfig, load
+from src.config import Config, CalendarConfig, DiscordConfig, DriveFolderRoute, ExportGoogleDocsConfig, GuildConfig, GuildDriveConfig, TranscriptGlossaryConfig, clear_load_cache, load
 from src.errors import ConfigError
 
 
-def _write_config(tmp_path: Path, yaml_content: str) -> Path:
-    """Write a YAML config file and return its path."""
+def _write_config(tmp_path: Path, yaml_content: str | bytes) -> Path:
+    """Write a YAML config file and return its path.
+
+    Shared bodies are module-level ``bytes`` constants, dedented and encoded
+    once at import; one-off inline ``str`` bodies are dedented here.
+    """
     p = tmp_path / "config.yaml"
-    p.write_text(textwrap.dedent(yaml_content))
+    if isinstance(yaml_content, bytes):
+        p.write_bytes(yaml_content)
+    else:
+        p.write_text(textwrap.dedent(yaml_content))
     return p
 
 
@@ -26,15 +36,66 @@ def _write_env(tmp_path: Path, content: str) -> Path:
     return p
 
 
+@pytest.fixture(scope="session")
+def load_bytes(tmp_path_factory: pytest.TempPathFactory) -> Callable[..., Config]:
+    """Return a ``load()`` wrapper that takes YAML and .env bodies as bytes.
+
+    Each distinct body is written once per session, so tests sharing a body
+    share its file and, under the same environment, ``load()``'s memoized
+    result instead of parsing it again.
+    """
+    root = tmp_path_factory.mktemp("configs")
+
+    @functools.cache
+    def _path(body: bytes, name: str) -> str:
+        p = root / f"{hashlib.sha256(body).hexdigest()[:16]}-{name}"
+        p.write_bytes(body)
+        return str(p)
+
+    def _load(yaml_body: bytes, env_body: bytes = b"") -> Config:
+        env_path = _path(env_body, ".env") if env_body else str(root / "missing.env")
+        return load(_path(yaml_body, "config.yaml"), env_path)
+
+    return _load
+
+
+_MIN_CFG = textwrap.dedent("""
+    discord:
+      guild_id: 1
+      watch_channel_id: 2
+      output_channel_id: 3
+    """).encode()
+_API_WHISPER_CFG = _MIN_CFG + b"whisper:\n  backend: api\n"
+
+
+@pytest.fixture(scope="session")
+def ro_tmp(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Session-wide directory for tests that only build paths and never write."""
+    return tmp_path_factory.mktemp("ro")
+
+
+# Env vars that might interfere with tests
+_ENV_KEYS = frozenset({
+    "DISCORD_BOT_TOKEN", "DISCORD_TOKEN", "ANTHROPIC_API_KEY",
+    "WHISPER_MODEL", "WHISPER_DEVICE", "WHISPER_BACKEND",
+    "GENERATOR_MODEL", "LOGGING_LEVEL", "OPENAI_API_KEY",
+})
+
+
 @pytest.fixture(autouse=True)
-def _clean_env(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Remove env vars that might interfere with tests."""
-    for key in [
-        "DISCORD_BOT_TOKEN", "DISCORD_TOKEN", "ANTHROPIC_API_KEY",
-        "WHISPER_MODEL", "WHISPER_DEVICE", "WHISPER_BACKEND",
-        "GENERATOR_MODEL", "LOGGING_LEVEL", "OPENAI_API_KEY",
-    ]:
-        monkeypatch.delenv(key, raising=False)
+def _clean_env() -> Iterator[None]:
+    """Remove _ENV_KEYS for the test and restore the originals afterwards.
+
+    Values a test leaves behind (e.g. exported by ``load_dotenv``) are
+    dropped on teardown as well.
+    """
+    saved = {key: os.environ.pop(key, None) for key in _ENV_KEYS}
+    try:
+        yield
+    finally:
+        for key in _ENV_KEYS:
+            os.environ.pop(key, None)
+        os.environ.update({key: value for key, value in saved.items() if value is not None})
 
 
 class TestLoadValidConfig:
@@ -65,151 +126,184 @@ class TestLoadValidConfig:
         monkeypatch.setenv("DISCORD_BOT_TOKEN", "tok")
         monkeypatch.setenv("ANTHROPIC_API_KEY", "key")
 
-        cfg_path = _write_config(tmp_path, """
-            discord:
-              guild_id: 1
-              watch_channel_id: 2
-              output_channel_id: 3
-            """)
+        cfg_path = _write_config(tmp_path, _MIN_CFG)
         env_path = _write_env(tmp_path, "")
 
         cfg = load(str(cfg_path), str(env_path))
         assert cfg.craig.bot_id == "272937604339466240"
         assert cfg.craig.domain == "craig.chat"
         assert cfg.whisper.language == "ja"
+        assert cfg.whisper.compute_type == "float16"
+        assert cfg.whisper.batch_size == 1
         assert cfg.merger.gap_merge_threshold_sec == 1.0
         assert cfg.poster.embed_color == 0x5865F2
         assert cfg.logging.level == "INFO"
+        assert cfg.pipeline.max_concurrent == 2
 
-
-class TestEnvOverrides:
-    def test_whisper_model_override(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_changed_yaml_reloaded(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
         monkeypatch.setenv("DISCORD_BOT_TOKEN", "tok")
         monkeypatch.setenv("ANTHROPIC_API_KEY", "key")
-        monkeypatch.setenv("WHISPER_MODEL", "medium")
 
         cfg_path = _write_config(tmp_path, """
             discord:
               guild_id: 1
               watch_channel_id: 2
               output_channel_id: 3
+            whisper:
+              model: medium
             """)
         env_path = _write_env(tmp_path, "")
 
-        cfg = load(str(cfg_path), str(env_path))
-        assert cfg.whisper.model == "medium"
-
-    def test_dotenv_token(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-        cfg_path = _write_config(tmp_path, """
-            discord:
-              guild_id: 1
-              watch_channel_id: 2
-              output_channel_id: 3
-            """)
-        env_path = _write_env(tmp_path, """
-            DISCORD_BOT_TOKEN=from-dotenv
-            ANTHROPIC_API_KEY=key-from-dotenv
-            """)
+        assert load(str(cfg_path), str(env_path)).whisper.model == "medium"
 
-        cfg = load(str(cfg_path), str(env_path))
-        assert cfg.discord.token == "from-dotenv"
-        assert cfg.generator.api_key == "key-from-dotenv"
+        cfg_path.write_text(cfg_path.read_text().replace("medium", "small"))
+        assert load(str(cfg_path), str(env_path)).whisper.model == "small"
 
-    def test_discord_token_fallback(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-        """DISCORD_TOKEN works when DISCORD_BOT_TOKEN is not set."""
-        monkeypatch.setenv("DISCORD_TOKEN", "fallback-token")
+    def test_load_memoized_per_inputs(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("DISCORD_BOT_TOKEN", "tok")
         monkeypatch.setenv("ANTHROPIC_API_KEY", "key")
 
-        cfg_path = _write_config(tmp_path, """
-            discord:
-              guild_id: 1
-              watch_channel_id: 2
-              output_channel_id: 3
-            """)
+        cfg_path = _write_config(tmp_path, _MIN_CFG)
         env_path = _write_env(tmp_path, "")
 
-        cfg = load(str(cfg_path), str(env_path))
-        assert cfg.discord.token == "fallback-token"
+        first = load(str(cfg_path), str(env_path))
+        assert load(str(cfg_path), str(env_path)) is first
 
+        monkeypatch.setenv("WHISPER_MODEL", "small")
+        changed = load(str(cfg_path), str(env_path))
+        assert changed is not first
+        assert changed.whisper.model == "small"
 
-class TestValidation:
-    def test_missing_token(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-        cfg_path = _write_config(tmp_path, """
-            discord:
-              guild_id: 1
-              watch_channel_id: 2
-              output_channel_id: 3
+        clear_load_cache()
+        assert load(str(cfg_path), str(env_path)) is not changed
+
+    def test_load_memoized_with_dotenv(self, tmp_path: Path) -> None:
+        cfg_path = _write_config(tmp_path, _MIN_CFG)
+        env_path = _write_env(tmp_path, """
+            DISCORD_BOT_TOKEN=from-dotenv
+            ANTHROPIC_API_KEY=key-from-dotenv
             """)
-        env_path = _write_env(tmp_path, "")
 
-        with pytest.raises(ConfigError, match="discord.token"):
-            load(str(cfg_path), str(env_path))
+        first = load(str(cfg_path), str(env_path))
+        assert first.discord.token == "from-dotenv"
+        assert load(str(cfg_path), str(env_path)) is first
 
-    def test_invalid_guild_id(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.setenv("DISCORD_BOT_TOKEN", "tok")
-        monkeypatch.setenv("ANTHROPIC_API_KEY", "key")
 
-        cfg_path = _write_config(tmp_path, """
-            discord:
-              guild_id: 0
-              watch_channel_id: 2
-              output_channel_id: 3
-            """)
-        env_path = _write_env(tmp_path, "")
+_BOTH_KEYS = {"DISCORD_BOT_TOKEN": "tok", "ANTHROPIC_API_KEY": "key"}
 
-        with pytest.raises(ConfigError, match="guild_id"):
-            load(str(cfg_path), str(env_path))
 
-    def test_invalid_whisper_model(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.setenv("DISCORD_BOT_TOKEN", "tok")
-        monkeypatch.setenv("ANTHROPIC_API_KEY", "key")
+class TestEnvOverrides:
+    @pytest.mark.parametrize(
+        ("env", "section", "field", "expected"),
+        [
+            pytest.param(
+                {**_BOTH_KEYS, "WHISPER_MODEL": "medium"}, "whisper", "model", "medium",
+                id="whisper_model_override",
+            ),
+            pytest.param(
+                {"DISCORD_TOKEN": "fallback-token", "ANTHROPIC_API_KEY": "key"},
+                "discord", "token", "fallback-token",
+                id="discord_token_fallback",  # used when DISCORD_BOT_TOKEN is unset
+            ),
+        ],
+    )
+    def test_env_override(
+        self,
+        load_bytes: Callable[..., Config],
+        monkeypatch: pytest.MonkeyPatch,
+        env: dict[str, str],
+        section: str,
+        field: str,
+        expected: str,
+    ) -> None:
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+
+        cfg = load_bytes(_MIN_CFG)
+        assert getattr(getattr(cfg, section), field) == expected
 
-        cfg_path = _write_config(tmp_path, """
-            discord:
-              guild_id: 1
-              watch_channel_id: 2
-              output_channel_id: 3
-            whisper:
-              model: "not-a-real-model"
+    def test_dotenv_token(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        cfg_path = _write_config(tmp_path, _MIN_CFG)
+        env_path = _write_env(tmp_path, """
+            DISCORD_BOT_TOKEN=from-dotenv
+            ANTHROPIC_API_KEY=key-from-dotenv
             """)
-        env_path = _write_env(tmp_path, "")
 
-        with pytest.raises(ConfigError, match="whisper.model"):
-            load(str(cfg_path), str(env_path))
+        cfg = load(str(cfg_path), str(env_path))
+        assert cfg.discord.token == "from-dotenv"
+        assert cfg.generator.api_key == "key-from-dotenv"
 
-    def test_invalid_temperature(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_identical_bodies_load_once(
+        self, load_bytes: Callable[..., Config], monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
         monkeypatch.setenv("DISCORD_BOT_TOKEN", "tok")
         monkeypatch.setenv("ANTHROPIC_API_KEY", "key")
+        body = _MIN_CFG + b"# loaded once\n"
 
-        cfg_path = _write_config(tmp_path, """
-            discord:
-              guild_id: 1
-              watch_channel_id: 2
-              output_channel_id: 3
-            generator:
-              temperature: 1.5
-            """)
-        env_path = _write_env(tmp_path, "")
-
-        with pytest.raises(ConfigError, match="temperature"):
-            load(str(cfg_path), str(env_path))
-
-    def test_missing_config_file(self, tmp_path: Path) -> None:
-        with pytest.raises(ConfigError, match="Config file not found"):
-            load(str(tmp_path / "nonexistent.yaml"))
+        first = load_bytes(body)
+        assert load_bytes(body) is first
+        monkeypatch.setenv("WHISPER_MODEL", "medium")
+        assert load_bytes(body).whisper.model == "medium"
 
-    def test_empty_guilds_list(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.setenv("DISCORD_BOT_TOKEN", "tok")
-        monkeypatch.setenv("ANTHROPIC_API_KEY", "key")
+    def test_environment_beats_dotenv(
+        self, load_bytes: Callable[..., Config], monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setenv("DISCORD_BOT_TOKEN", "from-env")
+        cfg = load_bytes(_MIN_CFG, b"DISCORD_BOT_TOKEN=from-dotenv\nANTHROPIC_API_KEY=key\n")
+        assert cfg.discord.token == "from-env"
 
-        cfg_path = _write_config(tmp_path, """
-            discord:
-              guilds: []
-            """)
-        env_path = _write_env(tmp_path, "")
 
-        with pytest.raises(ConfigError, match="at least one guild"):
-            load(str(cfg_path), str(env_path))
+class TestValidation:
+    @pytest.mark.parametrize(
+        ("yaml_body", "env", "match"),
+        [
+            pytest.param(_MIN_CFG, {}, "discord.token", id="missing_token"),
+            pytest.param(
+                _MIN_CFG.replace(b"guild_id: 1", b"guild_id: 0"), _BOTH_KEYS, "guild_id",
+                id="invalid_guild_id",
+            ),
+            pytest.param(
+                _MIN_CFG + b'whisper:\n  model: "not-a-real-model"\n', _BOTH_KEYS, "whisper.model",
+                id="invalid_whisper_model",
+            ),
+            pytest.param(
+                _MIN_CFG + b"generator:\n  temperature: 1.5\n", _BOTH_KEYS, "temperature",
+                id="invalid_temperature",
+            ),
+            pytest.param(
+                _MIN_CFG + b"pipeline:\n  max_concurrent: 0\n", _BOTH_KEYS, "pipeline.max_concurrent",
+                id="invalid_max_concurrent",
+            ),
+            pytest.param(
+                _MIN_CFG + b"whisper:\n  batch_size: 8\n  vad_filter: false\n", _BOTH_KEYS,
+                "requires whisper.vad_filter",
+                id="batched_without_vad",
+            ),
+            pytest.param(
+                b"discord:\n  guilds: []\n", _BOTH_KEYS, "at least one guild",
+                id="empty_guilds_list",
+            ),
+        ],
+    )
+    def test_invalid_config_rejected(
+        self,
+        load_bytes: Callable[..., Config],
+        monkeypatch: pytest.MonkeyPatch,
+        yaml_body: bytes,
+        env: dict[str, str],
+        match: str,
+    ) -> None:
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+
+        with pytest.raises(ConfigError, match=match):
+            load_bytes(yaml_body)
+
+    def test_missing_config_file(self, ro_tmp: Path) -> None:
+        with pytest.raises(ConfigError, match="Config file not found"):
+            load(str(ro_tmp / "nonexistent.yaml"))
 
 
 class TestGeneratorBackend:
@@ -217,12 +311,7 @@ class TestGeneratorBackend:
         monkeypatch.setenv("DISCORD_BOT_TOKEN", "tok")
         monkeypatch.setenv("ANTHROPIC_API_KEY", "key")
 
-        cfg_path = _write_config(tmp_path, """
-            discord:
-              guild_id: 1
-              watch_channel_id: 2
-              output_channel_id: 3
-            """)
+        cfg_path = _write_config(tmp_path, _MIN_CFG)
         env_path = _write_env(tmp_path, "")
 
         cfg = load(str(cfg_path), str(env_path))
@@ -424,12 +513,7 @@ class TestMultiGuild:
         monkeypatch.setenv("DISCORD_BOT_TOKEN", "tok")
         monkeypatch.setenv("ANTHROPIC_API_KEY", "key")
 
-        cfg_path = _write_config(tmp_path, """
-            discord:
-              guild_id: 1
-              watch_channel_id: 2
-              output_channel_id: 3
-            """)
+        cfg_path = _write_config(tmp_path, _MIN_CFG)
         env_path = _write_env(tmp_path, "")
 
         cfg = load(str(cfg_path), str(env_path))
@@ -458,12 +542,7 @@ class TestMultiGuild:
         monkeypatch.setenv("DISCORD_BOT_TOKEN", "tok")
         monkeypatch.setenv("ANTHROPIC_API_KEY", "key")
 
-        cfg_path = _write_config(tmp_path, """
-            discord:
-              guild_id: 1
-              watch_channel_id: 2
-              output_channel_id: 3
-            """)
+        cfg_path = _write_config(tmp_path, _MIN_CFG)
         env_path = _write_env(tmp_path, "")
 
         cfg = load(str(cfg_path), str(env_path))
@@ -797,12 +876,7 @@ class TestWhisperBackend:
         monkeypatch.setenv("DISCORD_BOT_TOKEN", "tok")
         monkeypatch.setenv("ANTHROPIC_API_KEY", "key")
 
-        cfg_path = _write_config(tmp_path, """
-            discord:
-              guild_id: 1
-              watch_channel_id: 2
-              output_channel_id: 3
-            """)
+        cfg_path = _write_config(tmp_path, _MIN_CFG)
         env_path = _write_env(tmp_path, "")
 
         cfg = load(str(cfg_path), str(env_path))
@@ -813,14 +887,7 @@ class TestWhisperBackend:
         monkeypatch.setenv("ANTHROPIC_API_KEY", "key")
         monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
 
-        cfg_path = _write_config(tmp_path, """
-            discord:
-              guild_id: 1
-              watch_channel_id: 2
-              output_channel_id: 3
-            whisper:
-              backend: api
-            """)
+        cfg_path = _write_config(tmp_path, _API_WHISPER_CFG)
         env_path = _write_env(tmp_path, "")
 
         cfg = load(str(cfg_path), str(env_path))
@@ -847,14 +914,7 @@ class TestWhisperBackend:
         monkeypatch.setenv("DISCORD_BOT_TOKEN", "tok")
         monkeypatch.setenv("ANTHROPIC_API_KEY", "key")
 
-        cfg_path = _write_config(tmp_path, """
-            discord:
-              guild_id: 1
-              watch_channel_id: 2
-              output_channel_id: 3
-            whisper:
-              backend: api
-            """)
+        cfg_path = _write_config(tmp_path, _API_WHISPER_CFG)
         env_path = _write_env(tmp_path, "")
 
         with pytest.raises(ConfigError, match="OPENAI_API_KEY"):
@@ -866,12 +926,7 @@ class TestExportGoogleDocsConfig:
         monkeypatch.setenv("DISCORD_BOT_TOKEN", "tok")
         monkeypatch.setenv("ANTHROPIC_API_KEY", "key")
 
-        cfg_path = _write_config(tmp_path, """
-            discord:
-              guild_id: 1
-              watch_channel_id: 2
-              output_channel_id: 3
-            """)
+        cfg_path = _write_config(tmp_path, _MIN_CFG)
         env_path = _write_env(tmp_path, "")
 
         cfg = load(str(cfg_path), str(env_path))
@@ -901,12 +956,7 @@ class TestCalendarConfig:
         monkeypatch.setenv("DISCORD_BOT_TOKEN", "tok")
         monkeypatch.setenv("ANTHROPIC_API_KEY", "key")
 
-        cfg_path = _write_config(tmp_path, """
-            discord:
-              guild_id: 1
-              watch_channel_id: 2
-              output_channel_id: 3
-            """)
+        cfg_path = _write_config(tmp_path, _MIN_CFG)
         env_path = _write_env(tmp_path, "")
 
         cfg = load(str(cfg_path), str(env_path))
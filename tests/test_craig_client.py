@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import io
+import json
 import zipfile
 from pathlib import Path
 
 import pytest
+import pytest_asyncio
 import aiohttp
 from aioresponses import aioresponses
 
@@ -33,6 +37,30 @@ def recording() -> DetectedRecording:
     )
 
 
+@pytest.fixture(autouse=True)
+def _fast_sleep(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Make poll/retry backoff sleeps yield without waiting on the wall clock.
+
+    Returns the list of requested delays.
+    """
+    real_sleep = asyncio.sleep
+    delays: list[float] = []
+
+    async def _no_wait(delay: float, result=None):
+        delays.append(delay)
+        return await real_sleep(0, result)
+
+    monkeypatch.setattr("src.craig_client.asyncio.sleep", _no_wait)
+    return delays
+
+
+@pytest_asyncio.fixture(scope="module")
+async def http_session():
+    """One ClientSession for the module; aioresponses intercepts every request."""
+    async with aiohttp.ClientSession() as session:
+        yield session
+
+
 @pytest.fixture
 def cfg() -> CraigConfig:
     return CraigConfig(
@@ -42,36 +70,37 @@ def cfg() -> CraigConfig:
 
 
 def _make_zip(files: dict[str, bytes]) -> bytes:
-    """Create an in-memory ZIP file with the given filename->content mapping."""
+    """Create an in-memory ZIP file with the given filename->content mapping.
+
+    Members are stored uncompressed; the blobs are tiny and read right back.
+    """
     buf = io.BytesIO()
-    with zipfile.ZipFile(buf, "w") as zf:
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_STORED) as zf:
         for name, data in files.items():
             zf.writestr(name, data)
     return buf.getvalue()
 
 
-def _job_response(
-    status: str = "complete",
-    output_filename: str = "abc123.aac.zip",
-    state_type: str = "finalizing",
-) -> dict:
-    """Build a Craig Job API response."""
-    resp: dict = {
-        "job": {
-            "id": "abc123",
-            "type": "recording",
-            "options": {"format": "aac", "container": "zip", "dynaudnorm": False},
-            "status": status,
-            "state": {"type": state_type},
-            "continued": False,
-        },
-        "streamOpen": False,
-    }
-    if status == "complete":
-        resp["job"]["outputFileName"] = output_filename
-        resp["job"]["outputSize"] = 1005512
-        resp["job"]["finishedAt"] = "2026-02-10T00:25:12.957Z"
-    return resp
+# ZIP payloads are immutable bytes, so each is built once per session
+
+@pytest.fixture(scope="session")
+def zip_single_speaker() -> bytes:
+    return _make_zip({"1-shake344.aac": b"audio"})
+
+
+@pytest.fixture(scope="session")
+def zip_three_speakers() -> bytes:
+    return _make_zip({
+        "1-shake344.aac": b"fake audio 1",
+        "2-john_doe.aac": b"fake audio 2",
+        "3-tanaka_san.aac": b"fake audio 3",
+        "info.txt": b"metadata",
+    })
+
+
+@pytest.fixture(scope="session")
+def zip_info_only() -> bytes:
+    return _make_zip({"info.txt": b"no audio"})
 
 
 # URLs used across tests
@@ -80,11 +109,47 @@ _DL_FILENAME = "abc123.aac.zip"
 _DL_URL = f"https://craig.horse/dl/{_DL_FILENAME}"
 
 
+# Craig Job API responses.  Variants share the static fields of _BASE_JOB;
+# tests that need to mutate one take a deep copy.
+_BASE_JOB: dict = {
+    "job": {
+        "id": "abc123",
+        "type": "recording",
+        "options": {"format": "aac", "container": "zip", "dynaudnorm": False},
+        "continued": False,
+    },
+    "streamOpen": False,
+}
+_JOB_COMPLETE: dict = {**_BASE_JOB, "job": {
+    **_BASE_JOB["job"],
+    "status": "complete",
+    "state": {"type": "finalizing"},
+    "outputFileName": _DL_FILENAME,
+    "outputSize": 1005512,
+    "finishedAt": "2026-02-10T00:25:12.957Z",
+}}
+_JOB_PENDING: dict = {**_BASE_JOB, "job": {
+    **_BASE_JOB["job"], "status": "pending", "state": {"type": "cooking"},
+}}
+_JOB_ERROR: dict = {**_BASE_JOB, "job": {
+    **_BASE_JOB["job"], "status": "error", "state": {"type": "error"},
+}}
+
+# Encoded once; aioresponses would re-encode a ``payload=`` dict on every
+# registration
+_PAYLOAD_COMPLETE = json.dumps(_JOB_COMPLETE).encode()
+_PAYLOAD_PENDING = json.dumps(_JOB_PENDING).encode()
+_PAYLOAD_ERROR = json.dumps(_JOB_ERROR).encode()
+
+
+def _mock_job_json(mocked: aioresponses, body: bytes) -> None:
+    mocked.get(_JOB_URL, body=body, content_type="application/json")
+
+
 def _mock_job_flow(
     mocked: aioresponses,
     *,
     zip_data: bytes | None = None,
-    dl_filename: str = _DL_FILENAME,
     poll_pending_count: int = 0,
     post_status: int = 200,
 ) -> None:
@@ -94,15 +159,14 @@ def _mock_job_flow(
 
     # Pending polls before completion
     for _ in range(poll_pending_count):
-        mocked.get(_JOB_URL, payload=_job_response(status="pending", state_type="cooking"))
+        _mock_job_json(mocked, _PAYLOAD_PENDING)
 
     # Final: complete
-    mocked.get(_JOB_URL, payload=_job_response(output_filename=dl_filename))
+    _mock_job_json(mocked, _PAYLOAD_COMPLETE)
 
     # File download
     if zip_data is not None:
-        dl_url = f"https://craig.horse/dl/{dl_filename}"
-        mocked.get(dl_url, body=zip_data)
+        mocked.get(_DL_URL, body=zip_data)
 
 
 # --- ZIP filename pattern ---
@@ -128,93 +192,81 @@ def test_zip_pattern_no_match() -> None:
 
 # --- POST job start ---
 
-@pytest.mark.asyncio
 async def test_start_job_sends_post_with_format(
     recording: DetectedRecording,
     cfg: CraigConfig,
     tmp_path: Path,
+    zip_single_speaker: bytes,
+    http_session: aiohttp.ClientSession,
 ) -> None:
     """download() sends a POST to start the cook job before polling."""
-    zip_data = _make_zip({"1-alice.aac": b"audio"})
+    client = CraigClient(http_session, recording, cfg)
+
+    with aioresponses() as mocked:
+        _mock_job_flow(mocked, zip_data=zip_single_speaker)
+        await client.download(tmp_path)
+
+        # Verify POST was sent (first request in the history)
+        history = mocked.requests
+        post_calls = [
+            (key, calls)
+            for key, calls in history.items()
+            if key[0] == "POST"
+        ]
+        assert len(post_calls) == 1
+        _, calls = post_calls[0]
+        assert len(calls) == 1
+        body = calls[0].kwargs.get("json", {})
+        assert body["type"] == "recording"
+        assert body["options"]["format"] == "aac"
+        assert body["options"]["container"] == "zip"
+        assert body["options"]["dynaudnorm"] is False
 
-    async with aiohttp.ClientSession() as session:
-        client = CraigClient(session, recording, cfg)
-
-        with aioresponses() as mocked:
-            _mock_job_flow(mocked, zip_data=zip_data)
-            await client.download(tmp_path)
 
-            # Verify POST was sent (first request in the history)
-            history = mocked.requests
-            post_calls = [
-                (key, calls)
-                for key, calls in history.items()
-                if key[0] == "POST"
-            ]
-            assert len(post_calls) == 1
-            _, calls = post_calls[0]
-            assert len(calls) == 1
-            body = calls[0].kwargs.get("json", {})
-            assert body["type"] == "recording"
-            assert body["options"]["format"] == "aac"
-            assert body["options"]["container"] == "zip"
-            assert body["options"]["dynaudnorm"] is False
-
-
-@pytest.mark.asyncio
 async def test_start_job_failure_non_fatal(
     recording: DetectedRecording,
     cfg: CraigConfig,
     tmp_path: Path,
+    zip_single_speaker: bytes,
+    http_session: aiohttp.ClientSession,
 ) -> None:
     """POST failure should not block polling — job may already be running."""
-    zip_data = _make_zip({"1-alice.aac": b"audio"})
+    client = CraigClient(http_session, recording, cfg)
 
-    async with aiohttp.ClientSession() as session:
-        client = CraigClient(session, recording, cfg)
-
-        with aioresponses() as mocked:
-            # POST returns 500 but polling still succeeds
-            _mock_job_flow(mocked, zip_data=zip_data, post_status=500)
-            results = await client.download(tmp_path)
+    with aioresponses() as mocked:
+        # POST returns 500 but polling still succeeds
+        _mock_job_flow(mocked, zip_data=zip_single_speaker, post_status=500)
+        results = await client.download(tmp_path)
 
     assert len(results) == 1
 
 
 # --- get_speakers (now raises NotImplementedError) ---
 
-@pytest.mark.asyncio
 async def test_get_speakers_raises(
     recording: DetectedRecording,
     cfg: CraigConfig,
+    http_session: aiohttp.ClientSession,
 ) -> None:
-    async with aiohttp.ClientSession() as session:
-        client = CraigClient(session, recording, cfg)
-        with pytest.raises(NotImplementedError):
-            await client.get_speakers()
+    client = CraigClient(http_session, recording, cfg)
+    with pytest.raises(NotImplementedError):
+        await client.get_speakers()
 
 
 # --- download (job poll + download flow) ---
 
-@pytest.mark.asyncio
 async def test_download_success(
     recording: DetectedRecording,
     cfg: CraigConfig,
     tmp_path: Path,
+    zip_three_speakers: bytes,
+    http_session: aiohttp.ClientSession,
 ) -> None:
-    zip_data = _make_zip({
-        "1-shake344.aac": b"fake audio 1",
-        "2-john_doe.aac": b"fake audio 2",
-        "3-tanaka_san.aac": b"fake audio 3",
-        "info.txt": b"metadata",
-    })
-
-    async with aiohttp.ClientSession() as session:
-        client = CraigClient(session, recording, cfg)
+    client = CraigClient(http_session, recording, cfg)
 
-        with aioresponses() as mocked:
-            _mock_job_flow(mocked, zip_data=zip_data)
-            results = await client.download(tmp_path)
+    with aioresponses() as mocked:
+        _mock_job_flow(mocked, zip_data=zip_three_speakers)
+        results = await client.download(tmp_path)
 
     assert len(results) == 3
     assert all(isinstance(r, SpeakerAudio) for r in results)
@@ -224,96 +276,109 @@ async def test_download_success(
     assert results[0].speaker.user_id == 0  # no user API, always 0
     assert results[0].file_path.exists()
     assert results[0].file_path.read_bytes() == b"fake audio 1"
+    # The downloaded archive itself is removed after extraction
+    assert not list(tmp_path.glob("*.zip"))
 
 
-@pytest.mark.asyncio
 async def test_download_with_polling(
     recording: DetectedRecording,
     cfg: CraigConfig,
     tmp_path: Path,
+    zip_single_speaker: bytes,
+    http_session: aiohttp.ClientSession,
 ) -> None:
     """Job is not ready immediately, requires polling."""
-    zip_data = _make_zip({"1-shake344.aac": b"audio"})
+    client = CraigClient(http_session, recording, cfg)
 
-    async with aiohttp.ClientSession() as session:
-        client = CraigClient(session, recording, cfg)
-
-        with aioresponses() as mocked:
-            _mock_job_flow(mocked, zip_data=zip_data, poll_pending_count=2)
-            results = await client.download(tmp_path)
+    with aioresponses() as mocked:
+        _mock_job_flow(mocked, zip_data=zip_single_speaker, poll_pending_count=2)
+        results = await client.download(tmp_path)
 
     assert len(results) == 1
     assert results[0].speaker.username == "shake344"
 
 
-@pytest.mark.asyncio
-async def test_download_empty_zip(
+async def test_poll_interval_backs_off(
     recording: DetectedRecording,
     cfg: CraigConfig,
     tmp_path: Path,
+    zip_single_speaker: bytes,
+    http_session: aiohttp.ClientSession,
+    _fast_sleep: list[float],
 ) -> None:
-    zip_data = _make_zip({"info.txt": b"no audio"})
+    client = CraigClient(http_session, recording, cfg)
+
+    with aioresponses() as mocked:
+        _mock_job_flow(mocked, zip_data=zip_single_speaker, poll_pending_count=3)
+        await client.download(tmp_path)
+
+    assert len(_fast_sleep) == 3
+    assert _fast_sleep[0] < _fast_sleep[-1]
 
-    async with aiohttp.ClientSession() as session:
-        client = CraigClient(session, recording, cfg)
 
-        with aioresponses() as mocked:
-            _mock_job_flow(mocked, zip_data=zip_data)
+async def test_download_empty_zip(
+    recording: DetectedRecording,
+    cfg: CraigConfig,
+    tmp_path: Path,
+    zip_info_only: bytes,
+    http_session: aiohttp.ClientSession,
+) -> None:
+    client = CraigClient(http_session, recording, cfg)
+
+    with aioresponses() as mocked:
+        _mock_job_flow(mocked, zip_data=zip_info_only)
 
-            with pytest.raises(AudioAcquisitionError, match="No audio files"):
-                await client.download(tmp_path)
+        with pytest.raises(AudioAcquisitionError, match="No audio files"):
+            await client.download(tmp_path)
 
 
-@pytest.mark.asyncio
 async def test_download_invalid_zip(
     recording: DetectedRecording,
     cfg: CraigConfig,
     tmp_path: Path,
+    http_session: aiohttp.ClientSession,
 ) -> None:
-    async with aiohttp.ClientSession() as session:
-        client = CraigClient(session, recording, cfg)
+    client = CraigClient(http_session, recording, cfg)
 
-        with aioresponses() as mocked:
-            _mock_job_flow(mocked, zip_data=b"this is not a zip file")
+    with aioresponses() as mocked:
+        _mock_job_flow(mocked, zip_data=b"this is not a zip file")
 
-            with pytest.raises(AudioAcquisitionError, match="Invalid ZIP"):
-                await client.download(tmp_path)
+        with pytest.raises(AudioAcquisitionError, match="Invalid ZIP"):
+            await client.download(tmp_path)
 
 
-@pytest.mark.asyncio
 async def test_download_job_failed(
     recording: DetectedRecording,
     cfg: CraigConfig,
     tmp_path: Path,
+    http_session: aiohttp.ClientSession,
 ) -> None:
     """Job reports error status -> should raise immediately."""
-    async with aiohttp.ClientSession() as session:
-        client = CraigClient(session, recording, cfg)
+    client = CraigClient(http_session, recording, cfg)
 
-        with aioresponses() as mocked:
-            mocked.post(_JOB_URL, status=200)
-            mocked.get(_JOB_URL, payload=_job_response(status="error", state_type="error"))
+    with aioresponses() as mocked:
+        mocked.post(_JOB_URL, status=200)
+        _mock_job_json(mocked, _PAYLOAD_ERROR)
 
-            with pytest.raises(AudioAcquisitionError, match="Cook job failed"):
-                await client.download(tmp_path)
+        with pytest.raises(AudioAcquisitionError, match="Cook job failed"):
+            await client.download(tmp_path)
 
 
-@pytest.mark.asyncio
 async def test_download_job_no_output_filename(
     recording: DetectedRecording,
     cfg: CraigConfig,
     tmp_path: Path,
+    http_session: aiohttp.ClientSession,
 ) -> None:
     """Job complete but outputFileName missing -> should raise."""
-    response = _job_response()
+    response = copy.deepcopy(_JOB_COMPLETE)
     del response["job"]["outputFileName"]
 
-    async with aiohttp.ClientSession() as session:
-        client = CraigClient(session, recording, cfg)
+    client = CraigClient(http_session, recording, cfg)
 
-        with aioresponses() as mocked:
-            mocked.post(_JOB_URL, status=200)
-            mocked.get(_JOB_URL, payload=response)
+    with aioresponses() as mocked:
+        mocked.post(_JOB_URL, status=200)
+        mocked.get(_JOB_URL, payload=response)
 
-            with pytest.raises(AudioAcquisitionError, match="no outputFileName"):
-                await client.download(tmp_path)
+        with pytest.raises(AudioAcquisitionError, match="no outputFileName"):
+            await client.download(tmp_path)
@@ -10,6 +10,7 @@ from src.detector import (
     is_craig_message,
     is_recording_ended,
     parse_recording_ended,
+    recording_from_match,
 )
 
 WATCH_CHANNEL = 1111111111111111111
@@ -54,6 +55,14 @@ def test_is_recording_ended_missing_key() -> None:
     assert is_recording_ended({}) is False
 
 
+def test_is_recording_ended_nested_text() -> None:
+    payload = {"components": [{"type": 17, "components": [
+        {"type": 10, "id": 3},
+        {"type": 10, "content": "**Recording ended.**"},
+    ]}]}
+    assert is_recording_ended(payload) is True
+
+
 # --- extract_recording_info ---
 
 
@@ -80,6 +89,25 @@ def test_extract_recording_info_no_url() -> None:
     assert result is None
 
 
+def test_extract_recording_info_from_embed() -> None:
+    payload = {
+        "content": "",
+        "embeds": [{"description": "Download: https://craig.horse/rec/xyz789?key=KEY42"}],
+    }
+    result = extract_recording_info(payload, 1, 2, 3)
+    assert result is not None
+    assert result.rec_id == "xyz789"
+    assert result.access_key == "KEY42"
+    assert result.rec_url == "https://craig.horse/rec/xyz789?key=KEY42"
+
+
+def test_extract_recording_info_normalizes_http() -> None:
+    payload = {"content": "http://craig.chat/rec/abc123?key=K1", "embeds": []}
+    result = extract_recording_info(payload, 1, 2, 3)
+    assert result is not None
+    assert result.rec_url == "https://craig.chat/rec/abc123?key=K1"
+
+
 # --- RECORDING_URL_PATTERN ---
 
 
@@ -105,6 +133,31 @@ def test_url_pattern_no_match() -> None:
     assert RECORDING_URL_PATTERN.search("https://example.com/rec/x?key=y") is None
 
 
+def test_extract_first_url_in_payload_order() -> None:
+    payload = {
+        "content": "https://craig.chat/rec/",  # truncated, must not join the next string
+        "embeds": [{"description": "abc123?key=NOPE"}],
+        "components": [{"content": "https://craig.horse/rec/first1?key=K1"},
+                       {"content": "https://craig.chat/rec/second2?key=K2"}],
+    }
+    result = extract_recording_info(payload, channel_id=2, guild_id=1, message_id=3)
+    assert result is not None
+    assert result.rec_id == "first1"
+
+
+def test_recording_from_match() -> None:
+    match = RECORDING_URL_PATTERN.search(
+        "see https://craig.horse/rec/def456?key=ABC123 for audio"
+    )
+    assert match is not None
+    result = recording_from_match(match, channel_id=2, guild_id=1, message_id=0)
+    assert result.rec_id == "def456"
+    assert result.access_key == "ABC123"
+    assert result.craig_domain == "craig.horse"
+    assert result.rec_url == "https://craig.horse/rec/def456?key=ABC123"
+    assert (result.guild_id, result.channel_id, result.message_id) == (1, 2, 0)
+
+
 # --- parse_recording_ended (integration of all checks) ---
 
 
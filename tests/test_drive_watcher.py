@@ -5,6 +5,8 @@ from __future__ import annotations
 import asyncio
 import io
 import json
+import re
+import tracemalloc
 import zipfile
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -14,7 +16,7 @@ import pytest
 from src.audio_source import SpeakerAudio, SpeakerInfo
 from src.config import GoogleDriveConfig
 from src.audio_source import ZIP_FILENAME_PATTERN
-from src.drive_watcher import DriveWatcher
+from src.drive_watcher import DriveWatcher, _build_list_query, _compile_name_matcher
 from src.errors import DriveWatchError
 from src.state_store import StateStore
 
@@ -42,14 +44,48 @@ def _make_state_store(tmp_path: Path) -> StateStore:
 
 
 def _make_zip(files: dict[str, bytes]) -> bytes:
-    """Create an in-memory ZIP file with the given filename->content mapping."""
+    """Create an in-memory ZIP file with the given filename->content mapping.
+
+    Members are stored uncompressed; the blobs are tiny and read right back.
+    """
     buf = io.BytesIO()
-    with zipfile.ZipFile(buf, "w") as zf:
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_STORED) as zf:
         for name, data in files.items():
             zf.writestr(name, data)
     return buf.getvalue()
 
 
+# Canonical ZIP payloads are immutable bytes, so each is built once per session
+
+@pytest.fixture(scope="session")
+def alice_bob_zip() -> bytes:
+    return _make_zip({"1-alice.aac": b"audio alice", "2-bob.aac": b"audio bob"})
+
+
+@pytest.fixture(scope="session")
+def alice_only_zip() -> bytes:
+    return _make_zip({"1-alice.aac": b"audio alice"})
+
+
+@pytest.fixture(scope="session")
+def mixed_zip() -> bytes:
+    return _make_zip({
+        "1-alice.aac": b"audio",
+        "info.json": b"{}",
+        "2-bob.flac": b"audio flac",
+        "README.md": b"# readme",
+        "metadata.txt": b"data",
+    })
+
+
+def _fake_download(zip_bytes: bytes):
+    """Return a _download_file_sync replacement that writes *zip_bytes*."""
+    def _download(file_id: str, file_name: str, dest_path: Path) -> Path:
+        dest_path.write_bytes(zip_bytes)
+        return dest_path
+    return _download
+
+
 def _make_watcher(
     cfg: GoogleDriveConfig,
     state_store: StateStore,
@@ -68,14 +104,9 @@ def _make_watcher(
 class TestZipExtraction:
     """Tests for DriveWatcher._extract_zip (static method)."""
 
-    def test_valid_craig_zip(self, tmp_path: Path) -> None:
+    def test_valid_craig_zip(self, tmp_path: Path, alice_bob_zip: bytes) -> None:
         """ZIP with standard Craig entries produces correct SpeakerAudio list."""
-        zip_bytes = _make_zip({
-            "1-alice.aac": b"audio data alice",
-            "2-bob.aac": b"audio data bob",
-        })
-
-        results = DriveWatcher._extract_zip(zip_bytes, tmp_path)
+        results = DriveWatcher._extract_zip(alice_bob_zip, tmp_path)
 
         assert len(results) == 2
         assert all(isinstance(r, SpeakerAudio) for r in results)
@@ -85,13 +116,55 @@ class TestZipExtraction:
         assert results[0].speaker.username == "alice"
         assert results[0].speaker.user_id == 0
         assert results[0].file_path == tmp_path / "1-alice.aac"
-        assert results[0].file_path.read_bytes() == b"audio data alice"
+        assert results[0].file_path.read_bytes() == b"audio alice"
 
         # Check second speaker
         assert results[1].speaker.track == 2
         assert results[1].speaker.username == "bob"
         assert results[1].file_path == tmp_path / "2-bob.aac"
-        assert results[1].file_path.read_bytes() == b"audio data bob"
+        assert results[1].file_path.read_bytes() == b"audio bob"
+
+    def test_large_member_streams(self, tmp_path: Path) -> None:
+        """A track far larger than the copy chunk is never held in memory whole."""
+        chunk = b"\x00" * (1 << 20)
+        archive = tmp_path / "craig.zip"
+        with zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_STORED) as zf:
+            with zf.open("1-alice.aac", "w", force_zip64=True) as member:
+                for _ in range(32):
+                    member.write(chunk)
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+
+        tracemalloc.start()
+        try:
+            results = DriveWatcher._extract_zip(archive, out_dir)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert results[0].file_path.stat().st_size == 32 << 20
+        assert peak < 8 << 20
+
+    @pytest.mark.parametrize("from_path", [False, True])
+    def test_parallel_extraction(self, tmp_path: Path, from_path: bool) -> None:
+        """Many tracks are extracted intact and returned in archive order."""
+        tracks = {f"{i}-user{i}.flac": bytes([i]) * (256 << 10) for i in range(1, 9)}
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            for name, data in tracks.items():
+                zf.writestr(name, data)
+        source: bytes | Path = buf.getvalue()
+        if from_path:
+            source = tmp_path / "craig.zip"
+            source.write_bytes(buf.getvalue())
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+
+        results = DriveWatcher._extract_zip(source, out_dir)
+
+        assert [r.speaker.track for r in results] == list(range(1, 9))
+        for r in results:
+            assert r.file_path.read_bytes() == tracks[r.file_path.name]
 
     def test_empty_zip(self, tmp_path: Path) -> None:
         """ZIP with no matching audio entries returns empty list."""
@@ -104,22 +177,28 @@ class TestZipExtraction:
 
         assert results == []
 
-    def test_mixed_entries(self, tmp_path: Path) -> None:
+    def test_mixed_entries(self, tmp_path: Path, mixed_zip: bytes) -> None:
         """Only entries matching the track-username.ext pattern are extracted."""
-        zip_bytes = _make_zip({
-            "1-alice.aac": b"audio",
-            "info.json": b"{}",
-            "2-bob.flac": b"audio flac",
-            "README.md": b"# readme",
-            "metadata.txt": b"data",
-        })
-
-        results = DriveWatcher._extract_zip(zip_bytes, tmp_path)
+        results = DriveWatcher._extract_zip(mixed_zip, tmp_path)
 
         assert len(results) == 2
         usernames = {r.speaker.username for r in results}
         assert usernames == {"alice", "bob"}
 
+    def test_traversal_entries_stay_in_dest(self, tmp_path: Path) -> None:
+        """Directory components are dropped and backslash names are blocked."""
+        dest = tmp_path / "out"
+        dest.mkdir()
+        zip_bytes = _make_zip({
+            "../../1-alice.aac": b"audio alice",
+            "..\\..\\2-bob.aac": b"audio bob",
+        })
+
+        results = DriveWatcher._extract_zip(zip_bytes, dest)
+
+        assert [r.file_path for r in results] == [dest / "1-alice.aac"]
+        assert not (tmp_path / "1-alice.aac").exists()
+
     def test_bad_zip_raises(self, tmp_path: Path) -> None:
         """Invalid bytes raise DriveWatchError."""
         with pytest.raises(DriveWatchError, match="Invalid ZIP"):
@@ -135,22 +214,51 @@ class TestFilePatternMatching:
 
     def test_matching_pattern(self) -> None:
         """craig_12345.zip, craig-12345.aac.zip etc. match the default pattern."""
-        import fnmatch
-
-        pattern = "craig[_-]*.zip"
-        assert fnmatch.fnmatch("craig_12345.aac.zip", pattern) is True
-        assert fnmatch.fnmatch("craig_abc_def.aac.zip", pattern) is True
-        assert fnmatch.fnmatch("craig-Q92fATPSYVKt_2026-3-2.aac.zip", pattern) is True
-        assert fnmatch.fnmatch("craig-ElIRZgL22aDQ-2026-03-21.zip", pattern) is True
-        assert fnmatch.fnmatch("craig-IGseKiVHcOMb-2026-03-23.zip", pattern) is True
+        matches = _compile_name_matcher("craig[_-]*.zip")
+        assert matches("craig_12345.aac.zip") is True
+        assert matches("craig_abc_def.aac.zip") is True
+        assert matches("craig-Q92fATPSYVKt_2026-3-2.aac.zip") is True
+        assert matches("craig-ElIRZgL22aDQ-2026-03-21.zip") is True
+        assert matches("craig-IGseKiVHcOMb-2026-03-23.zip") is True
 
     def test_non_matching_pattern(self) -> None:
         """Files that don't match the pattern are rejected."""
+        matches = _compile_name_matcher("craig[_-]*.zip")
+        assert matches("random.zip") is False
+        assert matches("meeting_notes.aac.zip") is False
+
+    def test_pattern_compiled_once(self) -> None:
+        """Matching many names reuses the regex compiled up front."""
+        _compile_name_matcher.cache_clear()
+        with patch("src.drive_watcher.re.compile", wraps=re.compile) as spy:
+            matches = _compile_name_matcher("craig[_-]*.zip")
+            for i in range(100):
+                matches(f"craig_{i}.aac.zip")
+            assert _compile_name_matcher("craig[_-]*.zip") is matches
+        assert spy.call_count == 1
+
+    @pytest.mark.parametrize(
+        "pattern", ["craig_*.aac.zip", "craig[_-]*.zip", "ab*ba", "*.zip", "craig_*_?.aac.zip"]
+    )
+    def test_name_matcher_agrees_with_fnmatch(self, pattern: str) -> None:
         import fnmatch
 
-        pattern = "craig[_-]*.zip"
-        assert fnmatch.fnmatch("random.zip", pattern) is False
-        assert fnmatch.fnmatch("meeting_notes.aac.zip", pattern) is False
+        matches = _compile_name_matcher(pattern)
+        for name in (
+            "craig_12345.aac.zip", "craig-12345.zip", "craig_.aac.zip",
+            "aba", "abba", "abxba", "random.zip", "craig_x.aac.zip.bak",
+            "craig_x_1.aac.zip", "craig_x_12.aac.zip",
+        ):
+            assert matches(name) == fnmatch.fnmatchcase(name, pattern), name
+
+    def test_list_query_built_from_pattern(self) -> None:
+        """Literal glob segments become Drive 'name contains' clauses."""
+        query = _build_list_query("folder-1", "craig[_-]*.aac.zip")
+
+        assert query.startswith("'folder-1' in parents and trashed = false and (")
+        assert "name contains 'craig'" in query
+        assert "name contains '.aac.zip'" in query
+        assert "[_-]" not in query
 
 
 # ===========================================================================
@@ -170,6 +278,23 @@ class TestBuildService:
             watcher._build_service()
 
 
+class TestExecutor:
+    """Tests for the watcher's dedicated I/O thread pool."""
+
+    def test_sized_to_download_limit_and_shut_down_on_stop(self, tmp_path: Path) -> None:
+        cfg = _make_cfg(tmp_path, max_concurrent_downloads=3)
+        watcher = _make_watcher(cfg, _make_state_store(tmp_path))
+
+        executor = watcher._get_executor()
+        assert watcher._get_executor() is executor
+        assert executor._max_workers == 3
+
+        watcher.stop()
+        assert watcher._executor is None
+        with pytest.raises(RuntimeError):
+            executor.submit(lambda: None)
+
+
 # ===========================================================================
 # 12-13: Watch loop early-exit conditions
 # ===========================================================================
@@ -177,7 +302,6 @@ class TestBuildService:
 class TestWatchLoopEarlyExit:
     """Tests for _watch_loop pre-flight validation."""
 
-    @pytest.mark.asyncio
     async def test_empty_folder_id_exits(self, tmp_path: Path) -> None:
         """Loop returns immediately when folder_id is empty."""
         cfg = _make_cfg(tmp_path, folder_id="")
@@ -190,7 +314,6 @@ class TestWatchLoopEarlyExit:
         # Callback should never have been called
         assert watcher._on_new_tracks.call_count == 0
 
-    @pytest.mark.asyncio
     async def test_missing_credentials_exits(self, tmp_path: Path) -> None:
         """Loop returns immediately when credentials file does not exist."""
         cfg = _make_cfg(
@@ -212,20 +335,14 @@ class TestWatchLoopEarlyExit:
 class TestProcessFile:
     """Tests for _process_file."""
 
-    @pytest.mark.asyncio
-    async def test_callback_invoked(self, tmp_path: Path) -> None:
+    async def test_callback_invoked(self, tmp_path: Path, alice_bob_zip: bytes) -> None:
         """After download and extraction, callback is called with correct args."""
         cfg = _make_cfg(tmp_path)
         state_store = _make_state_store(tmp_path)
         callback = AsyncMock()
         watcher = DriveWatcher(cfg, state_store, on_new_tracks=callback)
 
-        zip_bytes = _make_zip({
-            "1-alice.aac": b"audio alice",
-            "2-bob.aac": b"audio bob",
-        })
-
-        with patch.object(watcher, "_download_file_sync", return_value=zip_bytes):
+        with patch.object(watcher, "_download_file_sync", side_effect=_fake_download(alice_bob_zip)):
             loop = asyncio.get_running_loop()
             await watcher._process_file(loop, "file-id-1", "craig_testTESTtest_2026.aac.zip")
 
@@ -247,17 +364,54 @@ class TestProcessFile:
         # Verify dest_path is a Path
         assert isinstance(dest_path, Path)
 
-    @pytest.mark.asyncio
-    async def test_marks_processed_on_success(self, tmp_path: Path) -> None:
+    async def test_archive_removed_before_callback(self, tmp_path: Path, alice_only_zip: bytes) -> None:
+        """The downloaded ZIP is deleted once tracks are extracted."""
+        cfg = _make_cfg(tmp_path)
+        state_store = _make_state_store(tmp_path)
+        seen: list[list[str]] = []
+
+        async def callback(tracks, source_label: str, dest_path: Path) -> None:
+            seen.append(sorted(p.name for p in dest_path.iterdir()))
+
+        watcher = DriveWatcher(cfg, state_store, on_new_tracks=callback)
+
+        with patch.object(watcher, "_download_file_sync", side_effect=_fake_download(alice_only_zip)):
+            loop = asyncio.get_running_loop()
+            await watcher._process_file(loop, "file-id-2", "craig_archiveRM1234_2026.aac.zip")
+
+        assert seen == [["1-alice.aac"]]
+
+    async def test_work_dirs_removed(self, tmp_path: Path, alice_only_zip: bytes) -> None:
+        """Each file gets a directory under the watcher's root; stop() removes the root."""
+        cfg = _make_cfg(tmp_path)
+        state_store = _make_state_store(tmp_path)
+        dirs: list[Path] = []
+
+        async def callback(tracks, source_label: str, dest_path: Path) -> None:
+            dirs.append(dest_path)
+
+        watcher = DriveWatcher(cfg, state_store, on_new_tracks=callback)
+
+        with patch.object(watcher, "_download_file_sync", side_effect=_fake_download(alice_only_zip)):
+            loop = asyncio.get_running_loop()
+            await watcher._process_file(loop, "file-id-3", "craig_workDIR12345_2026.aac.zip")
+
+        root = watcher._work_root
+        assert root is not None
+        assert dirs[0].parent == root
+        assert not dirs[0].exists()
+
+        watcher.stop()
+        assert not root.exists()
+
+    async def test_marks_processed_on_success(self, tmp_path: Path, alice_only_zip: bytes) -> None:
         """After successful callback, the rec_id is known in state_store."""
         cfg = _make_cfg(tmp_path)
         state_store = _make_state_store(tmp_path)
         callback = AsyncMock()
         watcher = DriveWatcher(cfg, state_store, on_new_tracks=callback)
 
-        zip_bytes = _make_zip({"1-alice.aac": b"audio"})
-
-        with patch.object(watcher, "_download_file_sync", return_value=zip_bytes):
+        with patch.object(watcher, "_download_file_sync", side_effect=_fake_download(alice_only_zip)):
             loop = asyncio.get_running_loop()
             await watcher._process_file(loop, "file-xyz", "craig_rec123456789_2026.aac.zip")
 
@@ -267,17 +421,14 @@ class TestProcessFile:
         assert entry["status"] == "success"
         assert entry["source_id"] == "file-xyz"
 
-    @pytest.mark.asyncio
-    async def test_callback_failure_marks_failed(self, tmp_path: Path) -> None:
+    async def test_callback_failure_marks_failed(self, tmp_path: Path, alice_only_zip: bytes) -> None:
         """If the callback raises, _process_file marks the rec_id as failed."""
         cfg = _make_cfg(tmp_path)
         state_store = _make_state_store(tmp_path)
         callback = AsyncMock(side_effect=RuntimeError("pipeline failed"))
         watcher = DriveWatcher(cfg, state_store, on_new_tracks=callback)
 
-        zip_bytes = _make_zip({"1-alice.aac": b"audio"})
-
-        with patch.object(watcher, "_download_file_sync", return_value=zip_bytes):
+        with patch.object(watcher, "_download_file_sync", side_effect=_fake_download(alice_only_zip)):
             loop = asyncio.get_running_loop()
             with pytest.raises(RuntimeError, match="pipeline failed"):
                 await watcher._process_file(loop, "fail-id", "craig_failID123456_2026.aac.zip")
@@ -286,3 +437,170 @@ class TestProcessFile:
         assert state_store.is_known("failID123456")
         entry = state_store.get_entry("failID123456")
         assert entry["status"] == "error"
+
+
+# ===========================================================================
+# 16: Concurrent processing
+# ===========================================================================
+
+class TestGuardedProcess:
+    """Tests for _guarded_process (bounded, failure-isolated processing)."""
+
+    async def test_failure_does_not_stop_other_files(self, tmp_path: Path) -> None:
+        """A failing file is logged and the rest of the batch still runs."""
+        cfg = _make_cfg(tmp_path, max_concurrent_downloads=2)
+        watcher = _make_watcher(cfg, _make_state_store(tmp_path))
+        done: list[str] = []
+
+        async def fake_process(loop, file_id: str, file_name: str) -> None:
+            if file_id == "bad":
+                raise DriveWatchError("boom")
+            done.append(file_id)
+
+        with patch.object(watcher, "_process_file", side_effect=fake_process):
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(*(
+                watcher._guarded_process(loop, fid, f"{fid}.zip")
+                for fid in ("a", "bad", "b")
+            ))
+
+        assert sorted(done) == ["a", "b"]
+
+    async def test_concurrency_is_bounded(self, tmp_path: Path) -> None:
+        """No more than max_concurrent_downloads files are processed at once."""
+        cfg = _make_cfg(tmp_path, max_concurrent_downloads=2)
+        watcher = _make_watcher(cfg, _make_state_store(tmp_path))
+        active = 0
+        peak = 0
+
+        async def fake_process(loop, file_id: str, file_name: str) -> None:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        with patch.object(watcher, "_process_file", side_effect=fake_process):
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(*(
+                watcher._guarded_process(loop, str(i), f"{i}.zip")
+                for i in range(5)
+            ))
+
+        assert peak == 2
+
+
+# ===========================================================================
+# 17: Incremental listing via the Drive changes API
+# ===========================================================================
+
+def _zip_file(file_id: str, name: str, parent: str = "test-folder", **extra) -> dict:
+    return {
+        "id": file_id, "name": name, "mimeType": "application/zip",
+        "parents": [parent], **extra,
+    }
+
+
+class TestIncrementalListing:
+    """Tests for _list_files_sync full/changes listing."""
+
+    def _watcher_with_service(self, tmp_path: Path) -> tuple[DriveWatcher, MagicMock]:
+        watcher = _make_watcher(_make_cfg(tmp_path), _make_state_store(tmp_path))
+        service = MagicMock()
+        service.changes.return_value.getStartPageToken.return_value.execute.return_value = {
+            "startPageToken": "t1",
+        }
+        service.files.return_value.list.return_value.execute.return_value = {
+            "files": [{"id": "f1", "name": "craig_aaa.zip", "mimeType": "application/zip"}],
+        }
+        return watcher, service
+
+    def test_first_call_lists_folder_then_uses_changes(self, tmp_path: Path) -> None:
+        watcher, service = self._watcher_with_service(tmp_path)
+        service.changes.return_value.list.return_value.execute.return_value = {
+            "newStartPageToken": "t2",
+            "changes": [
+                {"fileId": "f2", "file": _zip_file("f2", "craig_bbb.zip")},
+                {"fileId": "f3", "file": _zip_file("f3", "craig_ccc.zip", parent="other")},
+                {"fileId": "f4", "file": _zip_file("f4", "notes.zip")},
+                {"fileId": "f5", "file": _zip_file("f5", "craig_ddd.zip", trashed=True)},
+                {"fileId": "f6", "removed": True},
+            ],
+        }
+
+        with patch.object(watcher, "_build_service", return_value=service):
+            first = watcher._list_files_sync()
+            second = watcher._list_files_sync()
+
+        assert [f["id"] for f in first] == ["f1"]
+        assert [f["id"] for f in second] == ["f2"]
+        assert watcher._page_token == "t2"
+        assert service.files.return_value.list.call_count == 1
+        _, kwargs = service.changes.return_value.list.call_args
+        assert kwargs["pageToken"] == "t1"
+
+    def test_changes_failure_falls_back_to_full_listing(self, tmp_path: Path) -> None:
+        watcher, service = self._watcher_with_service(tmp_path)
+        service.changes.return_value.list.return_value.execute.side_effect = RuntimeError("404")
+
+        with patch.object(watcher, "_build_service", return_value=service):
+            watcher._list_files_sync()
+            results = watcher._list_files_sync()
+
+        assert [f["id"] for f in results] == ["f1"]
+        assert service.files.return_value.list.call_count == 2
+        assert watcher._page_token == "t1"
+
+    def test_fallback_listing_only_requests_newer_files(self, tmp_path: Path) -> None:
+        watcher, service = self._watcher_with_service(tmp_path)
+        service.files.return_value.list.return_value.execute.return_value = {
+            "files": [
+                {"id": "f1", "name": "craig_aaa.zip", "mimeType": "application/zip",
+                 "createdTime": "2026-03-01T10:00:00.000Z"},
+                {"id": "f0", "name": "craig_zzz.zip", "mimeType": "application/zip",
+                 "createdTime": "2026-02-01T10:00:00.000Z"},
+            ],
+        }
+        service.changes.return_value.list.return_value.execute.side_effect = RuntimeError("404")
+
+        with patch.object(watcher, "_build_service", return_value=service):
+            watcher._list_files_sync()
+            watcher._list_files_sync()
+
+        first_q, second_q = (
+            c.kwargs["q"] for c in service.files.return_value.list.call_args_list
+        )
+        assert "createdTime" not in first_q
+        assert second_q == first_q + " and createdTime >= '2026-03-01T10:00:00.000Z'"
+
+    def test_fallback_listing_finds_late_file_with_older_mtime(self, tmp_path: Path) -> None:
+        watcher, service = self._watcher_with_service(tmp_path)
+        folder = [
+            {"id": "f1", "name": "craig_aaa.zip", "mimeType": "application/zip",
+             "createdTime": "2026-03-01T10:00:00.000Z",
+             "modifiedTime": "2026-03-01T10:00:00.000Z"},
+        ]
+
+        def _list(q: str, **kwargs) -> MagicMock:
+            # Apply the createdTime bound the way Drive would.
+            m = re.search(r"createdTime >= '([^']+)'", q)
+            request = MagicMock()
+            request.execute.return_value = {
+                "files": [f for f in folder if not m or f["createdTime"] >= m.group(1)],
+            }
+            return request
+
+        service.files.return_value.list.side_effect = _list
+        service.changes.return_value.list.return_value.execute.side_effect = RuntimeError("404")
+
+        with patch.object(watcher, "_build_service", return_value=service):
+            watcher._list_files_sync()
+            # Uploaded later, but with a preserved modifiedTime from before f1.
+            folder.append(
+                {"id": "f2", "name": "craig_bbb.zip", "mimeType": "application/zip",
+                 "createdTime": "2026-03-02T10:00:00.000Z",
+                 "modifiedTime": "2026-02-01T10:00:00.000Z"},
+            )
+            results = watcher._list_files_sync()
+
+        assert "f2" in [f["id"] for f in results]
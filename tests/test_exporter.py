@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import textwrap
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
@@ -31,6 +32,17 @@ def _make_exporter(
     return GoogleDocsExporter(cfg or _CFG)
 
 
+@pytest.fixture(autouse=True)
+def _fast_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make retry backoff sleeps yield without waiting on the wall clock."""
+    real_sleep = asyncio.sleep
+
+    async def _no_wait(delay: float, result=None):
+        return await real_sleep(0, result)
+
+    monkeypatch.setattr("src.exporter.asyncio.sleep", _no_wait)
+
+
 # ===================================================================
 # Markdown → HTML conversion
 # ===================================================================
@@ -166,7 +178,6 @@ def _mock_drive_service(doc_id: str = "doc-123", url: str = "https://docs.google
 
 
 class TestExportSuccess:
-    @pytest.mark.asyncio
     async def test_export_success(self) -> None:
         """Successful export returns ExportResult with url and doc_id."""
         exp = _make_exporter()
@@ -185,7 +196,6 @@ class TestExportSuccess:
 
 
 class TestExportRetry:
-    @pytest.mark.asyncio
     async def test_export_retry_on_500(self) -> None:
         """500 errors trigger retry."""
         exp = _make_exporter()
@@ -216,7 +226,6 @@ class TestExportRetry:
         assert result.doc_id == "retry-doc"
         assert call_count == 2
 
-    @pytest.mark.asyncio
     async def test_export_no_retry_on_400(self) -> None:
         """400 errors should not be retried (non-retryable client error)."""
         exp = _make_exporter()
@@ -244,7 +253,6 @@ class TestExportRetry:
         # Should have attempted only once, then broken out
         assert call_count == 1
 
-    @pytest.mark.asyncio
     async def test_export_max_retries_exhausted(self) -> None:
         """When all retries are exhausted, ExportResult(success=False) is returned."""
         cfg = SimpleNamespace(
@@ -280,7 +288,6 @@ class TestExportRetry:
 
 
 class TestExportNeverRaises:
-    @pytest.mark.asyncio
     async def test_export_never_raises(self) -> None:
         """Even on completely unexpected errors, export returns ExportResult."""
         exp = _make_exporter()
@@ -599,7 +606,6 @@ class TestTranscriptTab:
         # Emoji (surrogate pair)
         assert exp._utf16_len("\U0001f4d6") == 2
 
-    @pytest.mark.asyncio
     async def test_export_creates_tab_on_success(self) -> None:
         """Full export with transcript_md creates a 2-tab document."""
         exp = _make_exporter()
@@ -616,7 +622,6 @@ class TestTranscriptTab:
         # Verify Docs API was called (tab creation + content write)
         assert exp._docs_service.documents().batchUpdate.call_count >= 1
 
-    @pytest.mark.asyncio
     async def test_export_tab_failure_still_succeeds(self) -> None:
         """Tab creation failure doesn't affect overall export success."""
         exp = _make_exporter()
@@ -635,7 +640,6 @@ class TestTranscriptTab:
         assert result.success is True
         assert result.doc_id == "doc-abc"
 
-    @pytest.mark.asyncio
     async def test_export_no_transcript_skips_tab(self) -> None:
         """Export without transcript_md skips tab creation entirely."""
         exp = _make_exporter()
@@ -822,7 +826,6 @@ class TestTimestampLinks:
 
         assert result == {"00:01:24": "h.ts1"}
 
-    @pytest.mark.asyncio
     async def test_export_calls_link_update_after_tab(self) -> None:
         """Full flow: link update is called after tab creation."""
         exp = _make_exporter()
@@ -847,7 +850,6 @@ class TestTimestampLinks:
 class TestFallbackBehavior:
     """Tests for graceful degradation when Docs API fails."""
 
-    @pytest.mark.asyncio
     async def test_export_no_transcript_md_skips_tab(self) -> None:
         """transcript_md=None skips all Docs API calls."""
         exp = _make_exporter()
@@ -859,7 +861,6 @@ class TestFallbackBehavior:
         assert result.success is True
         exp._docs_service.documents().batchUpdate.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_export_tab_creation_failure_returns_success(self) -> None:
         """addDocumentTab raises → memo-only doc, success=True."""
         exp = _make_exporter()
@@ -872,7 +873,6 @@ class TestFallbackBehavior:
         result = await exp.export("# Minutes", "Test", transcript_md=_SAMPLE_TRANSCRIPT)
         assert result.success is True
 
-    @pytest.mark.asyncio
     async def test_export_content_write_failure_logs_warning(self) -> None:
         """Content write failure → tab exists but empty, success=True."""
         exp = _make_exporter()
@@ -898,7 +898,6 @@ class TestFallbackBehavior:
         result = await exp.export("# Minutes", "Test", transcript_md=_SAMPLE_TRANSCRIPT)
         assert result.success is True
 
-    @pytest.mark.asyncio
     async def test_export_link_update_failure_logs_warning(self) -> None:
         """replaceAllText failure → tabs exist with content, success=True."""
         exp = _make_exporter()
@@ -927,7 +926,6 @@ class TestFallbackBehavior:
         result = await exp.export("# Minutes", "Test", transcript_md=_SAMPLE_TRANSCRIPT)
         assert result.success is True
 
-    @pytest.mark.asyncio
     async def test_export_rename_tab_is_noop(self) -> None:
         """Tab rename is a no-op (Docs API doesn't support it yet)."""
         exp = _make_exporter()
@@ -937,7 +935,6 @@ class TestFallbackBehavior:
         result = await exp.export("# Minutes", "Test", transcript_md=_SAMPLE_TRANSCRIPT)
         assert result.success is True
 
-    @pytest.mark.asyncio
     async def test_export_html_upload_failure_returns_failure(self) -> None:
         """Step 1 (HTML upload) fails → ExportResult(success=False)."""
         exp = _make_exporter()
@@ -2,15 +2,34 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
 import textwrap
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.config import GeneratorConfig
 from src.errors import GenerationError
-from src.generator import MinutesGenerator, TemplateInfo, _parse_template_metadata
+from src.generator import (
+    MinutesGenerator,
+    TemplateInfo,
+    _build_client,
+    _parse_template_metadata,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fast_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make retry backoff sleeps yield without waiting on the wall clock."""
+    real_sleep = asyncio.sleep
+
+    async def _no_wait(delay: float, result=None):
+        return await real_sleep(0, result)
+
+    monkeypatch.setattr("src.generator.asyncio.sleep", _no_wait)
 
 
 def _write_template(tmp_path: Path) -> Path:
@@ -26,6 +45,45 @@ def _write_template(tmp_path: Path) -> Path:
     return template
 
 
+def _fake_response(text: str, in_tokens: int = 10, out_tokens: int = 5) -> SimpleNamespace:
+    """Return a plain stand-in for an Anthropic ``Message``."""
+    return SimpleNamespace(
+        content=[SimpleNamespace(text=text)],
+        usage=SimpleNamespace(input_tokens=in_tokens, output_tokens=out_tokens),
+    )
+
+
+def _fake_completion(
+    text: str | None, prompt_tokens: int = 10, completion_tokens: int = 5
+) -> SimpleNamespace:
+    """Return a plain stand-in for an OpenAI ``ChatCompletion``.
+
+    ``text=None`` yields a completion with no choices.
+    """
+    choices = [] if text is None else [SimpleNamespace(message=SimpleNamespace(content=text))]
+    return SimpleNamespace(
+        choices=choices,
+        usage=SimpleNamespace(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens),
+    )
+
+
+def _mock_stream(*chunks: str) -> MagicMock:
+    """Return a mock of ``AsyncAnthropic.messages.stream(...)`` yielding *chunks*."""
+
+    async def _text_stream():
+        for chunk in chunks:
+            yield chunk
+
+    stream = SimpleNamespace(
+        text_stream=_text_stream(),
+        get_final_message=AsyncMock(return_value=_fake_response("".join(chunks))),
+    )
+    manager = MagicMock()
+    manager.__aenter__ = AsyncMock(return_value=stream)
+    manager.__aexit__ = AsyncMock(return_value=False)
+    return manager
+
+
 def _make_cfg(tmp_path: Path, api_key: str = "sk-test", **kwargs) -> GeneratorConfig:
     """Create a GeneratorConfig with a real template file."""
     template = _write_template(tmp_path)
@@ -41,6 +99,18 @@ def _make_cfg(tmp_path: Path, api_key: str = "sk-test", **kwargs) -> GeneratorCo
     return GeneratorConfig(**defaults)
 
 
+@pytest.fixture(scope="class")
+def loaded_generator(tmp_path_factory: pytest.TempPathFactory) -> MinutesGenerator:
+    """One loaded generator shared by a test class.
+
+    Tests that swap out client methods must do so via ``monkeypatch`` so
+    the real client is restored for the next test.
+    """
+    gen = MinutesGenerator(_make_cfg(tmp_path_factory.mktemp("gen")))
+    gen.load()
+    return gen
+
+
 class TestGeneratorLoad:
     def test_load_success(self, tmp_path: Path) -> None:
         cfg = _make_cfg(tmp_path)
@@ -64,21 +134,35 @@ class TestGeneratorLoad:
             gen.load()
 
     def test_load_idempotent(self, tmp_path: Path) -> None:
-        cfg = _make_cfg(tmp_path)
+        cfg = _make_cfg(tmp_path, api_key="sk-idempotent")
         gen = MinutesGenerator(cfg)
-        with patch("src.generator.anthropic.Anthropic") as mock_cls:
+        _build_client.cache_clear()
+        with patch("src.generator.anthropic.AsyncAnthropic") as mock_cls:
             gen.load()
             gen.load()  # second call should be no-op
+            other = MinutesGenerator(cfg)
+            other.load()  # shares the cached client and template
             mock_cls.assert_called_once()
+        assert other._client is gen._client
+        assert other._templates["minutes"] is gen._templates["minutes"]
+        _build_client.cache_clear()
 
-
-class TestRenderPrompt:
-    def test_render_all_variables(self, tmp_path: Path) -> None:
+    def test_template_reread_after_change(self, tmp_path: Path) -> None:
         cfg = _make_cfg(tmp_path)
         gen = MinutesGenerator(cfg)
         gen.load()
+        path = Path(cfg.prompt_template_path)
+        path.write_text("UPDATED: {transcript}", encoding="utf-8")
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000_000))
 
-        result = gen.render_prompt(
+        other = MinutesGenerator(cfg)
+        other.load()
+        assert other.render_prompt("t", "d", "s") == "UPDATED: t"
+
+
+class TestRenderPrompt:
+    def test_render_all_variables(self, loaded_generator: MinutesGenerator) -> None:
+        result = loaded_generator.render_prompt(
             transcript="[00:00] Alice: Hello",
             date="2026-02-10",
             speakers="Alice, Bob",
@@ -115,19 +199,34 @@ class TestRenderPrompt:
         )
         assert result == "CUSTOM: hello"
 
-
-class TestGenerate:
-    @pytest.mark.asyncio
-    async def test_generate_success(self, tmp_path: Path) -> None:
+    def test_render_does_not_expand_placeholders_in_values(self, tmp_path: Path) -> None:
         cfg = _make_cfg(tmp_path)
+        custom = tmp_path / "custom.txt"
+        custom.write_text("{date} | {transcript} | {unknown}", encoding="utf-8")
+
         gen = MinutesGenerator(cfg)
         gen.load()
 
-        # Mock the Anthropic client
-        mock_response = MagicMock()
-        mock_response.content = [MagicMock(text="# 会議議事録\n## 要約\nテスト会議")]
-        mock_response.usage = MagicMock(input_tokens=100, output_tokens=50)
-        gen._client.messages.create = MagicMock(return_value=mock_response)
+        result = gen.render_prompt(
+            transcript="Alice: see {date}",
+            date="2026-02-10",
+            speakers="s",
+            template_name="custom",
+        )
+        assert result == "2026-02-10 | Alice: see {date} | {unknown}"
+
+
+class TestGenerate:
+    async def test_generate_success(
+        self, loaded_generator: MinutesGenerator, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        gen = loaded_generator
+
+        # Mock the Anthropic client's streaming response
+        stream = MagicMock(
+            return_value=_mock_stream("# 会議議事録\n", "## 要約\n", "テスト会議")
+        )
+        monkeypatch.setattr(gen._client.messages, "stream", stream)
 
         result = await gen.generate(
             transcript="[00:00] Alice: テスト",
@@ -135,49 +234,64 @@ class TestGenerate:
             speakers="Alice",
         )
         assert "会議議事録" in result
-        gen._client.messages.create.assert_called_once()
+        assert result == "# 会議議事録\n## 要約\nテスト会議"
+        stream.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_generate_before_load_raises(self) -> None:
         cfg = GeneratorConfig(api_key="sk-test")
         gen = MinutesGenerator(cfg)
         with pytest.raises(GenerationError, match="not loaded"):
             await gen.generate("t", "d", "s")
 
-    @pytest.mark.asyncio
-    async def test_generate_retries_on_rate_limit(self, tmp_path: Path) -> None:
+    async def test_generate_retries_on_rate_limit(
+        self, loaded_generator: MinutesGenerator, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         import anthropic as anthropic_mod
 
-        cfg = _make_cfg(tmp_path)
-        gen = MinutesGenerator(cfg)
-        gen.load()
+        gen = loaded_generator
 
         # First call raises RateLimitError, second succeeds
-        mock_response = MagicMock()
-        mock_response.content = [MagicMock(text="Success")]
-        mock_response.usage = MagicMock(input_tokens=10, output_tokens=5)
-
         rate_limit_exc = anthropic_mod.RateLimitError(
             message="rate limited",
             response=MagicMock(status_code=429, headers={}),
             body=None,
         )
 
-        gen._client.messages.create = MagicMock(
-            side_effect=[rate_limit_exc, mock_response]
-        )
+        stream = MagicMock(side_effect=[rate_limit_exc, _mock_stream("Success")])
+        monkeypatch.setattr(gen._client.messages, "stream", stream)
 
         result = await gen.generate("transcript", "date", "speakers")
         assert result == "Success"
-        assert gen._client.messages.create.call_count == 2
+        assert stream.call_count == 2
 
-    @pytest.mark.asyncio
-    async def test_generate_fails_on_client_error(self, tmp_path: Path) -> None:
+    async def test_generate_honours_retry_after(
+        self, loaded_generator: MinutesGenerator, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         import anthropic as anthropic_mod
 
-        cfg = _make_cfg(tmp_path)
-        gen = MinutesGenerator(cfg)
-        gen.load()
+        gen = loaded_generator
+
+        rate_limit_exc = anthropic_mod.RateLimitError(
+            message="rate limited",
+            response=MagicMock(status_code=429, headers={"retry-after": "7"}),
+            body=None,
+        )
+        stream = MagicMock(side_effect=[rate_limit_exc, _mock_stream("Success")])
+        monkeypatch.setattr(gen._client.messages, "stream", stream)
+
+        with patch("src.generator.asyncio.sleep", new=AsyncMock()) as mock_sleep, \
+                patch("src.generator.random.uniform", return_value=0.0):
+            result = await gen.generate("transcript", "date", "speakers")
+
+        assert result == "Success"
+        mock_sleep.assert_awaited_once_with(7.0)
+
+    async def test_generate_fails_on_client_error(
+        self, loaded_generator: MinutesGenerator, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import anthropic as anthropic_mod
+
+        gen = loaded_generator
 
         client_exc = anthropic_mod.APIStatusError(
             message="bad request",
@@ -185,28 +299,43 @@ class TestGenerate:
             body=None,
         )
 
-        gen._client.messages.create = MagicMock(side_effect=client_exc)
+        monkeypatch.setattr(gen._client.messages, "stream", MagicMock(side_effect=client_exc))
 
         with pytest.raises(GenerationError, match="client error"):
             await gen.generate("transcript", "date", "speakers")
 
-    @pytest.mark.asyncio
-    async def test_generate_exhausts_retries(self, tmp_path: Path) -> None:
+    async def test_generate_exhausts_retries(
+        self, loaded_generator: MinutesGenerator, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         import anthropic as anthropic_mod
 
-        cfg = _make_cfg(tmp_path)
-        gen = MinutesGenerator(cfg)
-        gen.load()
+        gen = loaded_generator
 
         conn_exc = anthropic_mod.APIConnectionError(request=MagicMock())
 
-        gen._client.messages.create = MagicMock(side_effect=conn_exc)
+        stream = MagicMock(side_effect=conn_exc)
+        monkeypatch.setattr(gen._client.messages, "stream", stream)
 
         with pytest.raises(GenerationError, match="failed after"):
             await gen.generate("transcript", "date", "speakers")
 
         # Should have tried max_retries + 1 = 3 times
-        assert gen._client.messages.create.call_count == 3
+        assert stream.call_count == 3
+
+
+class TestCacheKey:
+    def test_changes_with_model_and_template(self, tmp_path: Path) -> None:
+        gen = MinutesGenerator(_make_cfg(tmp_path))
+        gen.load()
+        key = gen.cache_key("minutes")
+        assert key == gen.cache_key("minutes")
+
+        other_model = MinutesGenerator(_make_cfg(tmp_path, model="claude-other"))
+        other_model.load()
+        assert other_model.cache_key("minutes") != key
+
+        (tmp_path / "custom.txt").write_text("CUSTOM: {transcript}", encoding="utf-8")
+        assert gen.cache_key("custom") != key
 
 
 class TestListTemplates:
@@ -278,22 +407,18 @@ class TestOpenAICompat:
             with pytest.raises(GenerationError, match="pip install openai"):
                 gen.load()
 
-    @pytest.mark.asyncio
     async def test_generate_openai_compat_success(self, tmp_path: Path) -> None:
         cfg = _make_cfg(tmp_path, api_key="", backend="openai_compat",
                         base_url="http://localhost:11434/v1")
         gen = MinutesGenerator(cfg)
         gen.load()
 
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content="# 議事録\nテスト"))]
-        mock_response.usage = MagicMock(prompt_tokens=100, completion_tokens=50)
+        mock_response = _fake_completion("# 議事録\nテスト", 100, 50)
         gen._openai_client.chat.completions.create = MagicMock(return_value=mock_response)
 
         result = await gen.generate("transcript", "date", "speakers")
         assert "議事録" in result
 
-    @pytest.mark.asyncio
     async def test_generate_openai_compat_rate_limit(self, tmp_path: Path) -> None:
         import openai as openai_mod
 
@@ -302,9 +427,7 @@ class TestOpenAICompat:
         gen = MinutesGenerator(cfg)
         gen.load()
 
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content="Success"))]
-        mock_response.usage = MagicMock(prompt_tokens=10, completion_tokens=5)
+        mock_response = _fake_completion("Success")
 
         rate_exc = openai_mod.RateLimitError(
             message="rate limited",
@@ -320,7 +443,6 @@ class TestOpenAICompat:
         assert result == "Success"
         assert gen._openai_client.chat.completions.create.call_count == 2
 
-    @pytest.mark.asyncio
     async def test_generate_openai_compat_client_error(self, tmp_path: Path) -> None:
         import openai as openai_mod
 
@@ -339,7 +461,6 @@ class TestOpenAICompat:
         with pytest.raises(GenerationError, match="client error"):
             await gen.generate("transcript", "date", "speakers")
 
-    @pytest.mark.asyncio
     async def test_generate_openai_compat_connection_error(self, tmp_path: Path) -> None:
         import openai as openai_mod
 
@@ -356,29 +477,25 @@ class TestOpenAICompat:
 
         assert gen._openai_client.chat.completions.create.call_count == 3
 
-    @pytest.mark.asyncio
     async def test_generate_openai_compat_empty_response(self, tmp_path: Path) -> None:
         cfg = _make_cfg(tmp_path, api_key="", backend="openai_compat",
                         base_url="http://localhost:11434/v1")
         gen = MinutesGenerator(cfg)
         gen.load()
 
-        mock_response = MagicMock()
-        mock_response.choices = []
+        mock_response = _fake_completion(None)
         gen._openai_client.chat.completions.create = MagicMock(return_value=mock_response)
 
         with pytest.raises(GenerationError, match="empty response"):
             await gen.generate("transcript", "date", "speakers")
 
-    @pytest.mark.asyncio
     async def test_generate_openai_compat_no_usage(self, tmp_path: Path) -> None:
         cfg = _make_cfg(tmp_path, api_key="", backend="openai_compat",
                         base_url="http://localhost:11434/v1")
         gen = MinutesGenerator(cfg)
         gen.load()
 
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content="Result"))]
+        mock_response = _fake_completion("Result")
         mock_response.usage = None
         gen._openai_client.chat.completions.create = MagicMock(return_value=mock_response)
 
@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
+import pytest
+
 from src.config import MergerConfig
-from src.merger import _format_timestamp, format_transcript_markdown, merge_transcripts
+from src.merger import (
+    _format_timestamp,
+    _timestamp_formatter,
+    format_transcript_markdown,
+    merge_transcripts,
+)
 from src.transcriber import Segment
 
 # Default config
@@ -21,148 +28,152 @@ def _seg(start: float, end: float, text: str, speaker: str) -> Segment:
 
 
 class TestFormatTimestamp:
-    def test_zero(self) -> None:
-        assert _format_timestamp(0.0, "[{mm}:{ss}]") == "[00:00]"
-
-    def test_seconds_only(self) -> None:
-        assert _format_timestamp(45.0, "[{mm}:{ss}]") == "[00:45]"
-
-    def test_minutes_and_seconds(self) -> None:
-        assert _format_timestamp(125.0, "[{mm}:{ss}]") == "[02:05]"
-
-    def test_hours(self) -> None:
-        assert _format_timestamp(3661.0, "[{hh}:{mm}:{ss}]") == "[01:01:01]"
-
-    def test_custom_format(self) -> None:
-        assert _format_timestamp(90.0, "{mm}m{ss}s") == "01m30s"
+    @pytest.mark.parametrize(
+        ("seconds", "fmt", "expected"),
+        [
+            (0.0, "[{mm}:{ss}]", "[00:00]"),
+            (45.0, "[{mm}:{ss}]", "[00:45]"),
+            (125.0, "[{mm}:{ss}]", "[02:05]"),
+            (3661.0, "[{hh}:{mm}:{ss}]", "[01:01:01]"),
+            (90.0, "{mm}m{ss}s", "01m30s"),
+        ],
+        ids=["zero", "seconds_only", "minutes_and_seconds", "hours", "custom_format"],
+    )
+    def test_format(self, seconds: float, fmt: str, expected: str) -> None:
+        assert _format_timestamp(seconds, fmt) == expected
+
+    @pytest.mark.parametrize("fmt", ["[{mm}:{ss}]", "[{hh}:{mm}:{ss}]", "{mm}m{ss}s"])
+    def test_formatter_matches_format_timestamp(self, fmt: str) -> None:
+        format_ts = _timestamp_formatter(fmt)
+        for seconds in (0.0, 59.9, 61.0, 3599.0, 3661.5, 40000.0):
+            assert format_ts(seconds) == _format_timestamp(seconds, fmt)
 
 
 # --- merge_transcripts ---
 
-
-class TestMergeTranscripts:
-    def test_empty_input(self) -> None:
-        assert merge_transcripts([], _CFG) == ""
-
-    def test_single_segment(self) -> None:
-        result = merge_transcripts(
-            [_seg(0.0, 5.0, "Hello", "Alice")],
-            _CFG,
-        )
-        assert result == "[00:00] Alice: Hello"
-
-    def test_two_speakers_interleaved(self) -> None:
-        segments = [
+# (segments, cfg, expected transcript lines)
+_MERGE_CASES = [
+    pytest.param([], _CFG, [], id="empty_input"),
+    pytest.param(
+        [_seg(0.0, 5.0, "Hello", "Alice")],
+        _CFG,
+        ["[00:00] Alice: Hello"],
+        id="single_segment",
+    ),
+    pytest.param(
+        [
             _seg(0.0, 3.0, "First point", "Alice"),
             _seg(3.5, 6.0, "I agree", "Bob"),
             _seg(6.5, 9.0, "Next topic", "Alice"),
             _seg(10.0, 12.0, "Good idea", "Bob"),
-        ]
-        result = merge_transcripts(segments, _CFG)
-        lines = result.split("\n")
-        assert len(lines) == 4
-        assert "Alice: First point" in lines[0]
-        assert "Bob: I agree" in lines[1]
-        assert "Alice: Next topic" in lines[2]
-        assert "Bob: Good idea" in lines[3]
-
-    def test_segments_sorted_by_start_time(self) -> None:
-        # Provide segments out of order
-        segments = [
+        ],
+        _CFG,
+        [
+            "[00:00] Alice: First point",
+            "[00:03] Bob: I agree",
+            "[00:06] Alice: Next topic",
+            "[00:10] Bob: Good idea",
+        ],
+        id="two_speakers_interleaved",
+    ),
+    pytest.param(
+        # Provided out of order
+        [
             _seg(10.0, 12.0, "Third", "Bob"),
             _seg(0.0, 3.0, "First", "Alice"),
             _seg(5.0, 7.0, "Second", "Alice"),
-        ]
-        result = merge_transcripts(segments, _CFG)
-        lines = result.split("\n")
-        assert "First" in lines[0]
-        assert "Second" in lines[1]
-        assert "Third" in lines[2]
-
-    def test_adjacent_same_speaker_merged_within_threshold(self) -> None:
-        # Gap of 0.5s < default threshold of 1.0s => should merge
-        segments = [
-            _seg(0.0, 2.0, "Hello", "Alice"),
-            _seg(2.5, 4.0, "world", "Alice"),
-        ]
-        result = merge_transcripts(segments, _CFG)
-        lines = result.split("\n")
-        assert len(lines) == 1
-        assert "Alice: Hello world" in lines[0]
-
-    def test_adjacent_same_speaker_not_merged_beyond_threshold(self) -> None:
-        # Gap of 2.0s > default threshold of 1.0s => should NOT merge
-        segments = [
-            _seg(0.0, 2.0, "Hello", "Alice"),
-            _seg(4.0, 6.0, "world", "Alice"),
-        ]
-        result = merge_transcripts(segments, _CFG)
-        lines = result.split("\n")
-        assert len(lines) == 2
-
-    def test_different_speakers_never_merged(self) -> None:
-        # Even with 0 gap, different speakers should not merge
-        segments = [
-            _seg(0.0, 2.0, "Hello", "Alice"),
-            _seg(2.0, 4.0, "Hi", "Bob"),
-        ]
-        result = merge_transcripts(segments, _CFG)
-        lines = result.split("\n")
-        assert len(lines) == 2
-
-    def test_custom_gap_threshold(self) -> None:
-        cfg = MergerConfig(gap_merge_threshold_sec=5.0)
-        segments = [
-            _seg(0.0, 2.0, "Part one", "Alice"),
-            _seg(6.0, 8.0, "Part two", "Alice"),  # gap=4s < 5s threshold
-        ]
-        result = merge_transcripts(segments, cfg)
-        lines = result.split("\n")
-        assert len(lines) == 1
-        assert "Part one Part two" in lines[0]
-
-    def test_min_segment_chars_filter(self) -> None:
-        cfg = MergerConfig(min_segment_chars=3)
-        segments = [
-            _seg(0.0, 1.0, "Hi", "Alice"),  # 2 chars => filtered
-            _seg(2.0, 4.0, "Hello there", "Alice"),  # 11 chars => kept
-        ]
-        result = merge_transcripts(segments, cfg)
-        lines = result.split("\n")
-        assert len(lines) == 1
-        assert "Hello there" in lines[0]
-
-    def test_all_segments_below_min_chars(self) -> None:
-        cfg = MergerConfig(min_segment_chars=100)
-        segments = [
-            _seg(0.0, 1.0, "Hi", "Alice"),
-            _seg(2.0, 3.0, "Ok", "Bob"),
-        ]
-        result = merge_transcripts(segments, cfg)
-        assert result == ""
-
-    def test_hh_mm_ss_format(self) -> None:
-        segments = [_seg(3661.0, 3665.0, "Late in meeting", "Alice")]
-        result = merge_transcripts(segments, _HH_CFG)
-        assert result == "[01:01:01] Alice: Late in meeting"
-
-    def test_timestamp_at_exact_minute(self) -> None:
-        segments = [_seg(60.0, 65.0, "One minute in", "Bob")]
-        result = merge_transcripts(segments, _CFG)
-        assert result == "[01:00] Bob: One minute in"
-
-    def test_merge_preserves_merged_end_time(self) -> None:
-        """When merging, the merged segment should use the latest end time."""
-        cfg = MergerConfig(gap_merge_threshold_sec=2.0)
-        segments = [
+        ],
+        _CFG,
+        ["[00:00] Alice: First", "[00:05] Alice: Second", "[00:10] Bob: Third"],
+        id="segments_sorted_by_start_time",
+    ),
+    pytest.param(
+        # Gap of 0.5s < default threshold of 1.0s => merged
+        [_seg(0.0, 2.0, "Hello", "Alice"), _seg(2.5, 4.0, "world", "Alice")],
+        _CFG,
+        ["[00:00] Alice: Hello world"],
+        id="same_speaker_merged_within_threshold",
+    ),
+    pytest.param(
+        # Gap of 2.0s > default threshold of 1.0s => not merged
+        [_seg(0.0, 2.0, "Hello", "Alice"), _seg(4.0, 6.0, "world", "Alice")],
+        _CFG,
+        ["[00:00] Alice: Hello", "[00:04] Alice: world"],
+        id="same_speaker_not_merged_beyond_threshold",
+    ),
+    pytest.param(
+        # Even with 0 gap, different speakers are not merged
+        [_seg(0.0, 2.0, "Hello", "Alice"), _seg(2.0, 4.0, "Hi", "Bob")],
+        _CFG,
+        ["[00:00] Alice: Hello", "[00:02] Bob: Hi"],
+        id="different_speakers_never_merged",
+    ),
+    pytest.param(
+        # gap=4s < 5s threshold
+        [_seg(0.0, 2.0, "Part one", "Alice"), _seg(6.0, 8.0, "Part two", "Alice")],
+        MergerConfig(gap_merge_threshold_sec=5.0),
+        ["[00:00] Alice: Part one Part two"],
+        id="custom_gap_threshold",
+    ),
+    pytest.param(
+        # Overlap counts as gap 0, which still exceeds a negative threshold
+        [_seg(0.0, 2.0, "Part one", "Alice"), _seg(1.0, 3.0, "Part two", "Alice")],
+        MergerConfig(gap_merge_threshold_sec=-1.0),
+        ["[00:00] Alice: Part one", "[00:01] Alice: Part two"],
+        id="negative_gap_threshold_never_merges",
+    ),
+    pytest.param(
+        # "Hi" (2 chars) is filtered, "Hello there" kept
+        [_seg(0.0, 1.0, "Hi", "Alice"), _seg(2.0, 4.0, "Hello there", "Alice")],
+        MergerConfig(min_segment_chars=3),
+        ["[00:02] Alice: Hello there"],
+        id="min_segment_chars_filter",
+    ),
+    pytest.param(
+        [_seg(0.0, 1.0, "Hi", "Alice"), _seg(2.0, 3.0, "Ok", "Bob")],
+        MergerConfig(min_segment_chars=100),
+        [],
+        id="all_segments_below_min_chars",
+    ),
+    pytest.param(
+        [_seg(3661.0, 3665.0, "Late in meeting", "Alice")],
+        _HH_CFG,
+        ["[01:01:01] Alice: Late in meeting"],
+        id="hh_mm_ss_format",
+    ),
+    pytest.param(
+        [_seg(60.0, 65.0, "One minute in", "Bob")],
+        _CFG,
+        ["[01:00] Bob: One minute in"],
+        id="timestamp_at_exact_minute",
+    ),
+    pytest.param(
+        # Each merge extends the end time, so the whole chain merges
+        [
             _seg(0.0, 2.0, "A", "Alice"),
             _seg(2.5, 5.0, "B", "Alice"),
             _seg(5.5, 8.0, "C", "Alice"),
-        ]
-        result = merge_transcripts(segments, cfg)
-        lines = result.split("\n")
-        assert len(lines) == 1  # all merged
-        assert "A B C" in lines[0]
+        ],
+        MergerConfig(gap_merge_threshold_sec=2.0),
+        ["[00:00] Alice: A B C"],
+        id="merge_preserves_merged_end_time",
+    ),
+]
+
+
+class TestMergeTranscripts:
+    @pytest.mark.parametrize(("segments", "cfg", "expected"), _MERGE_CASES)
+    def test_merge(
+        self, segments: list[Segment], cfg: MergerConfig, expected: list[str]
+    ) -> None:
+        assert merge_transcripts(segments, cfg) == "\n".join(expected)
+
+    def test_input_not_mutated(self) -> None:
+        """The case table shares its segment lists, so merging must not reorder them."""
+        segments = [_seg(10.0, 12.0, "Later", "Bob"), _seg(0.0, 3.0, "Earlier", "Alice")]
+        before = list(segments)
+        merge_transcripts(segments, _CFG)
+        assert segments == before
 
 
 # --- format_transcript_markdown ---
@@ -0,0 +1,92 @@
+"""Unit tests for src/outbox.py."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from src.outbox import StatusOutbox
+
+
+def _make_channel() -> MagicMock:
+    channel = MagicMock()
+    message = MagicMock()
+    message.edit = AsyncMock()
+    message.delete = AsyncMock()
+    channel.send = AsyncMock(return_value=message)
+    return channel
+
+
+class TestStatusOutbox:
+    async def test_update_does_not_block(self) -> None:
+        channel = _make_channel()
+        release = asyncio.Event()
+
+        async def _slow_send(text: str):
+            await release.wait()
+            return channel.send.return_value
+
+        channel.send.side_effect = _slow_send
+        status = StatusOutbox(channel)
+
+        status.update("one")  # returns while the send is still pending
+        await asyncio.sleep(0)
+        assert not release.is_set()
+        release.set()
+        await status.close()
+
+        channel.send.assert_awaited_once_with("one")
+        channel.send.return_value.delete.assert_awaited_once()
+
+    async def test_edits_are_coalesced(self) -> None:
+        channel = _make_channel()
+        release = asyncio.Event()
+        message = channel.send.return_value
+
+        async def _slow_send(text: str):
+            await release.wait()
+            return message
+
+        channel.send.side_effect = _slow_send
+        status = StatusOutbox(channel)
+
+        status.update("one")
+        await asyncio.sleep(0)  # let the worker start the send
+        status.update("two")
+        status.update("three")
+        release.set()
+        await status._worker
+
+        channel.send.assert_awaited_once_with("one")
+        message.edit.assert_awaited_once_with(content="three")
+
+    async def test_close_deletes_message_and_drops_unsent_text(self) -> None:
+        channel = _make_channel()
+        message = channel.send.return_value
+        status = StatusOutbox(channel)
+
+        status.update("one")
+        await status._worker
+        status.update("two")
+        await status.close()
+
+        message.delete.assert_awaited_once()
+        message.edit.assert_not_awaited()
+
+    async def test_close_is_idempotent(self) -> None:
+        channel = _make_channel()
+        message = channel.send.return_value
+        status = StatusOutbox(channel)
+
+        status.update("one")
+        await asyncio.sleep(0)
+        await asyncio.gather(status.close(), status.close())
+        await status.close()
+
+        message.delete.assert_awaited_once()
+
+    async def test_noop_without_channel(self) -> None:
+        status = StatusOutbox(None)
+        status.update("one")
+        assert status._worker is None
+        await status.close()
@@ -6,8 +6,8 @@ Tests verify the pipeline's stage orchestration, error handling, and cleanup.
 
 from __future__ import annotations
 
-import asyncio
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -84,19 +84,16 @@ def _make_recording() -> DetectedRecording:
     )
 
 
-def _make_tracks(tmp_path: Path) -> list[SpeakerAudio]:
-    f1 = tmp_path / "1-alice.aac"
-    f1.write_bytes(b"\x00")
-    f2 = tmp_path / "2-bob.aac"
-    f2.write_bytes(b"\x00")
+def _make_tracks() -> list[SpeakerAudio]:
+    # The transcriber is mocked, so the audio files never need to exist
     return [
         SpeakerAudio(
             speaker=SpeakerInfo(track=1, username="alice", user_id=1),
-            file_path=f1,
+            file_path=Path("1-alice.aac"),
         ),
         SpeakerAudio(
             speaker=SpeakerInfo(track=2, username="bob", user_id=2),
-            file_path=f2,
+            file_path=Path("2-bob.aac"),
         ),
     ]
 
@@ -109,7 +106,10 @@ def _make_segments() -> list[Segment]:
     ]
 
 
-@pytest.fixture
+# Config and DetectedRecording are frozen dataclasses, so one instance per
+# module is safe to share; tests needing a variant call _make_config().
+
+@pytest.fixture(scope="module")
 def cfg() -> Config:
     return _make_config()
 
@@ -119,32 +119,25 @@ def state_store(tmp_path: Path) -> StateStore:
     return StateStore(tmp_path / "state", legacy_db_path=tmp_path / "none.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def recording() -> DetectedRecording:
     return _make_recording()
 
 
-def _make_mock_message(msg_id: int = 999) -> MagicMock:
-    """Create a mock Discord Message with async edit/delete."""
-    msg = MagicMock()
-    msg.id = msg_id
-    msg.delete = AsyncMock()
-    msg.edit = AsyncMock()
-    return msg
+def _make_mock_message(msg_id: int = 999) -> SimpleNamespace:
+    """Create a stand-in Discord Message with async edit/delete."""
+    return SimpleNamespace(id=msg_id, content=None, delete=AsyncMock(), edit=AsyncMock())
 
 
 @pytest.fixture
-def mock_channel() -> MagicMock:
-    channel = MagicMock()
-    channel.name = "test-channel"
-    channel.id = 3
-    channel.guild = MagicMock()
-    channel.guild.name = "TestGuild"
-
+def mock_channel() -> SimpleNamespace:
     # send returns a mock message with async methods
-    msg = _make_mock_message()
-    channel.send = AsyncMock(return_value=msg)
-    return channel
+    return SimpleNamespace(
+        name="test-channel",
+        id=3,
+        guild=SimpleNamespace(id=1, name="TestGuild"),
+        send=AsyncMock(return_value=_make_mock_message()),
+    )
 
 
 @pytest.fixture
@@ -176,19 +169,17 @@ def mock_generator() -> MagicMock:
 
 
 class TestPipelineHappyPath:
-    @pytest.mark.asyncio
     async def test_full_pipeline_success(
         self,
         cfg: Config,
         recording: DetectedRecording,
         mock_session: MagicMock,
-        mock_channel: MagicMock,
+        mock_channel: SimpleNamespace,
         mock_transcriber: MagicMock,
         mock_generator: MagicMock,
         state_store: StateStore,
-        tmp_path: Path,
     ) -> None:
-        tracks = _make_tracks(tmp_path)
+        tracks = _make_tracks()
 
         with patch("src.pipeline._stage_download", new_callable=AsyncMock) as mock_dl:
             mock_dl.return_value = tracks
@@ -222,19 +213,17 @@ class TestPipelineHappyPath:
         first_msg = mock_channel.send.return_value
         first_msg.delete.assert_called()
 
-    @pytest.mark.asyncio
     async def test_pipeline_posts_status_updates(
         self,
         cfg: Config,
         recording: DetectedRecording,
         mock_session: MagicMock,
-        mock_channel: MagicMock,
+        mock_channel: SimpleNamespace,
         mock_transcriber: MagicMock,
         mock_generator: MagicMock,
         state_store: StateStore,
-        tmp_path: Path,
     ) -> None:
-        tracks = _make_tracks(tmp_path)
+        tracks = _make_tracks()
 
         with patch("src.pipeline._stage_download", new_callable=AsyncMock) as mock_dl:
             mock_dl.return_value = tracks
@@ -260,100 +249,43 @@ class TestPipelineHappyPath:
 # ---------------------------------------------------------------------------
 
 
-class TestPipelineDownloadFailure:
-    @pytest.mark.asyncio
-    async def test_download_failure_posts_error(
-        self,
-        cfg: Config,
-        recording: DetectedRecording,
-        mock_session: MagicMock,
-        mock_channel: MagicMock,
-        mock_transcriber: MagicMock,
-        mock_generator: MagicMock,
-        state_store: StateStore,
-    ) -> None:
-        with patch("src.pipeline._stage_download", new_callable=AsyncMock) as mock_dl:
-            mock_dl.side_effect = AudioAcquisitionError("Download failed")
-
-            with pytest.raises(AudioAcquisitionError):
-                await run_pipeline(
-                    recording=recording,
-                    session=mock_session,
-                    cfg=cfg,
-                    transcriber=mock_transcriber,
-                    generator=mock_generator,
-                    output_channel=mock_channel,
-                    state_store=state_store,
-                )
-
-        # Error embed should have been posted
-        send_calls = mock_channel.send.call_args_list
-        # At least one call should contain an embed (error embed)
-        has_embed = any(
-            c.kwargs.get("embed") is not None
-            for c in send_calls
-            if c.kwargs
-        )
-        assert has_embed or len(send_calls) >= 2
-
-        # Generator should NOT have been called
-        mock_generator.generate.assert_not_called()
-
-
-class TestPipelineTranscriptionFailure:
-    @pytest.mark.asyncio
-    async def test_transcription_failure_posts_error(
-        self,
-        cfg: Config,
-        recording: DetectedRecording,
-        mock_session: MagicMock,
-        mock_channel: MagicMock,
-        mock_transcriber: MagicMock,
-        mock_generator: MagicMock,
-        state_store: StateStore,
-        tmp_path: Path,
-    ) -> None:
-        tracks = _make_tracks(tmp_path)
-        mock_transcriber.transcribe_all.side_effect = TranscriptionError("OOM")
-
-        with patch("src.pipeline._stage_download", new_callable=AsyncMock) as mock_dl:
-            mock_dl.return_value = tracks
-
-            with pytest.raises(TranscriptionError):
-                await run_pipeline(
-                    recording=recording,
-                    session=mock_session,
-                    cfg=cfg,
-                    transcriber=mock_transcriber,
-                    generator=mock_generator,
-                    output_channel=mock_channel,
-                    state_store=state_store,
-                )
-
-        # Generator should NOT have been called
-        mock_generator.generate.assert_not_called()
-
-
-class TestPipelineGenerationFailure:
-    @pytest.mark.asyncio
-    async def test_generation_failure_posts_error(
+class TestPipelineStageFailure:
+    @pytest.mark.parametrize(
+        ("breaker", "exc_cls", "match"),
+        [
+            ("download", AudioAcquisitionError, None),
+            ("transcribe", TranscriptionError, None),
+            ("generate", GenerationError, None),
+            ("empty", TranscriptionError, "empty"),
+        ],
+    )
+    async def test_stage_failure(
         self,
+        breaker: str,
+        exc_cls: type[Exception],
+        match: str | None,
         cfg: Config,
         recording: DetectedRecording,
         mock_session: MagicMock,
-        mock_channel: MagicMock,
+        mock_channel: SimpleNamespace,
         mock_transcriber: MagicMock,
         mock_generator: MagicMock,
         state_store: StateStore,
-        tmp_path: Path,
     ) -> None:
-        tracks = _make_tracks(tmp_path)
-        mock_generator.generate.side_effect = GenerationError("API error")
+        if breaker == "transcribe":
+            mock_transcriber.transcribe_all.side_effect = TranscriptionError("OOM")
+        elif breaker == "generate":
+            mock_generator.generate.side_effect = GenerationError("API error")
+        elif breaker == "empty":
+            mock_transcriber.transcribe_all.return_value = []
 
         with patch("src.pipeline._stage_download", new_callable=AsyncMock) as mock_dl:
-            mock_dl.return_value = tracks
+            if breaker == "download":
+                mock_dl.side_effect = AudioAcquisitionError("Download failed")
+            else:
+                mock_dl.return_value = _make_tracks()
 
-            with pytest.raises(GenerationError):
+            with pytest.raises(exc_cls, match=match):
                 await run_pipeline(
                     recording=recording,
                     session=mock_session,
@@ -364,24 +296,35 @@ class TestPipelineGenerationFailure:
                     state_store=state_store,
                 )
 
-        # Transcriber should have been called
-        mock_transcriber.transcribe_all.assert_called_once()
+        if breaker == "generate":
+            mock_transcriber.transcribe_all.assert_called_once()
+        else:
+            # Generation is never reached
+            mock_generator.generate.assert_not_called()
+
+        if breaker == "download":
+            # At least one call should contain an embed (error embed)
+            send_calls = mock_channel.send.call_args_list
+            has_embed = any(
+                c.kwargs.get("embed") is not None
+                for c in send_calls
+                if c.kwargs
+            )
+            assert has_embed or len(send_calls) >= 2
 
 
 class TestPipelinePostingFailure:
-    @pytest.mark.asyncio
     async def test_posting_failure_still_logs(
         self,
         cfg: Config,
         recording: DetectedRecording,
         mock_session: MagicMock,
-        mock_channel: MagicMock,
+        mock_channel: SimpleNamespace,
         mock_transcriber: MagicMock,
         mock_generator: MagicMock,
         state_store: StateStore,
-        tmp_path: Path,
     ) -> None:
-        tracks = _make_tracks(tmp_path)
+        tracks = _make_tracks()
 
         # Make the minutes post fail but error post succeed
         call_count = 0
@@ -397,11 +340,7 @@ class TestPipelinePostingFailure:
                     response=MagicMock(status=500),
                     message="Internal Server Error",
                 )
-            msg = MagicMock()
-            msg.id = call_count
-            msg.delete = AsyncMock()
-            msg.edit = AsyncMock()
-            return msg
+            return _make_mock_message(call_count)
 
         mock_channel.send = AsyncMock(side_effect=_send_side_effect)
 
@@ -420,56 +359,19 @@ class TestPipelinePostingFailure:
                 )
 
 
-class TestPipelineEmptyTranscript:
-    @pytest.mark.asyncio
-    async def test_empty_transcript_raises(
-        self,
-        cfg: Config,
-        recording: DetectedRecording,
-        mock_session: MagicMock,
-        mock_channel: MagicMock,
-        mock_transcriber: MagicMock,
-        mock_generator: MagicMock,
-        state_store: StateStore,
-        tmp_path: Path,
-    ) -> None:
-        tracks = _make_tracks(tmp_path)
-        # Return empty segments
-        mock_transcriber.transcribe_all.return_value = []
-
-        with patch("src.pipeline._stage_download", new_callable=AsyncMock) as mock_dl:
-            mock_dl.return_value = tracks
-
-            with pytest.raises(TranscriptionError, match="empty"):
-                await run_pipeline(
-                    recording=recording,
-                    session=mock_session,
-                    cfg=cfg,
-                    transcriber=mock_transcriber,
-                    generator=mock_generator,
-                    output_channel=mock_channel,
-                    state_store=state_store,
-                )
-
-        # Generator should NOT have been called
-        mock_generator.generate.assert_not_called()
-
-
 class TestPipelineSpeakerAnalytics:
-    @pytest.mark.asyncio
     async def test_speaker_stats_passed_to_post_minutes(
         self,
         cfg: Config,
         recording: DetectedRecording,
         mock_session: MagicMock,
-        mock_channel: MagicMock,
+        mock_channel: SimpleNamespace,
         mock_transcriber: MagicMock,
         mock_generator: MagicMock,
         state_store: StateStore,
-        tmp_path: Path,
     ) -> None:
         """When speaker_analytics is enabled, stats are passed to post_minutes."""
-        tracks = _make_tracks(tmp_path)
+        tracks = _make_tracks()
 
         with (
             patch("src.pipeline._stage_download", new_callable=AsyncMock) as mock_dl,
@@ -493,20 +395,18 @@ class TestPipelineSpeakerAnalytics:
         assert call_kwargs["speaker_stats"] is not None
         assert "alice" in call_kwargs["speaker_stats"]
 
-    @pytest.mark.asyncio
     async def test_speaker_stats_disabled(
         self,
         recording: DetectedRecording,
         mock_session: MagicMock,
-        mock_channel: MagicMock,
+        mock_channel: SimpleNamespace,
         mock_transcriber: MagicMock,
         mock_generator: MagicMock,
         state_store: StateStore,
-        tmp_path: Path,
     ) -> None:
         """When speaker_analytics is disabled, stats are None."""
         cfg = _make_config(speaker_analytics=SpeakerAnalyticsConfig(enabled=False))
-        tracks = _make_tracks(tmp_path)
+        tracks = _make_tracks()
 
         with (
             patch("src.pipeline._stage_download", new_callable=AsyncMock) as mock_dl,
@@ -531,20 +431,18 @@ class TestPipelineSpeakerAnalytics:
 
 
 class TestPipelineTranscriptAttachment:
-    @pytest.mark.asyncio
     async def test_transcript_md_passed_when_enabled(
         self,
         recording: DetectedRecording,
         mock_session: MagicMock,
-        mock_channel: MagicMock,
+        mock_channel: SimpleNamespace,
         mock_transcriber: MagicMock,
         mock_generator: MagicMock,
         state_store: StateStore,
-        tmp_path: Path,
     ) -> None:
         """When include_transcript=True, transcript_md is passed to post_minutes."""
         cfg = _make_config(poster=PosterConfig(include_transcript=True))
-        tracks = _make_tracks(tmp_path)
+        tracks = _make_tracks()
 
         with (
             patch("src.pipeline._stage_download", new_callable=AsyncMock) as mock_dl,
@@ -568,20 +466,18 @@ class TestPipelineTranscriptAttachment:
         assert call_kwargs["transcript_md"] is not None
         assert "# 文字起こし" in call_kwargs["transcript_md"]
 
-    @pytest.mark.asyncio
     async def test_transcript_md_none_when_disabled(
         self,
         recording: DetectedRecording,
         mock_session: MagicMock,
-        mock_channel: MagicMock,
+        mock_channel: SimpleNamespace,
         mock_transcriber: MagicMock,
         mock_generator: MagicMock,
         state_store: StateStore,
-        tmp_path: Path,
     ) -> None:
         """When include_transcript=False (default), transcript_md is None."""
         cfg = _make_config(poster=PosterConfig(include_transcript=False))
-        tracks = _make_tracks(tmp_path)
+        tracks = _make_tracks()
 
         with (
             patch("src.pipeline._stage_download", new_callable=AsyncMock) as mock_dl,
@@ -614,6 +510,11 @@ class TestTranscriptHash:
         assert h1 != h2
         assert h1 == h3
 
+    def test_transcript_hash_includes_generation_key(self) -> None:
+        h1 = _transcript_hash("hello world", "minutes", "claude:model-a:0.3")
+        h2 = _transcript_hash("hello world", "minutes", "claude:model-b:0.3")
+        assert h1 != h2
+
     def test_transcript_hash_default_is_minutes(self) -> None:
         """Default template_name is 'minutes'."""
         h_default = _transcript_hash("hello world")
@@ -627,11 +528,10 @@ class TestTranscriptHash:
 
 
 class TestPipelineArchive:
-    @pytest.mark.asyncio
     async def test_pipeline_archives_minutes(
         self,
         cfg: Config,
-        mock_channel: MagicMock,
+        mock_channel: SimpleNamespace,
         mock_transcriber: MagicMock,
         mock_generator: MagicMock,
         state_store: StateStore,
@@ -640,7 +540,7 @@ class TestPipelineArchive:
         """Pipeline success triggers archive.store() with correct metadata."""
         from src.minutes_archive import MinutesArchive
 
-        tracks = _make_tracks(tmp_path)
+        tracks = _make_tracks()
         archive = MinutesArchive(tmp_path / "archive.db")
 
         mock_channel.guild.id = 1
@@ -664,21 +564,19 @@ class TestPipelineArchive:
         assert len(results) == 1
         archive.close()
 
-    @pytest.mark.asyncio
     async def test_pipeline_archive_failure_non_blocking(
         self,
         cfg: Config,
-        mock_channel: MagicMock,
+        mock_channel: SimpleNamespace,
         mock_transcriber: MagicMock,
         mock_generator: MagicMock,
         state_store: StateStore,
-        tmp_path: Path,
     ) -> None:
         """archive.store() failure does not block the pipeline."""
         mock_archive = MagicMock()
         mock_archive.store.side_effect = RuntimeError("DB write failed")
 
-        tracks = _make_tracks(tmp_path)
+        tracks = _make_tracks()
         mock_channel.guild.id = 1
 
         with patch("src.pipeline.post_minutes", new_callable=AsyncMock) as mock_post:
@@ -700,20 +598,18 @@ class TestPipelineArchive:
         # archive.store was attempted
         mock_archive.store.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_pipeline_no_archive_when_disabled(
         self,
-        mock_channel: MagicMock,
+        mock_channel: SimpleNamespace,
         mock_transcriber: MagicMock,
         mock_generator: MagicMock,
         state_store: StateStore,
-        tmp_path: Path,
     ) -> None:
         """When minutes_archive.enabled=False, archive.store() is not called."""
         cfg = _make_config(minutes_archive=MinutesArchiveConfig(enabled=False))
         mock_archive = MagicMock()
 
-        tracks = _make_tracks(tmp_path)
+        tracks = _make_tracks()
         mock_channel.guild.id = 1
 
         with patch("src.pipeline.post_minutes", new_callable=AsyncMock) as mock_post:
@@ -735,7 +631,6 @@ class TestPipelineArchive:
 class TestPipelineNoChannel:
     """Pipeline must still transcribe + generate + archive when output_channel is None."""
 
-    @pytest.mark.asyncio
     async def test_runs_without_channel(
         self,
         cfg: Config,
@@ -746,7 +641,7 @@ class TestPipelineNoChannel:
     ) -> None:
         from src.minutes_archive import MinutesArchive
 
-        tracks = _make_tracks(tmp_path)
+        tracks = _make_tracks()
         archive = MinutesArchive(tmp_path / "archive.db")
 
         with patch("src.pipeline.post_minutes", new_callable=AsyncMock) as mock_post:
@@ -771,19 +666,17 @@ class TestPipelineNoChannel:
         assert archive.count(42) == 1
         archive.close()
 
-    @pytest.mark.asyncio
     async def test_no_channel_no_post_error_on_failure(
         self,
         cfg: Config,
         mock_transcriber: MagicMock,
         mock_generator: MagicMock,
         state_store: StateStore,
-        tmp_path: Path,
     ) -> None:
         """When output_channel is None and generation fails, post_error is skipped."""
         from src.errors import GenerationError
 
-        tracks = _make_tracks(tmp_path)
+        tracks = _make_tracks()
         mock_generator.generate.side_effect = GenerationError("boom")
 
         with patch("src.pipeline.post_error", new_callable=AsyncMock) as mock_post_err:
@@ -802,20 +695,18 @@ class TestPipelineNoChannel:
 
 
 class TestPipelineErrorRoleParam:
-    @pytest.mark.asyncio
     async def test_error_role_param_passed_to_post_error(
         self,
         cfg: Config,
         recording: DetectedRecording,
         mock_session: MagicMock,
-        mock_channel: MagicMock,
+        mock_channel: SimpleNamespace,
         mock_transcriber: MagicMock,
         mock_generator: MagicMock,
         state_store: StateStore,
-        tmp_path: Path,
     ) -> None:
         """error_mention_role_id parameter is forwarded to post_error on failure."""
-        tracks = _make_tracks(tmp_path)
+        tracks = _make_tracks()
         mock_generator.generate.side_effect = GenerationError("API error")
 
         with (
@@ -839,20 +730,18 @@ class TestPipelineErrorRoleParam:
         mock_post_err.assert_called_once()
         assert mock_post_err.call_args.kwargs["error_mention_role_id"] == 12345
 
-    @pytest.mark.asyncio
     async def test_error_role_param_default_none(
         self,
         cfg: Config,
         recording: DetectedRecording,
         mock_session: MagicMock,
-        mock_channel: MagicMock,
+        mock_channel: SimpleNamespace,
         mock_transcriber: MagicMock,
         mock_generator: MagicMock,
         state_store: StateStore,
-        tmp_path: Path,
     ) -> None:
         """error_mention_role_id defaults to None when not provided."""
-        tracks = _make_tracks(tmp_path)
+        tracks = _make_tracks()
         mock_generator.generate.side_effect = GenerationError("API error")
 
         with (
@@ -882,18 +771,16 @@ class TestPipelineErrorRoleParam:
 
 
 class TestPipelineGlossary:
-    @pytest.mark.asyncio
     async def test_glossary_applied_when_enabled(
         self,
-        mock_channel: MagicMock,
+        mock_channel: SimpleNamespace,
         mock_transcriber: MagicMock,
         mock_generator: MagicMock,
         state_store: StateStore,
-        tmp_path: Path,
     ) -> None:
         """When glossary is enabled and non-empty, segments are corrected."""
         cfg = _make_config(transcript_glossary=TranscriptGlossaryConfig(enabled=True))
-        tracks = _make_tracks(tmp_path)
+        tracks = _make_tracks()
         mock_channel.guild.id = 1
 
         # Set a glossary entry
@@ -915,18 +802,16 @@ class TestPipelineGlossary:
         call_kwargs = mock_generator.generate.call_args.kwargs
         assert "Corrected" in call_kwargs["transcript"]
 
-    @pytest.mark.asyncio
     async def test_glossary_skipped_when_disabled(
         self,
-        mock_channel: MagicMock,
+        mock_channel: SimpleNamespace,
         mock_transcriber: MagicMock,
         mock_generator: MagicMock,
         state_store: StateStore,
-        tmp_path: Path,
     ) -> None:
         """When glossary is disabled, segments are not modified."""
         cfg = _make_config(transcript_glossary=TranscriptGlossaryConfig(enabled=False))
-        tracks = _make_tracks(tmp_path)
+        tracks = _make_tracks()
         mock_channel.guild.id = 1
 
         state_store.set_guild_glossary(1, {"Hello": "Corrected"})
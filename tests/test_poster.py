@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import discord
@@ -9,7 +11,8 @@ import pytest
 
 from src.config import PosterConfig
 from src.poster import (
-    _extract_section,
+    _parse_sections,
+    _rate_limit_delay,
     _truncate,
     build_error_embed,
     build_minutes_embed,
@@ -19,9 +22,15 @@ from src.poster import (
     post_minutes,
     send_status_update,
 )
-from src.poster import _SUMMARY_PATTERN, _DECISIONS_PATTERN
 
 _CFG = PosterConfig()
+_CFG_SMALL = PosterConfig(max_embed_length=200)
+
+# Summary far past the 1024-char embed field limit
+_LONG_SUMMARY_MINUTES = "## まとめ\n" + "あ" * 2000 + "\n## 推奨される次のステップ\n- テスト"
+
+_FILE_TEXT = "テスト内容"
+_FILE_BYTES = _FILE_TEXT.encode("utf-8")
 
 _SAMPLE_MINUTES = """\
 # 会議議事録
@@ -56,61 +65,85 @@ Aliceより現状報告が行われ、順調に進んでいることが確認さ
 
 
 class TestTruncate:
-    def test_no_truncation_needed(self) -> None:
-        assert _truncate("short", 100) == "short"
-
-    def test_truncation_with_ellipsis(self) -> None:
-        result = _truncate("a" * 20, 10)
-        assert len(result) == 10
-        assert result.endswith("...")
-
-    def test_exact_length(self) -> None:
-        text = "exact"
-        assert _truncate(text, 5) == "exact"
-
-
-# --- _extract_section ---
-
-
-class TestExtractSection:
-    def test_extract_summary(self) -> None:
-        result = _extract_section(_SAMPLE_MINUTES, _SUMMARY_PATTERN)
-        assert "進捗確認" in result
-        assert "マイルストーン" in result
-
-    def test_extract_next_steps(self) -> None:
-        result = _extract_section(_SAMPLE_MINUTES, _DECISIONS_PATTERN)
-        assert "タスクA" in result
-        assert "Bob" in result
+    @pytest.mark.parametrize(
+        ("text", "limit", "expected"),
+        [
+            ("short", 100, "short"),
+            ("a" * 20, 10, "a" * 7 + "..."),
+            ("exact", 5, "exact"),
+        ],
+        ids=["no_truncation_needed", "truncation_with_ellipsis", "exact_length"],
+    )
+    def test_truncate(self, text: str, limit: int, expected: str) -> None:
+        assert _truncate(text, limit) == expected
+
+
+# --- _parse_sections ---
+
+
+@pytest.fixture(scope="module")
+def sample_sections() -> Mapping[str, str]:
+    """The parsed sections of _SAMPLE_MINUTES, shared by the extraction tests."""
+    return _parse_sections(_SAMPLE_MINUTES)
+
+
+class TestParseSections:
+    @pytest.mark.parametrize(
+        ("heading", "expected"),
+        [
+            ("まとめ", ("進捗確認", "マイルストーン")),
+            ("推奨される次のステップ", ("タスクA", "Bob")),
+        ],
+        ids=["summary", "next_steps"],
+    )
+    def test_extract_section(
+        self, sample_sections: Mapping[str, str], heading: str, expected: tuple[str, ...],
+    ) -> None:
+        result = sample_sections[heading]
+        for text in expected:
+            assert text in result
+
+    def test_all_headings_in_order(self, sample_sections: Mapping[str, str]) -> None:
+        assert list(sample_sections) == ["まとめ", "詳細", "推奨される次のステップ"]
+
+    def test_result_is_cached_and_read_only(self, sample_sections: Mapping[str, str]) -> None:
+        assert _parse_sections(_SAMPLE_MINUTES) is sample_sections
+        with pytest.raises(TypeError):
+            sample_sections["まとめ"] = "changed"  # type: ignore[index]
+
+    def test_subheadings_stay_in_body(self) -> None:
+        md = "## まとめ  \n概要\n### 補足\n詳細\n## 次\nx"
+        assert _parse_sections(md) == {"まとめ": "概要\n### 補足\n詳細", "次": "x"}
 
     def test_extract_missing_section(self) -> None:
-        result = _extract_section("no sections here", _SUMMARY_PATTERN)
-        assert result == ""
+        assert _parse_sections("no sections here") == {}
 
 
 # --- build_minutes_embed ---
 
 
+@pytest.fixture(scope="class")
+def sample_embed() -> discord.Embed:
+    """The default-config embed for _SAMPLE_MINUTES; tests must not modify it."""
+    return build_minutes_embed(_SAMPLE_MINUTES, "2026-02-10", "Alice, Bob", _CFG)
+
+
 class TestBuildMinutesEmbed:
-    def test_embed_has_title(self) -> None:
-        embed = build_minutes_embed(_SAMPLE_MINUTES, "2026-02-10", "Alice, Bob", _CFG)
-        assert "2026-02-10" in embed.title
-        assert "会議議事録" in embed.title
+    def test_embed_has_title(self, sample_embed: discord.Embed) -> None:
+        assert "2026-02-10" in sample_embed.title
+        assert "会議議事録" in sample_embed.title
 
-    def test_embed_has_fields(self) -> None:
-        embed = build_minutes_embed(_SAMPLE_MINUTES, "2026-02-10", "Alice, Bob", _CFG)
-        field_names = [f.name for f in embed.fields]
+    def test_embed_has_fields(self, sample_embed: discord.Embed) -> None:
+        field_names = [f.name for f in sample_embed.fields]
         assert "参加者" in field_names
         assert "まとめ" in field_names
         assert "次のステップ" in field_names
 
-    def test_embed_color(self) -> None:
-        embed = build_minutes_embed(_SAMPLE_MINUTES, "2026-02-10", "Alice", _CFG)
-        assert embed.color.value == 0x5865F2
+    def test_embed_color(self, sample_embed: discord.Embed) -> None:
+        assert sample_embed.color.value == 0x5865F2
 
-    def test_embed_footer(self) -> None:
-        embed = build_minutes_embed(_SAMPLE_MINUTES, "2026-02-10", "Alice", _CFG)
-        assert "添付ファイル" in embed.footer.text
+    def test_embed_footer(self, sample_embed: discord.Embed) -> None:
+        assert "添付ファイル" in sample_embed.footer.text
 
     def test_embed_no_speakers(self) -> None:
         embed = build_minutes_embed(_SAMPLE_MINUTES, "2026-02-10", "", _CFG)
@@ -118,27 +151,33 @@ class TestBuildMinutesEmbed:
         assert "参加者" not in field_names
 
     def test_embed_long_summary_truncated(self) -> None:
-        long_summary = "## まとめ\n" + "あ" * 2000 + "\n## 推奨される次のステップ\n- テスト"
-        embed = build_minutes_embed(long_summary, "2026-02-10", "Alice", _CFG)
-        summary_field = next(f for f in embed.fields if f.name == "まとめ")
-        assert len(summary_field.value) <= 1024
+        embed = build_minutes_embed(_LONG_SUMMARY_MINUTES, "2026-02-10", "Alice", _CFG)
+        fields_by_name = {f.name: f for f in embed.fields}
+        assert len(fields_by_name["まとめ"].value) <= 1024
 
     def test_embed_respects_max_length(self) -> None:
-        cfg = PosterConfig(max_embed_length=200)
-        embed = build_minutes_embed(_SAMPLE_MINUTES, "2026-02-10", "Alice, Bob", cfg)
+        embed = build_minutes_embed(_SAMPLE_MINUTES, "2026-02-10", "Alice, Bob", _CFG_SMALL)
         total = len(embed.title or "") + sum(
             len(f.name) + len(f.value) for f in embed.fields
         ) + len(embed.footer.text or "")
         # Should have been trimmed to fit
-        assert total <= 400  # allow some tolerance for field names
+        assert total <= _CFG_SMALL.max_embed_length
+
+    def test_embed_trim_keeps_leading_fields_intact(self) -> None:
+        embed = build_minutes_embed(
+            _SAMPLE_MINUTES, "2026-02-10", "Alice, Bob", _CFG_SMALL, event_title="定例会議",
+        )
+        fields = {f.name: f.value for f in embed.fields}
+        assert fields["会議名"] == "定例会議"
+        assert fields["参加者"] == "Alice, Bob"
+        assert fields["まとめ"].endswith("...")
 
     def test_embed_with_speaker_stats(self) -> None:
         stats_text = "alice    \u2588\u2588\u2588\u2588\u2588\u2588\u2588\u2588\u2591\u2591  8:32  1,204\u5b57"
         embed = build_minutes_embed(_SAMPLE_MINUTES, "2026-02-10", "Alice", _CFG, speaker_stats=stats_text)
-        field_names = [f.name for f in embed.fields]
-        assert "\U0001f4ca \u8a71\u8005\u7d71\u8a08" in field_names
-        stats_field = next(f for f in embed.fields if "\u7d71\u8a08" in f.name)
-        assert "alice" in stats_field.value
+        fields_by_name = {f.name: f for f in embed.fields}
+        assert "\U0001f4ca \u8a71\u8005\u7d71\u8a08" in fields_by_name
+        assert "alice" in fields_by_name["\U0001f4ca \u8a71\u8005\u7d71\u8a08"].value
 
     def test_embed_without_speaker_stats(self) -> None:
         embed = build_minutes_embed(_SAMPLE_MINUTES, "2026-02-10", "Alice", _CFG, speaker_stats=None)
@@ -181,28 +220,52 @@ class TestBuildMinutesFile:
         assert f.filename == "minutes_2026-02-10.md"
 
     def test_file_content(self) -> None:
-        f = build_minutes_file("テスト内容", "2026-02-10")
+        f = build_minutes_file(_FILE_TEXT, "2026-02-10")
         data = f.fp.read()
-        assert data == "テスト内容".encode("utf-8")
+        assert data == _FILE_BYTES
+
+    def test_file_from_encoded_bytes(self) -> None:
+        f = build_minutes_file(_FILE_BYTES, "2026-02-10")
+        assert f.fp.read() == _FILE_BYTES
 
     def test_file_date_sanitization(self) -> None:
         f = build_minutes_file("content", "2026/02/10 14:00")
-        assert "/" not in f.filename
-        assert " " not in f.filename
+        assert f.filename == "minutes_2026-02-10_14-00.md"
+
+
+# --- _rate_limit_delay ---
+
+
+class TestRateLimitDelay:
+    def test_uses_retry_after_with_jitter(self) -> None:
+        exc = SimpleNamespace(retry_after=4.0)
+        for _ in range(20):
+            assert 4.0 <= _rate_limit_delay(exc, 1) <= 5.0
+
+    def test_uses_reset_after_header(self) -> None:
+        exc = SimpleNamespace(response=SimpleNamespace(headers={"X-RateLimit-Reset-After": "2.5"}))
+        assert 2.5 <= _rate_limit_delay(exc, 1) <= 2.5 * 1.25
+
+    def test_falls_back_to_capped_exponential(self) -> None:
+        exc = SimpleNamespace()
+        assert 4.0 <= _rate_limit_delay(exc, 3) <= 5.0
+        assert 30.0 <= _rate_limit_delay(exc, 10) <= 37.5
 
 
 # --- post_minutes mention ---
 
 
+def _text_channel(send_return: object = None) -> SimpleNamespace:
+    """Stand-in for a TextChannel; the poster only type-checks for ForumChannel."""
+    if send_return is None:
+        send_return = SimpleNamespace(id=1)
+    return SimpleNamespace(name="test", id=3, send=AsyncMock(return_value=send_return))
+
+
 class TestPostMinutesMention:
-    @pytest.mark.asyncio
     async def test_mention_user_ids_included(self) -> None:
         cfg = PosterConfig(mention_user_ids=(111, 222))
-        channel = MagicMock(spec=discord.TextChannel)
-        msg = MagicMock()
-        msg.id = 1
-        channel.send = AsyncMock(return_value=msg)
-        channel.name = "test"
+        channel = _text_channel()
 
         await post_minutes(channel, _SAMPLE_MINUTES, "2026-02-10", "Alice", cfg)
 
@@ -210,28 +273,18 @@ class TestPostMinutesMention:
         assert "<@111>" in call_kwargs["content"]
         assert "<@222>" in call_kwargs["content"]
 
-    @pytest.mark.asyncio
     async def test_no_mention_when_empty(self) -> None:
         cfg = PosterConfig(mention_user_ids=())
-        channel = MagicMock(spec=discord.TextChannel)
-        msg = MagicMock()
-        msg.id = 1
-        channel.send = AsyncMock(return_value=msg)
-        channel.name = "test"
+        channel = _text_channel()
 
         await post_minutes(channel, _SAMPLE_MINUTES, "2026-02-10", "Alice", cfg)
 
         call_kwargs = channel.send.call_args.kwargs
         assert call_kwargs["content"] is None
 
-    @pytest.mark.asyncio
     async def test_text_channel_sends_files_list(self) -> None:
         """TextChannel should use files= (list) instead of file=."""
-        channel = MagicMock(spec=discord.TextChannel)
-        msg = MagicMock()
-        msg.id = 1
-        channel.send = AsyncMock(return_value=msg)
-        channel.name = "test"
+        channel = _text_channel()
 
         await post_minutes(channel, _SAMPLE_MINUTES, "2026-02-10", "Alice", _CFG)
 
@@ -239,14 +292,9 @@ class TestPostMinutesMention:
         assert "files" in call_kwargs
         assert len(call_kwargs["files"]) == 1  # no transcript
 
-    @pytest.mark.asyncio
     async def test_text_channel_with_transcript(self) -> None:
         """When transcript_md is provided, two files should be attached."""
-        channel = MagicMock(spec=discord.TextChannel)
-        msg = MagicMock()
-        msg.id = 1
-        channel.send = AsyncMock(return_value=msg)
-        channel.name = "test"
+        channel = _text_channel()
 
         await post_minutes(
             channel, _SAMPLE_MINUTES, "2026-02-10", "Alice", _CFG,
@@ -261,26 +309,21 @@ class TestPostMinutesMention:
 
 
 def _make_forum_channel() -> MagicMock:
-    """Create a mock ForumChannel with create_thread returning ThreadWithMessage."""
+    """Create a mock ForumChannel with create_thread returning ThreadWithMessage.
+
+    Only the channel needs ``spec=``, for the poster's isinstance check.
+    """
     channel = MagicMock(spec=discord.ForumChannel)
     channel.name = "test-forum"
 
-    msg = MagicMock(spec=discord.Message)
-    msg.id = 42
-
-    thread = MagicMock(spec=discord.Thread)
-    thread.send = AsyncMock(return_value=MagicMock(spec=discord.Message))
-
+    thread = SimpleNamespace(send=AsyncMock(return_value=SimpleNamespace(id=43)))
     # create_thread returns ThreadWithMessage(thread, message)
-    thread_result = MagicMock()
-    thread_result.thread = thread
-    thread_result.message = msg
+    thread_result = SimpleNamespace(thread=thread, message=SimpleNamespace(id=42))
     channel.create_thread = AsyncMock(return_value=thread_result)
     return channel
 
 
 class TestPostMinutesForum:
-    @pytest.mark.asyncio
     async def test_forum_creates_thread(self) -> None:
         channel = _make_forum_channel()
 
@@ -294,7 +337,6 @@ class TestPostMinutesForum:
         assert "file" not in call_kwargs
         assert result.id == 42
 
-    @pytest.mark.asyncio
     async def test_forum_sends_files_in_thread(self) -> None:
         channel = _make_forum_channel()
 
@@ -307,7 +349,6 @@ class TestPostMinutesForum:
         assert call_kwargs["files"] is not None
         assert len(call_kwargs["files"]) >= 1
 
-    @pytest.mark.asyncio
     async def test_forum_thread_includes_mentions(self) -> None:
         cfg = PosterConfig(mention_user_ids=(111, 222))
         channel = _make_forum_channel()
@@ -318,7 +359,6 @@ class TestPostMinutesForum:
         assert "<@111>" in call_kwargs["content"]
         assert "<@222>" in call_kwargs["content"]
 
-    @pytest.mark.asyncio
     async def test_forum_no_mention_when_empty(self) -> None:
         cfg = PosterConfig(mention_user_ids=())
         channel = _make_forum_channel()
@@ -330,7 +370,6 @@ class TestPostMinutesForum:
 
 
 class TestPostErrorForum:
-    @pytest.mark.asyncio
     async def test_forum_creates_error_thread(self) -> None:
         channel = _make_forum_channel()
 
@@ -344,7 +383,6 @@ class TestPostErrorForum:
 
 
 class TestPostMinutesForumWithTranscript:
-    @pytest.mark.asyncio
     async def test_forum_sends_two_files_with_transcript(self) -> None:
         channel = _make_forum_channel()
 
@@ -357,7 +395,6 @@ class TestPostMinutesForumWithTranscript:
         call_kwargs = thread_result.thread.send.call_args.kwargs
         assert len(call_kwargs["files"]) == 2
 
-    @pytest.mark.asyncio
     async def test_forum_sends_one_file_without_transcript(self) -> None:
         channel = _make_forum_channel()
 
@@ -377,9 +414,9 @@ class TestBuildTranscriptFile:
         assert f.filename == "transcript_2026-02-10.md"
 
     def test_file_content(self) -> None:
-        f = build_transcript_file("テスト内容", "2026-02-10")
+        f = build_transcript_file(_FILE_TEXT, "2026-02-10")
         data = f.fp.read()
-        assert data == "テスト内容".encode("utf-8")
+        assert data == _FILE_BYTES
 
     def test_file_date_sanitization(self) -> None:
         f = build_transcript_file("content", "2026/02/10 14:00")
@@ -388,20 +425,27 @@ class TestBuildTranscriptFile:
 
 
 class TestSendStatusUpdateForum:
-    @pytest.mark.asyncio
     async def test_forum_skips_status_update(self) -> None:
         channel = MagicMock(spec=discord.ForumChannel)
         result = await send_status_update(channel, None, "status text")
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_text_channel_sends_status(self) -> None:
-        channel = MagicMock(spec=discord.TextChannel)
-        msg = MagicMock(spec=discord.Message)
-        msg.id = 1
-        channel.send = AsyncMock(return_value=msg)
+        channel = _text_channel()
 
         result = await send_status_update(channel, None, "status text")
 
         channel.send.assert_called_once_with("status text")
         assert result is not None
+
+    async def test_unchanged_text_skips_edit(self) -> None:
+        channel = _text_channel()
+        msg = MagicMock(spec=discord.Message)
+        msg.content = "old"
+        msg.edit = AsyncMock()
+
+        await send_status_update(channel, msg, "new")
+        await send_status_update(channel, msg, "new")
+
+        msg.edit.assert_awaited_once_with(content="new")
+        assert msg.content == "new"
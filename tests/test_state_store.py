@@ -25,8 +25,16 @@ def _make_store(tmp_path: Path, **kwargs) -> StateStore:
 
 
 def _read_processing(tmp_path: Path) -> dict:
-    """Read the processing.json file from the state directory."""
-    return json.loads((tmp_path / "state" / "processing.json").read_text(encoding="utf-8"))
+    """Read processing.json from the state directory with the journal applied."""
+    state_dir = tmp_path / "state"
+    snapshot = state_dir / "processing.json"
+    data = json.loads(snapshot.read_text(encoding="utf-8")) if snapshot.exists() else {}
+    journal = state_dir / "processing.jsonl"
+    if journal.exists():
+        for line in journal.read_text(encoding="utf-8").splitlines():
+            record = json.loads(line)
+            data[record["rec_id"]] = record["entry"]
+    return data
 
 
 def _read_cache(tmp_path: Path) -> dict:
@@ -280,6 +288,65 @@ class TestCleanupStale:
         assert not store2.is_known("stale001")
 
 
+class TestJournal:
+
+    def test_updates_append_without_rewriting_snapshot(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        store.mark_processing("rec001", source="craig", source_id="rec001", file_name="")
+        store.mark_success("rec001")
+
+        state_dir = tmp_path / "state"
+        assert not (state_dir / "processing.json").exists()
+        lines = (state_dir / "processing.jsonl").read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[-1])["entry"]["status"] == "success"
+
+    def test_replayed_and_compacted_on_load(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        store.mark_processing("rec001", source="craig", source_id="rec001", file_name="")
+        store.mark_failed("rec001", "boom")
+        with open(tmp_path / "state" / "processing.jsonl", "a", encoding="utf-8") as fh:
+            fh.write('{"rec_id": "torn"')  # crash mid-append
+
+        store2 = _make_store(tmp_path)
+        assert store2._processing["rec001"]["status"] == "error"
+        assert not (tmp_path / "state" / "processing.jsonl").exists()
+        snapshot = json.loads((tmp_path / "state" / "processing.json").read_text(encoding="utf-8"))
+        assert snapshot["rec001"]["error"] == "boom"
+
+    def test_torn_only_journal_discarded_on_load(self, tmp_path: Path) -> None:
+        state_dir = tmp_path / "state"
+        state_dir.mkdir()
+        (state_dir / "processing.jsonl").write_text('{"rec_id": "torn"', encoding="utf-8")
+
+        store = _make_store(tmp_path)
+        assert not (state_dir / "processing.jsonl").exists()
+        store.mark_processing("rec002", source="drive", source_id="f2", file_name="x.zip")
+
+        assert _make_store(tmp_path).is_known("rec002")
+
+    def test_compacts_after_threshold(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        with patch("src.state_store._JOURNAL_COMPACT_EVERY", 3):
+            for i in range(3):
+                store.mark_processing(f"r{i}", source="craig", source_id=f"r{i}", file_name="")
+
+        state_dir = tmp_path / "state"
+        assert not (state_dir / "processing.jsonl").exists()
+        assert set(json.loads((state_dir / "processing.json").read_text(encoding="utf-8"))) == {
+            "r0", "r1", "r2",
+        }
+
+    def test_close_compacts(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        store.mark_processing("rec001", source="craig", source_id="rec001", file_name="")
+        store.close()
+
+        state_dir = tmp_path / "state"
+        assert not (state_dir / "processing.jsonl").exists()
+        assert "rec001" in json.loads((state_dir / "processing.json").read_text(encoding="utf-8"))
+
+
 # ===========================================================================
 # 21-23: Minutes cache
 # ===========================================================================
@@ -330,17 +397,34 @@ class TestAtomicWrites:
         """Seed a file; mock write to raise; original is unchanged."""
         store = _make_store(tmp_path)
         store.mark_processing("rec001", source="craig", source_id="rec001", file_name="")
+        store.close()
 
         # Read the current file contents
         original = (tmp_path / "state" / "processing.json").read_text(encoding="utf-8")
 
         with patch("os.replace", side_effect=OSError("disk full")):
             store.mark_processing("rec002", source="drive", source_id="f2", file_name="test.zip")
+            store.close()
 
         # Original file should be unchanged (os.replace was blocked)
         current = (tmp_path / "state" / "processing.json").read_text(encoding="utf-8")
         assert current == original
 
+    def test_journal_kept_on_failed_compaction(self, tmp_path: Path) -> None:
+        """A record only in the journal survives a failed snapshot write."""
+        store = _make_store(tmp_path)
+        store.mark_processing("rec001", source="craig", source_id="rec001", file_name="")
+        store.close()
+
+        with patch("os.replace", side_effect=OSError("disk full")):
+            store.mark_processing("rec002", source="drive", source_id="f2", file_name="test.zip")
+            store.close()
+
+        assert (tmp_path / "state" / "processing.jsonl").exists()
+        reloaded = _make_store(tmp_path)
+        assert reloaded.is_known("rec002")
+        assert reloaded.get_entry("rec002")["source_id"] == "f2"
+
     def test_concurrent_logical_writes(self, tmp_path: Path) -> None:
         """Call mark_processing then put_cached_minutes; both files correct."""
         store = _make_store(tmp_path)
@@ -5,7 +5,9 @@ GPU tests are skipped automatically when no CUDA device is available.
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -16,6 +18,9 @@ from src.transcriber import Segment, Transcriber
 
 SAMPLE_AAC = Path("samples/1-shake344.aac")
 
+# CJK symbols through unified ideographs, plus full/half-width forms
+_CJK_RE = re.compile(r"[\u3000-\u9fff\uff00-\uffef]")
+
 # Default config for unit tests (CPU, tiny model for speed)
 _UNIT_CFG = WhisperConfig(
     model="tiny",
@@ -24,6 +29,7 @@ _UNIT_CFG = WhisperConfig(
     compute_type="float32",
     beam_size=1,
     vad_filter=False,
+    batch_size=1,
 )
 
 
@@ -32,22 +38,36 @@ _UNIT_CFG = WhisperConfig(
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture
+def dummy_aac(tmp_path: Path) -> Path:
+    """An empty placeholder audio file; the model is mocked, so it is never read."""
+    path = tmp_path / "dummy.aac"
+    path.touch()
+    return path
+
+
+@pytest.fixture
+def mocked_transcriber() -> tuple[Transcriber, MagicMock]:
+    """A Transcriber on _UNIT_CFG whose model is a fresh MagicMock."""
+    t = Transcriber(_UNIT_CFG)
+    t._model = MagicMock()
+    return t, t._model
+
+
 class TestTranscriberUnit:
     def test_not_loaded_by_default(self) -> None:
         t = Transcriber(_UNIT_CFG)
         assert t.is_loaded is False
 
-    def test_transcribe_file_before_load_raises(self, tmp_path: Path) -> None:
+    def test_transcribe_file_before_load_raises(self, dummy_aac: Path) -> None:
         t = Transcriber(_UNIT_CFG)
-        dummy = tmp_path / "dummy.aac"
-        dummy.write_bytes(b"")
         with pytest.raises(TranscriptionError, match="not loaded"):
-            t.transcribe_file(dummy, "speaker")
+            t.transcribe_file(dummy_aac, "speaker")
 
-    def test_transcribe_file_missing_file(self) -> None:
-        t = Transcriber(_UNIT_CFG)
-        # Manually set model to bypass load check
-        t._model = MagicMock()
+    def test_transcribe_file_missing_file(
+        self, mocked_transcriber: tuple[Transcriber, MagicMock]
+    ) -> None:
+        t, _ = mocked_transcriber
         with pytest.raises(TranscriptionError, match="not found"):
             t.transcribe_file(Path("/nonexistent/audio.aac"), "speaker")
 
@@ -58,50 +78,100 @@ class TestTranscriberUnit:
             t.load_model()  # second call should be no-op
             mock_cls.assert_called_once()
 
-    def test_transcribe_file_with_mock(self, tmp_path: Path) -> None:
-        t = Transcriber(_UNIT_CFG)
-
-        # Create a mock model
-        mock_segment = MagicMock()
-        mock_segment.start = 0.0
-        mock_segment.end = 2.5
-        mock_segment.text = "  テスト  "
+    def test_transcribe_file_with_mock(
+        self, dummy_aac: Path, mocked_transcriber: tuple[Transcriber, MagicMock]
+    ) -> None:
+        t, mock_model = mocked_transcriber
 
-        mock_info = MagicMock()
-        mock_info.language = "ja"
-        mock_info.language_probability = 0.95
+        mock_segment = SimpleNamespace(start=0.0, end=2.5, text="  テスト  ")
+        mock_info = SimpleNamespace(language="ja", language_probability=0.95)
 
-        mock_model = MagicMock()
         mock_model.transcribe.return_value = ([mock_segment], mock_info)
-        t._model = mock_model
-
-        dummy = tmp_path / "test.aac"
-        dummy.write_bytes(b"\x00")
 
-        result = t.transcribe_file(dummy, "Alice")
+        result = t.transcribe_file(dummy_aac, "Alice")
         assert len(result) == 1
         assert result[0].speaker == "Alice"
         assert result[0].text == "テスト"  # stripped
         assert result[0].start == 0.0
         assert result[0].end == 2.5
 
-    def test_transcribe_all_with_mock(self, tmp_path: Path) -> None:
-        from src.audio_source import SpeakerAudio, SpeakerInfo
+    @pytest.mark.parametrize("compute_type", ["int8_float16", "auto"])
+    def test_compute_type_not_rewritten(self, compute_type: str) -> None:
+        t = Transcriber(WhisperConfig(model="tiny", device="cuda", compute_type=compute_type, batch_size=1))
+        with patch("src.transcriber.WhisperModel") as mock_cls:
+            t.load_model()
+        assert mock_cls.call_args.kwargs["compute_type"] == compute_type
 
+    def test_explicit_compute_type_passes_through(self) -> None:
         t = Transcriber(_UNIT_CFG)
+        with patch("src.transcriber.WhisperModel") as mock_cls:
+            t.load_model()
+        assert mock_cls.call_args.kwargs["compute_type"] == "float32"
 
-        mock_seg1 = MagicMock(start=0.0, end=1.0, text="Hello")
-        mock_seg2 = MagicMock(start=1.0, end=2.0, text="World")
-        mock_info = MagicMock(language="ja", language_probability=0.9)
+    def test_load_model_prefers_cached_files(self, tmp_path: Path) -> None:
+        t = Transcriber(WhisperConfig(
+            model="tiny", device="cpu", batch_size=1, model_cache_dir=str(tmp_path),
+        ))
+        with patch("src.transcriber.WhisperModel") as mock_cls:
+            t.load_model()
+        mock_cls.assert_called_once()
+        assert mock_cls.call_args.kwargs["local_files_only"] is True
+        assert mock_cls.call_args.kwargs["download_root"] == str(tmp_path)
+
+    def test_load_model_downloads_on_cache_miss(self, tmp_path: Path) -> None:
+        t = Transcriber(WhisperConfig(
+            model="tiny", device="cpu", batch_size=1, model_cache_dir=str(tmp_path),
+        ))
+        with patch("src.transcriber.WhisperModel") as mock_cls:
+            mock_cls.side_effect = [FileNotFoundError("not cached"), MagicMock()]
+            t.load_model()
+        assert mock_cls.call_count == 2
+        assert "local_files_only" not in mock_cls.call_args.kwargs
+        assert t.is_loaded
+
+    def test_load_model_wraps_batched_pipeline(self) -> None:
+        t = Transcriber(WhisperConfig(model="tiny", device="cpu", batch_size=4))
+        with patch("src.transcriber.WhisperModel") as mock_model, \
+                patch("src.transcriber.BatchedInferencePipeline") as mock_pipeline:
+            t.load_model()
+        mock_pipeline.assert_called_once_with(model=mock_model.return_value)
+
+    def test_unbatched_when_batch_size_is_one(self) -> None:
+        t = Transcriber(_UNIT_CFG)
+        with patch("src.transcriber.WhisperModel"), \
+                patch("src.transcriber.BatchedInferencePipeline") as mock_pipeline:
+            t.load_model()
+        mock_pipeline.assert_not_called()
+
+    def test_transcribe_file_uses_batched_pipeline(self, dummy_aac: Path) -> None:
+        t = Transcriber(WhisperConfig(model="tiny", device="cpu", batch_size=4))
+        mock_info = SimpleNamespace(language="ja", language_probability=0.9)
+        t._model = MagicMock()
+        t._batched = MagicMock()
+        t._batched.transcribe.return_value = ([SimpleNamespace(start=0.0, end=1.0, text="hi")], mock_info)
+
+        result = t.transcribe_file(dummy_aac, "Alice")
+        assert [s.text for s in result] == ["hi"]
+        assert t._batched.transcribe.call_args.kwargs["batch_size"] == 4
+        t._model.transcribe.assert_not_called()
+
+    def test_transcribe_all_with_mock(
+        self, tmp_path: Path, mocked_transcriber: tuple[Transcriber, MagicMock]
+    ) -> None:
+        from src.audio_source import SpeakerAudio, SpeakerInfo
+
+        t, mock_model = mocked_transcriber
+
+        mock_seg1 = SimpleNamespace(start=0.0, end=1.0, text="Hello")
+        mock_seg2 = SimpleNamespace(start=1.0, end=2.0, text="World")
+        mock_info = SimpleNamespace(language="ja", language_probability=0.9)
 
-        mock_model = MagicMock()
         mock_model.transcribe.return_value = ([mock_seg1, mock_seg2], mock_info)
-        t._model = mock_model
 
         f1 = tmp_path / "1-alice.aac"
-        f1.write_bytes(b"\x00")
+        f1.touch()
         f2 = tmp_path / "2-bob.aac"
-        f2.write_bytes(b"\x00")
+        f2.touch()
 
         tracks = [
             SpeakerAudio(speaker=SpeakerInfo(track=1, username="alice", user_id=1), file_path=f1),
@@ -112,51 +182,73 @@ class TestTranscriberUnit:
         assert len(result) == 4  # 2 segments per track, 2 tracks
         assert mock_model.transcribe.call_count == 2
 
-    def test_auto_language_passes_none(self, tmp_path: Path) -> None:
+    def test_transcribe_all_parallel_keeps_track_order(self, tmp_path: Path) -> None:
+        import threading
+
+        from src.audio_source import SpeakerAudio, SpeakerInfo
+
+        cfg = WhisperConfig(model="tiny", device="cpu", compute_type="float32", max_parallel_tracks=3)
+        t = Transcriber(cfg)
+        barrier = threading.Barrier(3, timeout=5)
+        mock_info = SimpleNamespace(language="ja", language_probability=0.9)
+
+        def _transcribe(path: str, **kwargs):
+            barrier.wait()  # all three tracks must be in flight at once
+            return [SimpleNamespace(start=0.0, end=1.0, text=Path(path).stem)], mock_info
+
+        t._model = MagicMock()
+        t._model.transcribe.side_effect = _transcribe
+
+        tracks = []
+        for i, name in enumerate(["alice", "bob", "carol"], 1):
+            f = tmp_path / f"{i}-{name}.aac"
+            f.touch()
+            tracks.append(SpeakerAudio(
+                speaker=SpeakerInfo(track=i, username=name, user_id=i), file_path=f,
+            ))
+
+        result = t.transcribe_all(tracks)
+        assert [s.speaker for s in result] == ["alice", "bob", "carol"]
+        assert [s.text for s in result] == ["1-alice", "2-bob", "3-carol"]
+
+    def test_auto_language_passes_none(self, dummy_aac: Path) -> None:
         """language='auto' should pass None to Whisper."""
         cfg = WhisperConfig(model="tiny", language="auto", device="cpu",
                             compute_type="float32", beam_size=1, vad_filter=False)
         t = Transcriber(cfg)
-        mock_info = MagicMock(language="ja", language_probability=0.9)
+        mock_info = SimpleNamespace(language="ja", language_probability=0.9)
         mock_model = MagicMock()
         mock_model.transcribe.return_value = ([], mock_info)
         t._model = mock_model
-        f = tmp_path / "test.aac"
-        f.write_bytes(b"\x00")
-        t.transcribe_file(f, "speaker")
+        t.transcribe_file(dummy_aac, "speaker")
         _, kwargs = mock_model.transcribe.call_args
         assert kwargs["language"] is None
 
-    def test_explicit_language_passes_through(self, tmp_path: Path) -> None:
+    def test_explicit_language_passes_through(self, dummy_aac: Path) -> None:
         """Explicit language code should be passed through unchanged."""
         cfg = WhisperConfig(model="tiny", language="en", device="cpu",
                             compute_type="float32", beam_size=1, vad_filter=False)
         t = Transcriber(cfg)
-        mock_info = MagicMock(language="en", language_probability=0.99)
+        mock_info = SimpleNamespace(language="en", language_probability=0.99)
         mock_model = MagicMock()
         mock_model.transcribe.return_value = ([], mock_info)
         t._model = mock_model
-        f = tmp_path / "test.aac"
-        f.write_bytes(b"\x00")
-        t.transcribe_file(f, "speaker")
+        t.transcribe_file(dummy_aac, "speaker")
         _, kwargs = mock_model.transcribe.call_args
         assert kwargs["language"] == "en"
 
-    def test_empty_text_segments_filtered(self, tmp_path: Path) -> None:
-        t = Transcriber(_UNIT_CFG)
+    def test_empty_text_segments_filtered(
+        self, dummy_aac: Path, mocked_transcriber: tuple[Transcriber, MagicMock]
+    ) -> None:
+        t, mock_model = mocked_transcriber
 
-        mock_seg1 = MagicMock(start=0.0, end=1.0, text="  ")  # blank after strip
-        mock_seg2 = MagicMock(start=1.0, end=2.0, text="有効")
-        mock_info = MagicMock(language="ja", language_probability=0.9)
+        mock_seg1 = SimpleNamespace(start=0.0, end=1.0, text="  ")  # blank after strip
+        mock_seg2 = SimpleNamespace(start=1.0, end=2.0, text="有効")
+        mock_info = SimpleNamespace(language="ja", language_probability=0.9)
 
-        mock_model = MagicMock()
         mock_model.transcribe.return_value = ([mock_seg1, mock_seg2], mock_info)
-        t._model = mock_model
 
-        f = tmp_path / "test.aac"
-        f.write_bytes(b"\x00")
-
-        result = t.transcribe_file(f, "speaker")
+        result = t.transcribe_file(dummy_aac, "speaker")
         assert len(result) == 1
         assert result[0].text == "有効"
 
@@ -165,12 +257,16 @@ class TestTranscriberUnit:
 # GPU integration tests (skipped if no CUDA)
 # ---------------------------------------------------------------------------
 
-_has_cuda = False
-try:
-    import ctranslate2
-    _has_cuda = ctranslate2.get_cuda_device_count() > 0
-except Exception:
-    pass
+# Without the sample the GPU tests skip anyway, so don't query the driver
+_gpu_skip_reason: str | None = "Sample AAC not found"
+if SAMPLE_AAC.exists():
+    _gpu_skip_reason = "No CUDA device available"
+    try:
+        import ctranslate2
+        if ctranslate2.get_cuda_device_count() > 0:
+            _gpu_skip_reason = None
+    except Exception:
+        pass
 
 _GPU_CFG = WhisperConfig(
     model="large-v3",
@@ -182,8 +278,7 @@ _GPU_CFG = WhisperConfig(
 )
 
 
-@pytest.mark.skipif(not _has_cuda, reason="No CUDA device available")
-@pytest.mark.skipif(not SAMPLE_AAC.exists(), reason="Sample AAC not found")
+@pytest.mark.skipif(_gpu_skip_reason is not None, reason=_gpu_skip_reason or "")
 class TestTranscriberGPU:
     @pytest.fixture(scope="class")
     def gpu_transcriber(self) -> Transcriber:
@@ -191,24 +286,28 @@ class TestTranscriberGPU:
         t.load_model()
         return t
 
+    @pytest.fixture(scope="class")
+    def sample_segments(self, gpu_transcriber: Transcriber) -> list[Segment]:
+        """One inference pass over the sample, shared by the output checks."""
+        return gpu_transcriber.transcribe_file(SAMPLE_AAC, "shake344")
+
     def test_model_loads_on_gpu(self, gpu_transcriber: Transcriber) -> None:
         assert gpu_transcriber.is_loaded
 
-    def test_transcribe_sample_aac(self, gpu_transcriber: Transcriber) -> None:
-        segments = gpu_transcriber.transcribe_file(SAMPLE_AAC, "shake344")
-        assert len(segments) > 0
+    def test_transcribe_sample_aac(self, sample_segments: list[Segment]) -> None:
+        assert len(sample_segments) > 0
 
         # Check segments have valid structure
-        for seg in segments:
+        for seg in sample_segments:
             assert isinstance(seg, Segment)
             assert seg.start >= 0.0
             assert seg.end > seg.start
             assert len(seg.text) > 0
             assert seg.speaker == "shake344"
 
-    def test_transcribe_produces_japanese(self, gpu_transcriber: Transcriber) -> None:
-        segments = gpu_transcriber.transcribe_file(SAMPLE_AAC, "shake344")
-        all_text = " ".join(s.text for s in segments)
+    def test_transcribe_produces_japanese(self, sample_segments: list[Segment]) -> None:
         # Check for CJK characters (Japanese text expected)
-        has_cjk = any("\u3000" <= ch <= "\u9fff" or "\uff00" <= ch <= "\uffef" for ch in all_text)
-        assert has_cjk, f"Expected Japanese text, got: {all_text[:200]}"
+        has_cjk = any(_CJK_RE.search(s.text) for s in sample_segments)
+        assert has_cjk, (
+            f"Expected Japanese text, got: {' '.join(s.text for s in sample_segments)[:200]}"
+        )